@@ -0,0 +1,90 @@
+"""add uq product platform seller product_id
+
+Revision ID: a1c3e5f7b9d2
+Revises: 64d978a73cf1
+Create Date: 2026-10-18 10:12:41.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c3e5f7b9d2'
+down_revision: Union[str, None] = '64d978a73cf1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 직접입력 컬럼 (중복 제품 병합 시 보존)
+MANUAL_COLUMNS = ('company', 'category', 'product_name', 'tags')
+
+
+def _merge_duplicate_products(bind) -> None:
+    """
+    같은 플랫폼 제품(platform, seller_id, product_id)이 여러 행으로 저장된 경우 한 행으로 병합
+
+    직접입력 값이 가장 많은 행(같으면 최신 행)을 남기고, 다른 행의 NULL이 아닌 직접입력 값을 옮긴 뒤
+    나머지 행을 삭제합니다. 같은 컬럼에 서로 다른 직접입력 값이 있으면 어느 값을 남길지 정할 수 없으므로
+    아무것도 바꾸지 않고 중복 목록과 함께 마이그레이션을 중단합니다.
+    """
+    rows = bind.execute(sa.text("""
+        SELECT id, platform, seller_id, product_id, company, category, product_name, tags
+        FROM product
+        WHERE (platform, seller_id, product_id) IN (
+            SELECT platform, seller_id, product_id
+            FROM product
+            GROUP BY platform, seller_id, product_id
+            HAVING COUNT(*) > 1
+        )
+        ORDER BY platform, seller_id, product_id, id
+    """)).mappings().all()
+
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['platform'], row['seller_id'], row['product_id']), []).append(row)
+
+    conflicts = []
+    merges = []
+    for key, group in groups.items():
+        merged = {}
+        for column in MANUAL_COLUMNS:
+            values = {row[column] for row in group if row[column] is not None}
+            if len(values) > 1:
+                conflicts.append(f"{'/'.join(map(str, key))} (id {[row['id'] for row in group]}, {column}: {sorted(values)})")
+                break
+            merged[column] = values.pop() if values else None
+        else:
+            survivor = max(group, key=lambda row: (sum(row[column] is not None for column in MANUAL_COLUMNS), row['id']))
+            duplicate_ids = [row['id'] for row in group if row['id'] != survivor['id']]
+            merges.append(dict(merged, survivor_id=survivor['id'], duplicate_ids=duplicate_ids))
+
+    if conflicts:
+        raise RuntimeError(
+            "직접입력 값이 서로 다른 중복 제품이 있어 마이그레이션을 중단합니다. "
+            "아래 제품을 한 행으로 정리한 뒤 다시 실행하세요.\n" + "\n".join(conflicts)
+        )
+
+    # 삭제와 갱신을 한 문장으로 실행해 살아남는 행이 삭제될 행과 uq_product 값이 같아져도 충돌하지 않게 함
+    for merge in merges:
+        bind.execute(sa.text("""
+            WITH removed AS (
+                DELETE FROM product WHERE id = ANY(:duplicate_ids)
+            )
+            UPDATE product
+            SET company = :company, category = :category, product_name = :product_name, tags = :tags
+            WHERE id = :survivor_id
+        """), merge)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _merge_duplicate_products(op.get_bind())
+    op.create_unique_constraint('uq_product_platform_seller_product_id', 'product', ['platform', 'seller_id', 'product_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_product_platform_seller_product_id', 'product', type_='unique')
@@ -0,0 +1,39 @@
+"""add tag prediction
+
+Revision ID: b7d2e4f6a8c1
+Revises: a1c3e5f7b9d2
+Create Date: 2026-10-18 14:03:17.220914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4f6a8c1'
+down_revision: Union[str, None] = 'a1c3e5f7b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tag_prediction',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('model_version', sa.TEXT(), nullable=False),
+    sa.Column('predictions', sa.JSON(), nullable=False),
+    sa.Column('confidence_scores', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['product_id'], ['product.id'], name='fk_tag_prediction_product', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_tag_prediction_product_id'), 'tag_prediction', ['product_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_tag_prediction_product_id'), table_name='tag_prediction')
+    op.drop_table('tag_prediction')
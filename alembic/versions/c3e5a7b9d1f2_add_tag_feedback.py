@@ -0,0 +1,42 @@
+"""add tag feedback
+
+Revision ID: c3e5a7b9d1f2
+Revises: b7d2e4f6a8c1
+Create Date: 2026-10-18 15:21:06.384102
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e5a7b9d1f2'
+down_revision: Union[str, None] = 'b7d2e4f6a8c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tag_feedback',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.TEXT(), nullable=True),
+    sa.Column('model_version', sa.TEXT(), nullable=True),
+    sa.Column('original_tags', sa.JSON(), nullable=False),
+    sa.Column('corrected_tags', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['product_id'], ['product.id'], name='fk_tag_feedback_product', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_tag_feedback_created_at'), 'tag_feedback', ['created_at'], unique=False)
+    op.create_index(op.f('ix_tag_feedback_product_id'), 'tag_feedback', ['product_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_tag_feedback_product_id'), table_name='tag_feedback')
+    op.drop_index(op.f('ix_tag_feedback_created_at'), table_name='tag_feedback')
+    op.drop_table('tag_feedback')
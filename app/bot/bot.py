@@ -4,6 +4,8 @@ import sys
 from dotenv import load_dotenv
 from discord.ext import commands
 from app.utils.logger import mainLogger
+from app.utils.looplag import loop_monitor
+from app.database.databasesetup import dispose_engine, dispose_async_engine
 
 # PYTHONPATH 설정
 currunt_dir = os.path.dirname(os.path.abspath(__file__))
@@ -18,7 +20,15 @@ load_dotenv()
 TOKEN = os.getenv('BOT_TOKEN')
 
 # 봇 정의
-bot = commands.Bot(command_prefix=';;', intents=discord.Intents.all())
+class ManagementBot(commands.Bot):
+    async def close(self):
+        # 코그를 모두 내린 뒤 공유 커넥션 풀 닫기
+        await super().close()
+        await dispose_async_engine()
+        dispose_engine()
+        logger.info('데이터베이스 커넥션 풀을 닫았습니다.')
+
+bot = ManagementBot(command_prefix=';;', intents=discord.Intents.all())
 
 # 익스텐션 로드
 @bot.event
@@ -39,6 +49,7 @@ async def setup_hook():
     try:
         await load_extensions()
         await bot.tree.sync()
+        loop_monitor.start()
     except Exception as e:
         logger.error(f'셋업 함수 실행 중 오류 발생: {e}')
 
@@ -48,8 +59,9 @@ async def on_ready():
     logger.info(f'{bot.user} 봇이 준비되었습니다.')
     await bot.change_presence(activity=discord.Activity(type=discord.ActivityType.watching, name='::hebuthinking::'))
 
-# 봇 실행
-bot.run(TOKEN)
+# 봇 실행 (학습 프로세스가 spawn 방식으로 이 모듈을 다시 import해도 봇이 실행되지 않도록 보호)
+if __name__ == '__main__':
+    bot.run(TOKEN)
 
 
 
@@ -1,5 +1,8 @@
 from discord.ext import commands
 from app.utils.logger import mainLogger
+from app.database.databasesetup import get_pool_status
+from app.utils.executor import ml_runner, io_runner
+from app.utils.looplag import loop_monitor
 
 logger = mainLogger()
 
@@ -42,6 +45,30 @@ class AdminCommands(commands.Cog):
         except Exception as e:
             await ctx.send(f'{extension} 익스텐션 리로드 중 오류가 발생했습니다: {e}')
             logger.error(f'{extension} 익스텐션 리로드 중 오류 발생: {e}')
+
+    @commands.command(name='db_status')
+    @commands.is_owner()
+    async def db_status(self, ctx):
+        status = get_pool_status()
+        if not status['initialized']:
+            await ctx.send('데이터베이스 엔진이 아직 생성되지 않았습니다.')
+            return
+
+        await ctx.send(
+            f"커넥션 풀 현황: 크기 {status['size']}, 사용 중 {status['checked_out']}, 대기 {status['checked_in']}, "
+            f"오버플로 {status['overflow']}\n"
+            f"누적: 연결 {status['connects']}회, 체크아웃 {status['checkouts']}회, 무효화 {status['invalidations']}회"
+        )
+
+    @commands.command(name='loop_status')
+    @commands.is_owner()
+    async def loop_status(self, ctx):
+        lag = loop_monitor.stats()
+        await ctx.send(
+            f"이벤트 루프 지연 (최근 {lag['count']}회): 평균 {lag['avg_ms']:.1f}ms, p99 {lag['p99_ms']:.1f}ms, "
+            f"최대 {lag['max_ms']:.1f}ms (시작 이후 최대 {lag['max_total_ms']:.1f}ms)\n"
+            f"작업 대기열: 모델 {ml_runner.pending}/{ml_runner.max_pending}, 수집 {io_runner.pending}/{io_runner.max_pending}"
+        )
             
 async def setup(bot):
     await bot.add_cog(AdminCommands(bot))
\ No newline at end of file
@@ -10,13 +10,16 @@ from typing import Dict, Any, List, Optional
 
 from app.utils.logger import mainLogger
 from app.database.crud.product_crud import ProductCRUD
-from app.ml.tagger import AutoTaggingSystem
+from app.database.crud.async_product_crud import AsyncProductCRUD
+from app.ml.service import TaggerService
+from app.utils.executor import ml_runner
 
 # 로거 정의
 logger = mainLogger()
 
-# CRUD 객체 생성
+# CRUD 객체 생성 (자동 태깅 시스템은 동기 CRUD, 명령어/뷰는 비동기 CRUD 사용)
 crud = ProductCRUD()
+async_crud = AsyncProductCRUD()
 
 
 class TagEditModal(Modal):
@@ -24,11 +27,11 @@ class TagEditModal(Modal):
     태그 수정 모달
     """
     
-    def __init__(self, product_id: int, predictions: Dict[str, str], tagger: AutoTaggingSystem, product_name: str):
+    def __init__(self, product_id: int, predictions: Dict[str, str], tagger_service: TaggerService, product_name: str):
         super().__init__(title=f"태그 수정 - {product_name}"[:44])
         
         self.product_id = product_id
-        self.tagger = tagger
+        self.tagger_service = tagger_service
         
         # 각 필드에 예측 결과를 기본값으로 설정
         self.company_input = TextInput(
@@ -60,6 +63,9 @@ class TagEditModal(Modal):
         """
         모달 제출 이벤트 처리
         """
+        # 피드백 처리가 모델 작업 대기열에서 기다릴 수 있으므로 응답을 먼저 예약
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
         try:
             # 수정된 태그 값 가져오기
             corrected_tags = {
@@ -69,7 +75,7 @@ class TagEditModal(Modal):
             }
             
             # 데이터베이스에 태그 적용
-            update_result = crud.update_product_tags(
+            update_result = await async_crud.update_product_tags(
                 self.product_id,
                 company=corrected_tags["company"],
                 category=corrected_tags["category"],
@@ -77,25 +83,26 @@ class TagEditModal(Modal):
             )
             
             # 피드백 기록
-            feedback_result = self.tagger.process_feedback(
+            feedback_result = await ml_runner.run(
+                self.tagger_service.tagger.process_feedback,
                 self.product_id, 
                 corrected_tags, 
                 user_id=str(interaction.user.id)
             )
             
             if update_result:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     content="✅ 수정된 태그가 성공적으로 적용되었습니다. 피드백을 통해 모델 성능이 향상됩니다.",
                     ephemeral=True
                 )
             else:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     content="❌ 태그 적용 중 오류가 발생했습니다.",
                     ephemeral=True
                 )
         except Exception as e:
             logger.error(f"태그 수정 중 오류 발생: {str(e)}")
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 content=f"❌ 태그 수정 중 오류가 발생했습니다: {str(e)}",
                 ephemeral=True
             )
@@ -108,9 +115,59 @@ class AutoTaggingCommands(commands.Cog):
     
     def __init__(self, bot):
         self.bot = bot
-        self.tagger = AutoTaggingSystem(db_connection=crud)
+        # 모델은 코그 로드 후 백그라운드에서 준비 (봇 시작을 막지 않음)
+        self.tagger_service = TaggerService(db_connection=crud)
+        self._warm_up_task = None
         self.batch_processing = {}  # 배치 처리 상태 추적
     
+    @property
+    def tagger(self):
+        """
+        준비된 자동 태깅 시스템 (준비 전에는 TaggerNotReadyError 발생)
+        """
+        return self.tagger_service.tagger
+    
+    async def cog_load(self):
+        """
+        코그 로드 시 모델 준비 시작 (setup_hook이 모델 로드/초기 학습을 기다리지 않도록 백그라운드 실행)
+        """
+        self._start_warm_up()
+    
+    def _start_warm_up(self):
+        """
+        모델 준비 태스크 시작 (이미 준비되었거나 준비 중이면 무시)
+        """
+        if self.tagger_service.is_ready or (self._warm_up_task and not self._warm_up_task.done()):
+            return
+        self._warm_up_task = asyncio.get_running_loop().create_task(self._warm_up())
+    
+    async def _warm_up(self):
+        """
+        모델 작업 스레드에서 자동 태깅 시스템 준비
+        """
+        try:
+            await ml_runner.run(self.tagger_service.load)
+        except Exception as e:
+            logger.error(f"자동 태깅 시스템 준비 중 오류 발생: {str(e)}")
+    
+    async def _ensure_ready(self, ctx) -> bool:
+        """
+        모델이 준비되었는지 확인하고, 준비 중이면 안내 메시지를 보냄
+        
+        Args:
+            ctx (commands.Context): 명령어 컨텍스트
+        
+        Returns:
+            bool: 준비 여부
+        """
+        if self.tagger_service.is_ready:
+            return True
+        
+        # 이전 준비가 실패했으면 다시 시도
+        self._start_warm_up()
+        await ctx.send("⏳ 자동 태깅 모델을 준비 중입니다. 잠시 후 다시 시도해주세요.")
+        return False
+    
     @commands.command(name="auto_tag")
     async def auto_tag(self, ctx, product_id: int):
         """
@@ -120,12 +177,15 @@ class AutoTaggingCommands(commands.Cog):
             ctx (commands.Context): 명령어 컨텍스트
             product_id (int): 태깅할 제품 ID
         """
+        if not await self._ensure_ready(ctx):
+            return
+        
         try:
             # 처리 메시지 전송
             processing_msg = await ctx.send("🔍 자동 태깅 시스템이 분석 중입니다...")
             
             # 태그 예측
-            result = self.tagger.tag_product(product_id)
+            result = await ml_runner.run(self.tagger.tag_product, product_id)
             
             # 오류 처리
             if "error" in result:
@@ -133,7 +193,7 @@ class AutoTaggingCommands(commands.Cog):
                 return
             
             # 제품 정보 가져오기
-            product = crud.get_product(product_id)
+            product = await async_crud.get_product(product_id)
             if not product:
                 await processing_msg.edit(content=f"오류: 제품 정보를 찾을 수 없습니다.")
                 return
@@ -193,7 +253,7 @@ class AutoTaggingCommands(commands.Cog):
                 async def apply_button(self, interaction: discord.Interaction, button: discord.ui.Button):
                     try:
                         # 데이터베이스에 태그 적용
-                        update_result = crud.update_product_tags(
+                        update_result = await async_crud.update_product_tags(
                             self.product_id,
                             company=self.predictions.get("company", ""),
                             category=self.predictions.get("category", ""),
@@ -224,10 +284,10 @@ class AutoTaggingCommands(commands.Cog):
                 async def edit_button(self, interaction: discord.Interaction, button: discord.ui.Button):
                     try:
                         # 수정 모달 표시
-                        product = crud.get_product(self.product_id)
+                        product = await async_crud.get_product(self.product_id)
                         if not product:
                             raise Exception("제품 정보를 찾을 수 없습니다.")
-                        modal = TagEditModal(self.product_id, self.predictions, self.cog.tagger, product.sale_name)
+                        modal = TagEditModal(self.product_id, self.predictions, self.cog.tagger_service, product.sale_name)
                         await interaction.response.send_modal(modal)
                         
                         # 모달이 제출된 후 버튼 비활성화
@@ -264,6 +324,9 @@ class AutoTaggingCommands(commands.Cog):
             ctx (commands.Context): 명령어 컨텍스트
             limit (int, optional): 처리할 최대 제품 수. 기본값은 100.
         """
+        if not await self._ensure_ready(ctx):
+            return
+        
         # 이미 배치 처리 중인지 확인
         if ctx.guild.id in self.batch_processing and self.batch_processing[ctx.guild.id]:
             await ctx.send("❌ 이미 진행 중인 배치 처리가 있습니다. 완료될 때까지 기다려주세요.")
@@ -283,7 +346,7 @@ class AutoTaggingCommands(commands.Cog):
             
             # 배치 처리 실행
             start_time = time.time()
-            result = self.tagger.batch_tag_products(limit=limit)
+            result = await ml_runner.run(self.tagger.batch_tag_products, limit=limit)
             
             # 오류 처리
             if "error" in result:
@@ -336,6 +399,9 @@ class AutoTaggingCommands(commands.Cog):
         Args:
             ctx (commands.Context): 명령어 컨텍스트
         """
+        if not await self._ensure_ready(ctx):
+            return
+        
         try:
             # 진행 메시지 전송
             progress_msg = await ctx.send("🔄 모델 재학습을 시작합니다. 이 작업은 몇 분 정도 소요될 수 있습니다...")
@@ -356,9 +422,10 @@ class AutoTaggingCommands(commands.Cog):
             message (discord.Message): 진행 메시지
         """
         try:
-            # 모델 재학습 실행
+            # 학습 프로세스에서 모델 재학습 (완료 시 새 모델 번들로 교체, 그동안 기존 모델로 태깅 계속)
             start_time = time.time()
-            self.tagger._retrain_models()
+            training_future = await ml_runner.run(self.tagger.retrain_in_background)
+            version = await asyncio.wrap_future(training_future)
             duration = time.time() - start_time
             
             # 결과 임베드 생성
@@ -369,6 +436,7 @@ class AutoTaggingCommands(commands.Cog):
             )
             
             embed.add_field(name="소요 시간", value=f"{duration:.1f}초", inline=True)
+            embed.add_field(name="모델 버전", value=version, inline=True)
             
             # 처리 메시지 업데이트
             await message.edit(content=None, embed=embed)
@@ -385,6 +453,9 @@ class AutoTaggingCommands(commands.Cog):
         Args:
             ctx (commands.Context): 명령어 컨텍스트
         """
+        if not await self._ensure_ready(ctx):
+            return
+        
         try:
             # 회사명 모델 - 특성 중요도 상위 10개 추출
             company_importance = self.tagger.models['company'].get_feature_importance()
@@ -3,7 +3,9 @@ from discord import app_commands
 from discord.ext import commands
 from app.utils.logger import mainLogger
 from app.scripts.cafe24datamanager import Cafe24DataManager
+from app.scripts.productpipeline import ProductIngestPipeline
 from app.database.crud.product_crud import ProductCRUD
+from app.utils.executor import io_runner
 
 # 로거 정의
 logger = mainLogger()
@@ -28,20 +30,36 @@ class Cafe24Commands(commands.Cog):
         app_commands.Choice(name='샤슈컴퍼니', value='SIASIUCP'),
         app_commands.Choice(name='리치컴퍼니', value='RICHCP')
     ])
-    async def fetch_cafe24_products(self, ctx, seller_id: str):
+    async def fetch_cafe24_products(self, ctx, seller_id: str, mode: str = 'delta'):
+        """
+        카페24 제품을 동기화합니다.
 
-        all_products = cafe24.get_all_products(seller_id)  
-        filtered_products = cafe24.filter_duplicated_products(all_products, seller_id)
-        sorted_products = cafe24.sort_products_data(filtered_products, seller_id)
+        Args:
+            ctx (commands.Context): 명령어 컨텍스트
+            seller_id (str): 카페24 스토어명
+            mode (str, optional): 'delta'(마지막 동기화 이후 변경분), 'full'(전체) 또는
+                'backfill'(최초 등록용 전체 COPY 적재). 기본값은 'delta'.
+        """
+        try:
+            def sync():
+                pages, synced_at = cafe24.iter_sync_pages(seller_id, full=(mode in ('full', 'backfill')))
 
-        try: 
-            if not sorted_products:
-                await ctx.send(f'새로 추가된 제품이 없습니다.')
+                pipeline = ProductIngestPipeline(
+                    seller_id,
+                    normalize=cafe24.sort_products_data
+                )
+                stats = pipeline.backfill(pages) if mode == 'backfill' else pipeline.run(pages)
+                return stats, synced_at
+
+            # API 호출과 DB 저장은 블로킹 작업이므로 이벤트 루프 밖에서 실행
+            stats, synced_at = await io_runner.run(sync)
+
+            if not stats['inserted'] and not stats['updated']:
+                await ctx.send(f'새로 추가되거나 변경된 제품이 없습니다.')
             else:
-                await ctx.send(f'새로 추가된 제품이 있습니다.')
+                await ctx.send(f"새로 추가된 제품 {stats['inserted']}개, 변경된 제품 {stats['updated']}개를 저장했습니다.")
 
-            for product in sorted_products:
-                crud.create_product(product)
+            cafe24.save_sync_watermark(seller_id, synced_at)
 
         except Exception as e:
             logger.error(f'카페24 제품 조회 중 오류 발생: {e}')
@@ -3,6 +3,8 @@ from discord import app_commands
 from discord.ext import commands
 from app.utils.logger import mainLogger
 from app.scripts.naverdatamanager import NaverDataManager
+from app.scripts.productpipeline import ProductIngestPipeline
+from app.utils.executor import io_runner
 from app.database.crud.product_crud import ProductCRUD
 
 logger = mainLogger()
@@ -18,6 +20,33 @@ class NaverCommerceCommands(commands.Cog):
         self.bot = bot
 
     # get_all_products_list -> insert into db 
+    @commands.command(name='fetch_naver_products')
+    async def fetch_naver_products(self, ctx, config_prefix: str, mode: str = 'sync'):
+        """
+        네이버커머스 제품을 페이지 단위로 가져와 데이터베이스에 저장합니다.
+
+        Args:
+            ctx (commands.Context): 명령어 컨텍스트
+            config_prefix (str): 판매자 ID
+            mode (str, optional): 'sync'(페이지별 upsert) 또는 'backfill'(최초 등록용 전체 COPY 적재). 기본값은 'sync'.
+        """
+        try:
+            pipeline = ProductIngestPipeline(
+                config_prefix,
+                normalize=naver.sort_product_data
+            )
+            pages = naver.iter_products_list_pages(config_prefix)
+            # API 호출과 DB 저장은 블로킹 작업이므로 이벤트 루프 밖에서 실행
+            stats = await io_runner.run(pipeline.backfill if mode == 'backfill' else pipeline.run, pages)
+
+            if not stats['inserted'] and not stats['updated']:
+                await ctx.send(f'새로 추가되거나 변경된 제품이 없습니다.')
+            else:
+                await ctx.send(f"새로 추가된 제품 {stats['inserted']}개, 변경된 제품 {stats['updated']}개를 저장했습니다.")
+
+        except Exception as e:
+            logger.error(f'네이버 커머스 제품 조회 중 오류 발생: {e}')
+            await ctx.send(f'네이버 커머스 제품 조회 중 오류 발생: {e}')
 
 async def setup(bot):
     await bot.add_cog(NaverCommerceCommands(bot))
@@ -1,7 +1,7 @@
 from discord.ext import commands
 import discord
 from app.utils.logger import mainLogger
-from app.database.crud.product_crud import ProductCRUD
+from app.database.crud.async_product_crud import AsyncProductCRUD
 from app.bot.views.product_views import ProductTaggingView
 from app.bot.views.product_list_view import ProductListView
 
@@ -9,7 +9,7 @@ from app.bot.views.product_list_view import ProductListView
 logger = mainLogger()
 
 # CRUD 객체 생성
-crud = ProductCRUD()
+crud = AsyncProductCRUD()
 
 class ProductCommands(commands.Cog):
     """
@@ -31,7 +31,7 @@ class ProductCommands(commands.Cog):
         """
         try:
             # 태그 미입력 제품 조회
-            products = crud.get_unfulfilled_products(seller_id)
+            products = await crud.get_unfulfilled_products(seller_id)
             
             if not products:
                 await ctx.send("미완성 제품이 없습니다.")
@@ -68,7 +68,7 @@ class ProductCommands(commands.Cog):
         """
         try:
             # 다음 미완성 제품 조회
-            product = crud.get_next_unfulfilled_product(seller_id)
+            product = await crud.get_next_unfulfilled_product(seller_id)
             
             if not product:
                 await ctx.send("처리할 미완성 제품이 없습니다. 모든 제품에 태그가 입력되었습니다! 🎉")
@@ -78,7 +78,7 @@ class ProductCommands(commands.Cog):
             embed = discord.Embed(
                 title="제품 태그 추가", 
                 color=discord.Color.green(),
-                description=f"아래 제품의 태그와 정보를 입력합니다. (남은 미완성 제품: {len(crud.get_unfulfilled_products(seller_id))}개)"
+                description=f"아래 제품의 태그와 정보를 입력합니다. (남은 미완성 제품: {await crud.count_unfulfilled_products(seller_id)}개)"
             )
             
             embed.add_field(name="제품명", value=product.sale_name, inline=False)
@@ -144,7 +144,7 @@ class ProductCommands(commands.Cog):
             await ctx.send("한 번에 최대 20개까지만 처리할 수 있습니다.")
             count = 20
             
-        products = crud.get_unfulfilled_products(seller_id)[:count]
+        products = await crud.get_unfulfilled_products(seller_id, limit=count)
         
         if not products:
             await ctx.send("처리할 미완성 제품이 없습니다.")
@@ -177,7 +177,7 @@ class ProductCommands(commands.Cog):
         """
         try:
             # 제품 정보 조회
-            product = crud.get_product(product_id)
+            product = await crud.get_product(product_id)
             
             if not product:
                 await ctx.send(f"ID {product_id}에 해당하는 제품을 찾을 수 없습니다.")
@@ -227,7 +227,7 @@ class ProductCommands(commands.Cog):
         """
         try:
             # 제품 검색
-            products = crud.search_products(search_term)
+            products = await crud.search_products(search_term)
             
             if not products:
                 await ctx.send(f"'{search_term}'에 대한 검색 결과가 없습니다.")
@@ -273,7 +273,7 @@ class ProductCommands(commands.Cog):
         """
         try:
             # 제품 정보 조회
-            product = crud.get_product(product_id)
+            product = await crud.get_product(product_id)
             
             if not product:
                 await ctx.send(f"ID {product_id}에 해당하는 제품을 찾을 수 없습니다.")
@@ -330,7 +330,7 @@ class ProductCommands(commands.Cog):
         """
         try:
             # 카테고리별 통계 조회
-            stats = crud.get_category_stats(seller_id)
+            stats = await crud.get_category_stats(seller_id)
             
             if not stats:
                 await ctx.send("제품 통계 정보가 없습니다.")
@@ -351,7 +351,7 @@ class ProductCommands(commands.Cog):
                 total_count += count
             
             # 미완성 제품 수
-            unfulfilled_count = len(crud.get_unfulfilled_products(seller_id))
+            unfulfilled_count = await crud.count_unfulfilled_products(seller_id)
             embed.add_field(name="미완성 제품", value=f"{unfulfilled_count}개", inline=True)
             
             # 총 제품 수
@@ -380,7 +380,7 @@ class ProductCommands(commands.Cog):
                 await ctx.send("최대 25개까지만 표시 가능합니다.")
             
             # 최근 추가된 제품 조회
-            products = crud.get_recent_products(limit)
+            products = await crud.get_recent_products(limit)
             
             if not products:
                 await ctx.send("제품 정보가 없습니다.")
@@ -1,7 +1,7 @@
 import discord
 from discord.ui import Select, View, Button, Modal, TextInput
 from app.utils.logger import mainLogger
-from app.database.crud.product_crud import ProductCRUD
+from app.database.crud.async_product_crud import AsyncProductCRUD
 import datetime
 
 from app.bot.views.product_modals import (
@@ -15,7 +15,7 @@ from app.bot.views.product_modals import (
 logger = mainLogger()
 
 # CRUD 객체 생성
-crud = ProductCRUD()
+crud = AsyncProductCRUD()
 
 class ProductTaggingView(View):
     """
@@ -496,7 +496,7 @@ class FinalSaveView(View):
             return
         
         # 제품 정보 업데이트
-        result = crud.update_product_tags(
+        result = await crud.update_product_tags(
             product_id=self.product.id,
             category=self.product.category,
             tags=self.product.tags,
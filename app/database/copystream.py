@@ -0,0 +1,84 @@
+import io
+import json
+
+
+class CopyStream(io.TextIOBase):
+    """
+    행 제너레이터를 PostgreSQL COPY FROM STDIN (FORMAT csv)용 파일 객체로 감싸는 클래스입니다.
+
+    COPY가 read()를 호출할 때마다 필요한 만큼만 행을 CSV로 변환하므로
+    전체 데이터를 메모리에 올리지 않고 스트리밍할 수 있습니다.
+    None은 따옴표 없는 빈 값(NULL)으로, 문자열은 항상 따옴표로 감싸서 빈 문자열과 구분합니다.
+    dict/list 값은 JSON 문자열로 변환합니다.
+    """
+
+    def __init__(self, rows, columns):
+        """
+        Args:
+            rows (iterable): dict 형태의 행 목록 또는 제너레이터
+            columns (list): COPY 대상 컬럼 순서
+        """
+        self.rows = iter(rows)
+        self.columns = columns
+        self.row_count = 0
+
+        self._pending = ''
+
+    def readable(self):
+        return True
+
+    def _encode(self, value) -> str:
+        """
+        값 하나를 CSV 필드로 변환합니다.
+        """
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            return 't' if value else 'f'
+        if isinstance(value, (int, float)):
+            return str(value)
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value, ensure_ascii=False)
+
+        return '"' + str(value).replace('"', '""') + '"'
+
+    def _next_line(self) -> str:
+        """
+        다음 행을 CSV 한 줄로 변환합니다. 행이 없으면 빈 문자열을 반환합니다.
+        """
+        row = next(self.rows, None)
+        if row is None:
+            return ''
+
+        self.row_count += 1
+        return ','.join(self._encode(row.get(column)) for column in self.columns) + '\n'
+
+    def read(self, size=-1) -> str:
+        chunks = [self._pending]
+        length = len(self._pending)
+
+        while size < 0 or length < size:
+            line = self._next_line()
+            if not line:
+                break
+            chunks.append(line)
+            length += len(line)
+
+        data = ''.join(chunks)
+        if size < 0:
+            self._pending = ''
+            return data
+
+        self._pending = data[size:]
+        return data[:size]
+
+    def readline(self, size=-1) -> str:
+        if not self._pending:
+            self._pending = self._next_line()
+
+        end = self._pending.find('\n') + 1 or len(self._pending)
+        if 0 <= size < end:
+            end = size
+
+        line, self._pending = self._pending[:end], self._pending[end:]
+        return line
@@ -0,0 +1,505 @@
+from sqlalchemy import select, and_, or_, func, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from app.database.databasesetup import AsyncDatabaseSetup
+from app.database.models import Product, TagFeedback
+from app.utils.logger import mainLogger
+import datetime
+
+# 로거 정의
+logger = mainLogger()
+
+# 미완성 제품 조건 (태그, 카테고리, 관리제품명, 제조사 중 하나라도 비어 있음)
+UNFULFILLED_CONDITION = or_(
+    Product.tags == None,
+    Product.category == None,
+    Product.product_name == None,
+    Product.company == None
+)
+
+
+def _product_to_dict(product):
+    """
+    제품 모델 객체를 딕셔너리로 변환합니다.
+    """
+    return {
+        'id': product.id,
+        'sale_name': product.sale_name,
+        'platform': product.platform,
+        'seller_id': product.seller_id,
+        'category': product.category,
+        'tags': product.tags,
+        'company': product.company,
+        'product_name': product.product_name,
+        'data': product.data,
+        'created_at': product.created_at,
+        'updated_at': product.updated_at
+    }
+
+
+class AsyncProductCRUD:
+    """
+    제품 데이터 CRUD 작업을 비동기로 처리하는 클래스입니다.
+    디스코드 봇의 명령어/뷰에서 이벤트 루프를 막지 않도록 ProductCRUD와 같은 메소드를 코루틴으로 제공합니다.
+    세션은 커밋 후에도 객체를 만료하지 않으므로 반환된 제품 객체의 속성은 세션 종료 후에도 읽을 수 있습니다.
+    """
+
+    def __init__(self):
+        self.db = AsyncDatabaseSetup()
+
+    async def create_product(self, product_data):
+        """
+        새 제품을 데이터베이스에 추가합니다.
+
+        Args:
+            product_data (dict): 제품 데이터 객체
+
+        Returns:
+            Product: 생성된 제품 모델 객체
+        """
+        async with self.db.get_session() as session:
+            try:
+                current_time = datetime.datetime.utcnow()
+                product_data.setdefault('created_at', current_time)
+                product_data.setdefault('updated_at', current_time)
+
+                new_product = Product(**product_data)
+                session.add(new_product)
+                await session.commit()
+
+                logger.info(f"새 제품 등록: {new_product.sale_name}")
+                return new_product
+
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"제품 생성 중 오류 발생: {e}")
+                raise e
+
+    async def bulk_upsert_products(self, products, batch_size=1000, update_existing=True):
+        """
+        여러 제품을 INSERT ... ON CONFLICT 구문으로 일괄 저장합니다.
+
+        Args:
+            products (list): platform, seller_id, product_id, sale_name, data를 포함한 제품 데이터 목록
+            batch_size (int, optional): 한 번에 실행할 제품 수. 기본값은 1000.
+            update_existing (bool, optional): 이미 저장된 제품을 갱신할지 여부. 기본값은 True.
+
+        Returns:
+            dict: 신규 저장 수(inserted)와 갱신 수(updated)
+        """
+        result = {'inserted': 0, 'updated': 0}
+
+        if not products:
+            return result
+
+        current_time = datetime.datetime.utcnow()
+
+        # 한 구문 안에 같은 키가 두 번 나오면 ON CONFLICT DO UPDATE가 실패하므로 마지막 값만 남김
+        rows = {}
+        for product_data in products:
+            row = dict(product_data)
+            row.setdefault('created_at', current_time)
+            row.setdefault('updated_at', current_time)
+            rows[(row['platform'], row['seller_id'], row['product_id'])] = row
+        rows = list(rows.values())
+
+        stmt = insert(Product)
+        if update_existing:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Product.platform, Product.seller_id, Product.product_id],
+                set_={
+                    'sale_name': stmt.excluded.sale_name,
+                    'data': stmt.excluded.data,
+                    'updated_at': stmt.excluded.updated_at
+                }
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=[Product.platform, Product.seller_id, Product.product_id]
+            )
+        stmt = stmt.returning(literal_column('(xmax = 0)').label('inserted'))
+
+        async with self.db.get_session() as session:
+            try:
+                for start in range(0, len(rows), batch_size):
+                    for (inserted,) in await session.execute(stmt, rows[start:start + batch_size]):
+                        result['inserted' if inserted else 'updated'] += 1
+
+                await session.commit()
+
+                logger.info(f"제품 일괄 저장: 신규 {result['inserted']}개, 갱신 {result['updated']}개")
+                return result
+
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"제품 일괄 저장 중 오류 발생: {e}")
+                raise e
+
+    async def get_existing_product_ids(self, platform, seller_id, product_ids):
+        """
+        주어진 플랫폼 제품 ID 중 이미 저장된 ID를 반환합니다.
+
+        Args:
+            platform (str): 플랫폼명
+            seller_id (str): 판매자 ID
+            product_ids (list): 확인할 플랫폼 제품 ID 목록
+
+        Returns:
+            set: 데이터베이스에 이미 존재하는 제품 ID
+        """
+        if not product_ids:
+            return set()
+
+        async with self.db.get_session() as session:
+            try:
+                result = await session.scalars(
+                    select(Product.product_id).where(
+                        Product.platform == platform,
+                        Product.seller_id == seller_id,
+                        Product.product_id.in_(product_ids)
+                    )
+                )
+                return set(result)
+
+            except SQLAlchemyError as e:
+                logger.error(f"기존 제품 ID 조회 중 오류 발생: {e}")
+                raise e
+
+    async def get_product(self, product_id):
+        """
+        제품 ID로 제품을 조회합니다.
+
+        Args:
+            product_id (int): 조회할 제품 ID
+
+        Returns:
+            Product: 조회된 제품 모델 객체
+        """
+        async with self.db.get_session() as session:
+            try:
+                return await session.get(Product, product_id)
+            except SQLAlchemyError as e:
+                logger.error(f"제품 조회 중 오류 발생: {e}")
+                return None
+
+    async def update_product_tags(self, product_id, company=None, category=None, tags=None, product_name=None):
+        """
+        제품의 태그, 카테고리, 제조사, 제품명 정보를 업데이트합니다.
+
+        Args:
+            product_id (int): 업데이트할 제품 ID
+            company (str, optional): 제조사 이름
+            category (str, optional): 제품 카테고리
+            tags (str, optional): 제품 태그 정보
+            product_name (str, optional): 관리제품명
+
+        Returns:
+            bool: 업데이트 성공 여부
+        """
+        async with self.db.get_session() as session:
+            try:
+                product = await session.get(Product, product_id)
+
+                if not product:
+                    logger.warning(f"제품 ID {product_id} 찾을 수 없음")
+                    return False
+
+                # 데이터 업데이트 (None이 아닌 값만)
+                if company is not None:
+                    product.company = company
+                if category is not None:
+                    product.category = category
+                if tags is not None:
+                    product.tags = tags
+                if product_name is not None:
+                    product.product_name = product_name
+
+                product.updated_at = datetime.datetime.utcnow()
+
+                await session.commit()
+                logger.info(f"제품 ID {product_id} 태그 업데이트됨")
+                return True
+
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"제품 태그 업데이트 중 오류 발생: {e}")
+                return False
+
+    async def get_tagged_products(self, limit=200):
+        """
+        태그가 완전히 입력된 제품 목록을 반환합니다.
+
+        Args:
+            limit (int, optional): 반환할 최대 제품 수. 기본값은 200.
+
+        Returns:
+            list: 태깅된 제품 목록
+        """
+        async with self.db.get_session() as session:
+            try:
+                result = await session.scalars(
+                    select(Product).where(
+                        and_(
+                            Product.tags != None,
+                            Product.category != None,
+                            Product.product_name != None,
+                            Product.company != None,
+                            Product.tags != '',
+                            Product.category != '',
+                            Product.product_name != '',
+                            Product.company != ''
+                        )
+                    ).order_by(Product.updated_at.desc()).limit(limit)
+                )
+                return [_product_to_dict(product) for product in result]
+
+            except SQLAlchemyError as e:
+                logger.error(f"태깅된 제품 조회 중 오류 발생: {e}")
+                return []
+
+    async def get_untagged_products(self, seller_id=None, limit=100):
+        """
+        태그가 미입력된 제품 목록을 딕셔너리로 반환합니다.
+
+        Args:
+            seller_id (str, optional): 판매자 ID로 필터링. 기본값은 None (모든 판매자).
+            limit (int, optional): 반환할 최대 제품 수. 기본값은 100.
+
+        Returns:
+            list: 미완성 제품 목록
+        """
+        products = await self.get_unfulfilled_products(seller_id, limit=limit)
+        return [_product_to_dict(product) for product in products]
+
+    async def get_unfulfilled_products(self, seller_id=None, limit=None):
+        """
+        태그가 미입력된 제품 목록을 제품 모델 객체로 반환합니다.
+
+        Args:
+            seller_id (str, optional): 판매자 ID로 필터링. 기본값은 None (모든 판매자).
+            limit (int, optional): 반환할 최대 제품 수. 기본값은 None (전체).
+
+        Returns:
+            list: 미완성 제품 모델 객체 목록 (최근 추가된 순)
+        """
+        async with self.db.get_session() as session:
+            try:
+                query = select(Product).where(UNFULFILLED_CONDITION)
+
+                if seller_id:
+                    query = query.where(Product.seller_id == seller_id)
+
+                query = query.order_by(Product.created_at.desc())
+                if limit:
+                    query = query.limit(limit)
+
+                result = await session.scalars(query)
+                return list(result)
+
+            except SQLAlchemyError as e:
+                logger.error(f"미완성 제품 조회 중 오류 발생: {e}")
+                return []
+
+    async def count_unfulfilled_products(self, seller_id=None):
+        """
+        태그가 미입력된 제품 수를 반환합니다.
+
+        Args:
+            seller_id (str, optional): 판매자 ID로 필터링. 기본값은 None (모든 판매자).
+
+        Returns:
+            int: 미완성 제품 수
+        """
+        async with self.db.get_session() as session:
+            try:
+                query = select(func.count(Product.id)).where(UNFULFILLED_CONDITION)
+
+                if seller_id:
+                    query = query.where(Product.seller_id == seller_id)
+
+                return await session.scalar(query)
+
+            except SQLAlchemyError as e:
+                logger.error(f"미완성 제품 수 조회 중 오류 발생: {e}")
+                return 0
+
+    async def get_next_unfulfilled_product(self, seller_id=None):
+        """
+        태그가 미입력된 다음 제품을 반환합니다.
+
+        Args:
+            seller_id (str, optional): 판매자 ID로 필터링. 기본값은 None (모든 판매자).
+
+        Returns:
+            Product: 다음 미완성 제품
+        """
+        products = await self.get_unfulfilled_products(seller_id, limit=1)
+        return products[0] if products else None
+
+    async def search_products(self, search_term):
+        """
+        제품을 검색합니다.
+
+        Args:
+            search_term (str): 검색어
+
+        Returns:
+            list: 검색된 제품 목록
+        """
+        async with self.db.get_session() as session:
+            try:
+                search_pattern = f"%{search_term}%"
+                result = await session.scalars(
+                    select(Product).where(
+                        or_(
+                            Product.sale_name.ilike(search_pattern),
+                            Product.product_name.ilike(search_pattern),
+                            Product.company.ilike(search_pattern),
+                            Product.tags.ilike(search_pattern),
+                            Product.category.ilike(search_pattern)
+                        )
+                    ).order_by(Product.updated_at.desc())
+                )
+                return list(result)
+
+            except SQLAlchemyError as e:
+                logger.error(f"제품 검색 중 오류 발생: {e}")
+                return []
+
+    async def get_category_stats(self, seller_id=None):
+        """
+        카테고리별 제품 통계를 반환합니다.
+
+        Args:
+            seller_id (str, optional): 판매자 ID로 필터링. 기본값은 None (모든 판매자).
+
+        Returns:
+            dict: 카테고리별 제품 수
+        """
+        async with self.db.get_session() as session:
+            try:
+                category = func.coalesce(Product.category, "미분류").label("category")
+                query = select(category, func.count(Product.id).label("count"))
+
+                if seller_id:
+                    query = query.where(Product.seller_id == seller_id)
+
+                result = await session.execute(query.group_by(category))
+                return {category: count for category, count in result}
+
+            except SQLAlchemyError as e:
+                logger.error(f"카테고리별 통계 조회 중 오류 발생: {e}")
+                return {}
+
+    async def get_recent_products(self, limit=10):
+        """
+        최근 추가된 제품을 반환합니다.
+
+        Args:
+            limit (int, optional): 반환할 최대 제품 수. 기본값은 10.
+
+        Returns:
+            list: 최근 추가된 제품 목록
+        """
+        async with self.db.get_session() as session:
+            try:
+                result = await session.scalars(
+                    select(Product).order_by(Product.created_at.desc()).limit(limit)
+                )
+                return list(result)
+
+            except SQLAlchemyError as e:
+                logger.error(f"최근 제품 조회 중 오류 발생: {e}")
+                return []
+
+    async def save_feedback(self, feedback_data):
+        """
+        사용자 피드백을 저장합니다.
+
+        Args:
+            feedback_data (dict): 저장할 피드백 데이터
+                (product_id, original_tags, corrected_tags, user_id, model_version, timestamp)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        async with self.db.get_session() as session:
+            try:
+                session.add(TagFeedback(
+                    product_id=feedback_data['product_id'],
+                    user_id=feedback_data.get('user_id'),
+                    model_version=feedback_data.get('model_version'),
+                    original_tags=feedback_data.get('original_tags') or {},
+                    corrected_tags=feedback_data.get('corrected_tags') or {},
+                    created_at=feedback_data.get('timestamp') or datetime.datetime.utcnow()
+                ))
+                await session.commit()
+                logger.info(f"피드백 저장: 제품 ID {feedback_data.get('product_id')}, 사용자 ID {feedback_data.get('user_id')}")
+                return True
+
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.error(f"피드백 저장 중 오류 발생: {e}")
+                return False
+
+    async def get_feedback(self, since=None, limit=None):
+        """
+        저장된 피드백을 조회합니다.
+
+        Args:
+            since (datetime, optional): 이 시간 이후에 저장된 피드백만 조회
+            limit (int, optional): 반환할 최대 피드백 수
+
+        Returns:
+            list: 피드백 데이터 목록 (저장된 순서)
+        """
+        async with self.db.get_session() as session:
+            try:
+                query = select(TagFeedback)
+
+                if since:
+                    query = query.where(TagFeedback.created_at > since)
+
+                query = query.order_by(TagFeedback.created_at, TagFeedback.id)
+                if limit:
+                    query = query.limit(limit)
+
+                result = await session.scalars(query)
+                return [
+                    {
+                        'product_id': feedback.product_id,
+                        'original_tags': feedback.original_tags,
+                        'corrected_tags': feedback.corrected_tags,
+                        'user_id': feedback.user_id,
+                        'model_version': feedback.model_version,
+                        'timestamp': feedback.created_at
+                    }
+                    for feedback in result
+                ]
+
+            except SQLAlchemyError as e:
+                logger.error(f"피드백 조회 중 오류 발생: {e}")
+                return []
+
+    async def count_feedback(self, since=None):
+        """
+        저장된 피드백 수를 반환합니다.
+
+        Args:
+            since (datetime, optional): 이 시간 이후에 저장된 피드백만 집계
+
+        Returns:
+            int: 피드백 수
+        """
+        async with self.db.get_session() as session:
+            try:
+                query = select(func.count(TagFeedback.id))
+
+                if since:
+                    query = query.where(TagFeedback.created_at > since)
+
+                return await session.scalar(query) or 0
+
+            except SQLAlchemyError as e:
+                logger.error(f"피드백 수 조회 중 오류 발생: {e}")
+                return 0
@@ -1,13 +1,21 @@
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, func, literal_column
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
+from app.database.copystream import CopyStream
 from app.database.databasesetup import DatabaseSetup
-from app.database.models import Product
+from app.database.models import Product, TagPrediction, TagFeedback
 from app.utils.logger import mainLogger
 import datetime
 
 # 로거 정의
 logger = mainLogger()
 
+# COPY 백필 대상 컬럼 (sort_products_data 결과 키와 동일)
+BACKFILL_COLUMNS = [
+    'platform', 'seller_id', 'product_id', 'category', 'company',
+    'sale_name', 'product_name', 'tags', 'data', 'created_at', 'updated_at'
+]
+
 class ProductCRUD:
     """
     제품 데이터 CRUD 작업을 처리하는 클래스입니다.
@@ -54,6 +62,179 @@ class ProductCRUD:
         finally:
             session.close()
     
+    def bulk_upsert_products(self, products, batch_size=1000, update_existing=True):
+        """
+        여러 제품을 INSERT ... ON CONFLICT 구문으로 일괄 저장합니다.
+        (platform, seller_id, product_id)가 같은 제품이 이미 있으면 플랫폼 원본 데이터(sale_name, data)만 갱신하고,
+        태그, 카테고리 등 직접 입력한 정보는 유지합니다.
+
+        Args:
+            products (list): platform, seller_id, product_id, sale_name, data를 포함한 제품 데이터 목록
+            batch_size (int, optional): 한 번의 INSERT 구문에 담을 제품 수. 기본값은 1000.
+            update_existing (bool, optional): 이미 저장된 제품을 갱신할지 여부. 기본값은 True.
+
+        Returns:
+            dict: 신규 저장 수(inserted)와 갱신 수(updated)
+        """
+        result = {'inserted': 0, 'updated': 0}
+
+        if not products:
+            return result
+
+        current_time = datetime.datetime.utcnow()
+
+        # 한 구문 안에 같은 키가 두 번 나오면 ON CONFLICT DO UPDATE가 실패하므로 마지막 값만 남김
+        rows = {}
+        for product_data in products:
+            row = dict(product_data)
+            row.setdefault('created_at', current_time)
+            row.setdefault('updated_at', current_time)
+            rows[(row['platform'], row['seller_id'], row['product_id'])] = row
+        rows = list(rows.values())
+
+        session = self.db.get_session()
+        try:
+            stmt = insert(Product)
+
+            if update_existing:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Product.platform, Product.seller_id, Product.product_id],
+                    set_={
+                        'sale_name': stmt.excluded.sale_name,
+                        'data': stmt.excluded.data,
+                        'updated_at': stmt.excluded.updated_at
+                    }
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(
+                    index_elements=[Product.platform, Product.seller_id, Product.product_id]
+                )
+
+            # xmax가 0이면 새로 추가된 행, 아니면 기존 행을 갱신한 것
+            stmt = stmt.returning(literal_column('(xmax = 0)').label('inserted'))
+
+            for start in range(0, len(rows), batch_size):
+                for (inserted,) in session.execute(stmt, rows[start:start + batch_size]):
+                    result['inserted' if inserted else 'updated'] += 1
+
+            session.commit()
+
+            logger.info(f"제품 일괄 저장: 신규 {result['inserted']}개, 갱신 {result['updated']}개")
+            return result
+
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"제품 일괄 저장 중 오류 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def backfill_products(self, products, update_existing=True):
+        """
+        대량의 제품을 COPY FROM STDIN으로 임시 테이블에 적재한 뒤 한 번의 INSERT ... SELECT로 병합합니다.
+        판매자 최초 등록처럼 수만 개의 제품을 한 번에 저장할 때 사용합니다.
+        products는 제너레이터여도 되며, COPY가 읽는 만큼만 행을 만들어 전달합니다.
+
+        Args:
+            products (iterable): sort_products_data 형태의 제품 데이터
+            update_existing (bool, optional): 이미 저장된 제품을 갱신할지 여부. 기본값은 True.
+
+        Returns:
+            dict: 적재 행 수(copied), 신규 저장 수(inserted), 갱신 수(updated)
+        """
+        current_time = datetime.datetime.utcnow()
+
+        def rows():
+            for seq, product_data in enumerate(products):
+                row = dict(product_data)
+                row['seq'] = seq
+                row.setdefault('created_at', current_time)
+                row.setdefault('updated_at', current_time)
+                yield row
+
+        stream = CopyStream(rows(), ['seq'] + BACKFILL_COLUMNS)
+        columns = ', '.join(BACKFILL_COLUMNS)
+
+        if update_existing:
+            conflict_action = (
+                "DO UPDATE SET sale_name = EXCLUDED.sale_name, data = EXCLUDED.data, updated_at = EXCLUDED.updated_at"
+            )
+        else:
+            conflict_action = "DO NOTHING"
+
+        connection = self.db.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+
+            cursor.execute(f"""
+                CREATE TEMP TABLE product_staging (
+                    seq BIGINT NOT NULL,
+                    platform TEXT, seller_id TEXT, product_id BIGINT, category TEXT, company TEXT,
+                    sale_name TEXT, product_name TEXT, tags TEXT, data JSON,
+                    created_at TIMESTAMPTZ, updated_at TIMESTAMPTZ
+                ) ON COMMIT DROP
+            """)
+            cursor.copy_expert(f"COPY product_staging (seq, {columns}) FROM STDIN WITH (FORMAT csv)", stream)
+
+            # 같은 제품이 여러 번 들어온 경우 마지막 행만 병합
+            cursor.execute(f"""
+                WITH merged AS (
+                    INSERT INTO product ({columns})
+                    SELECT DISTINCT ON (platform, seller_id, product_id) {columns}
+                    FROM product_staging
+                    ORDER BY platform, seller_id, product_id, seq DESC
+                    ON CONFLICT (platform, seller_id, product_id) {conflict_action}
+                    RETURNING (xmax = 0) AS inserted
+                )
+                SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM merged
+            """)
+            inserted, updated = cursor.fetchone()
+
+            connection.commit()
+
+            result = {'copied': stream.row_count, 'inserted': inserted, 'updated': updated}
+            logger.info(f"제품 백필 완료: 적재 {result['copied']}개, 신규 {inserted}개, 갱신 {updated}개")
+            return result
+
+        except Exception as e:
+            # raw 커넥션은 psycopg2 예외를 그대로 전달함
+            connection.rollback()
+            logger.error(f"제품 백필 중 오류 발생: {e}")
+            raise e
+        finally:
+            connection.close()
+
+    def get_existing_product_ids(self, platform, seller_id, product_ids):
+        """
+        주어진 플랫폼 제품 ID 중 이미 저장된 ID를 반환합니다.
+
+        Args:
+            platform (str): 플랫폼명
+            seller_id (str): 판매자 ID
+            product_ids (list): 확인할 플랫폼 제품 ID 목록
+
+        Returns:
+            set: 데이터베이스에 이미 존재하는 제품 ID
+        """
+        if not product_ids:
+            return set()
+
+        session = self.db.get_session()
+        try:
+            rows = session.query(Product.product_id).filter(
+                Product.platform == platform,
+                Product.seller_id == seller_id,
+                Product.product_id.in_(product_ids)
+            ).all()
+
+            return {pid for (pid,) in rows}
+
+        except SQLAlchemyError as e:
+            logger.error(f"기존 제품 ID 조회 중 오류 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
     def get_product(self, product_id):
         """
         제품 ID로 제품을 조회합니다.
@@ -74,6 +255,40 @@ class ProductCRUD:
         finally:
             session.close()
     
+    def get_products_by_ids(self, product_ids, chunk_size=1000):
+        """
+        여러 제품의 학습용 필드를 한 번에 조회합니다.
+        
+        ORM 객체 대신 (id, sale_name, platform, data) 행 튜플을 반환하며,
+        ID 목록이 길면 chunk_size 단위의 IN 쿼리로 나누어 조회합니다.
+        
+        Args:
+            product_ids (iterable): 조회할 제품 ID 목록
+            chunk_size (int, optional): IN 쿼리 한 번에 넣을 최대 ID 수. 기본값은 1000.
+            
+        Returns:
+            list: (id, sale_name, platform, data) 행 목록
+        """
+        product_ids = list(dict.fromkeys(product_ids))
+        if not product_ids:
+            return []
+        
+        session = self.db.get_session()
+        try:
+            rows = []
+            for start in range(0, len(product_ids), chunk_size):
+                chunk = product_ids[start:start + chunk_size]
+                rows.extend(session.query(
+                    Product.id, Product.sale_name, Product.platform, Product.data
+                ).filter(Product.id.in_(chunk)).all())
+            return rows
+        
+        except SQLAlchemyError as e:
+            logger.error(f"제품 일괄 조회 중 오류 발생: {e}")
+            return []
+        finally:
+            session.close()
+    
     def update_product_tags(self, product_id, company=None, category=None, tags=None, product_name=None):
         """
         제품의 태그, 카테고리, 제조사, 제품명 정보를 업데이트합니다.
@@ -360,31 +575,183 @@ class ProductCRUD:
         finally:
             session.close()
     
+    def save_tag_prediction(self, product_id, model_version, predictions, confidence_scores):
+        """
+        자동 태깅 예측 결과를 기록합니다.
+        
+        Args:
+            product_id (int): 제품 ID
+            model_version (str): 예측에 사용된 모델 버전
+            predictions (dict): 모델별 예측 결과
+            confidence_scores (dict): 모델별 신뢰도 점수
+            
+        Returns:
+            bool: 저장 성공 여부
+        """
+        session = self.db.get_session()
+        try:
+            session.add(TagPrediction(
+                product_id=product_id,
+                model_version=model_version,
+                predictions=predictions,
+                confidence_scores=confidence_scores,
+                created_at=datetime.datetime.utcnow()
+            ))
+            session.commit()
+            return True
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"예측 기록 저장 중 오류 발생: {e}")
+            return False
+        finally:
+            session.close()
+    
+    def save_tag_predictions(self, records):
+        """
+        여러 제품의 자동 태깅 예측 결과를 한 번의 INSERT로 기록합니다.
+        
+        Args:
+            records (list): product_id, model_version, predictions, confidence_scores를 포함한 예측 기록 목록
+            
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if not records:
+            return True
+        
+        current_time = datetime.datetime.utcnow()
+        rows = [dict(record, created_at=current_time) for record in records]
+        
+        session = self.db.get_session()
+        try:
+            session.execute(insert(TagPrediction), rows)
+            session.commit()
+            return True
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"예측 기록 일괄 저장 중 오류 발생: {e}")
+            return False
+        finally:
+            session.close()
+    
+    def get_latest_tag_prediction(self, product_id):
+        """
+        제품의 가장 최근 자동 태깅 예측 기록을 조회합니다.
+        
+        Args:
+            product_id (int): 제품 ID
+            
+        Returns:
+            dict: 예측 기록 (model_version, predictions, confidence_scores, created_at), 없으면 None
+        """
+        session = self.db.get_session()
+        try:
+            query = session.query(TagPrediction).filter(TagPrediction.product_id == product_id)
+            record = query.order_by(TagPrediction.id.desc()).first()
+            if not record:
+                return None
+            return {
+                'model_version': record.model_version,
+                'predictions': record.predictions,
+                'confidence_scores': record.confidence_scores,
+                'created_at': record.created_at
+            }
+        except SQLAlchemyError as e:
+            logger.error(f"예측 기록 조회 중 오류 발생: {e}")
+            return None
+        finally:
+            session.close()
+    
     def save_feedback(self, feedback_data):
         """
         사용자 피드백을 저장합니다.
         
         Args:
             feedback_data (dict): 저장할 피드백 데이터
+                (product_id, original_tags, corrected_tags, user_id, model_version, timestamp)
             
         Returns:
             bool: 저장 성공 여부
         """
-        # 피드백 저장 로직 구현
-        # 여기서는 로그에만 기록하지만, 필요에 따라 데이터베이스 저장 로직 추가 가능
-        logger.info(f"피드백 저장: 제품 ID {feedback_data.get('product_id')}, 사용자 ID {feedback_data.get('user_id')}")
-        return True
+        session = self.db.get_session()
+        try:
+            session.add(TagFeedback(
+                product_id=feedback_data['product_id'],
+                user_id=feedback_data.get('user_id'),
+                model_version=feedback_data.get('model_version'),
+                original_tags=feedback_data.get('original_tags') or {},
+                corrected_tags=feedback_data.get('corrected_tags') or {},
+                created_at=feedback_data.get('timestamp') or datetime.datetime.utcnow()
+            ))
+            session.commit()
+            logger.info(f"피드백 저장: 제품 ID {feedback_data.get('product_id')}, 사용자 ID {feedback_data.get('user_id')}")
+            return True
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"피드백 저장 중 오류 발생: {e}")
+            return False
+        finally:
+            session.close()
     
-    def get_feedback(self, query=None):
+    def get_feedback(self, since=None, limit=None):
         """
         저장된 피드백을 조회합니다.
         
         Args:
-            query (dict, optional): 조회 조건
+            since (datetime, optional): 이 시간 이후에 저장된 피드백만 조회
+            limit (int, optional): 반환할 최대 피드백 수
+            
+        Returns:
+            list: 피드백 데이터 목록 (저장된 순서)
+        """
+        session = self.db.get_session()
+        try:
+            query = session.query(TagFeedback)
+            
+            if since:
+                query = query.filter(TagFeedback.created_at > since)
+            
+            query = query.order_by(TagFeedback.created_at, TagFeedback.id)
+            if limit:
+                query = query.limit(limit)
+            
+            return [
+                {
+                    'product_id': feedback.product_id,
+                    'original_tags': feedback.original_tags,
+                    'corrected_tags': feedback.corrected_tags,
+                    'user_id': feedback.user_id,
+                    'model_version': feedback.model_version,
+                    'timestamp': feedback.created_at
+                }
+                for feedback in query.all()
+            ]
+        except SQLAlchemyError as e:
+            logger.error(f"피드백 조회 중 오류 발생: {e}")
+            return []
+        finally:
+            session.close()
+    
+    def count_feedback(self, since=None):
+        """
+        저장된 피드백 수를 반환합니다.
+        
+        Args:
+            since (datetime, optional): 이 시간 이후에 저장된 피드백만 집계
             
         Returns:
-            list: 피드백 데이터 목록
+            int: 피드백 수
         """
-        # 피드백 조회 로직 구현
-        # 여기서는 빈 리스트를 반환하지만, 필요에 따라 데이터베이스 조회 로직 추가 가능
-        return []
+        session = self.db.get_session()
+        try:
+            query = session.query(func.count(TagFeedback.id))
+            
+            if since:
+                query = query.filter(TagFeedback.created_at > since)
+            
+            return query.scalar() or 0
+        except SQLAlchemyError as e:
+            logger.error(f"피드백 수 조회 중 오류 발생: {e}")
+            return 0
+        finally:
+            session.close()
@@ -22,6 +22,13 @@ class DatabaseConfig:
     PG_USER = os.getenv("PG_USER")
     PG_PASSWORD = os.getenv("PG_PASSWORD")
 
+    # 커넥션 풀 설정
+    PG_POOL_SIZE = int(os.getenv("PG_POOL_SIZE", "5"))
+    PG_MAX_OVERFLOW = int(os.getenv("PG_MAX_OVERFLOW", "10"))
+    PG_POOL_TIMEOUT = int(os.getenv("PG_POOL_TIMEOUT", "30"))
+    PG_POOL_RECYCLE = int(os.getenv("PG_POOL_RECYCLE", "1800"))
+    PG_POOL_PRE_PING = os.getenv("PG_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
     @classmethod
     def get_connection_str(cls):
         """
@@ -30,6 +37,28 @@ class DatabaseConfig:
         """
         return f"postgresql+psycopg2://{cls.PG_USER}:{cls.PG_PASSWORD}@{cls.PG_HOST}:{cls.PG_PORT}/{cls.PG_DB}"
     
+    @classmethod
+    def get_async_connection_str(cls):
+        """
+        SQLAlchemy asyncio(asyncpg) 연결용 문자열을 생성하는 메소드입니다.
+            Returns: pgsql 비동기 연결 문자열
+        """
+        return f"postgresql+asyncpg://{cls.PG_USER}:{cls.PG_PASSWORD}@{cls.PG_HOST}:{cls.PG_PORT}/{cls.PG_DB}"
+
+    @classmethod
+    def get_pool_options(cls):
+        """
+        create_engine에 전달할 커넥션 풀 설정을 반환하는 메소드입니다.
+            Returns: 커넥션 풀 설정 딕셔너리
+        """
+        return {
+            'pool_size': cls.PG_POOL_SIZE,
+            'max_overflow': cls.PG_MAX_OVERFLOW,
+            'pool_timeout': cls.PG_POOL_TIMEOUT,
+            'pool_recycle': cls.PG_POOL_RECYCLE,
+            'pool_pre_ping': cls.PG_POOL_PRE_PING,
+        }
+
     @classmethod
     def initialize(cls):
         """
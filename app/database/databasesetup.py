@@ -1,7 +1,9 @@
 from app.utils.logger import mainLogger
 
-from sqlalchemy import create_engine
+import threading
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from app.database.databaseconfig import DatabaseConfig
 
 # 로거 설정
@@ -10,36 +12,193 @@ logger = mainLogger()
 # 기본 모델 클래스
 Base = declarative_base()
 
+# 프로세스 전체에서 공유하는 엔진/세션 팩토리
+_engine = None
+_session_factory = None
+_engine_lock = threading.Lock()
+
+# 디스코드 봇 이벤트 루프에서 사용하는 비동기 엔진/세션 팩토리
+_async_engine = None
+_async_session_factory = None
+
+# 커넥션 풀 이벤트 누적 횟수
+_pool_counters = {
+    'connects': 0,
+    'checkouts': 0,
+    'checkins': 0,
+    'invalidations': 0,
+}
+
+
+def _register_pool_metrics(engine):
+    """
+    커넥션 풀 이벤트를 집계하는 리스너를 등록합니다.
+    """
+    def count(name):
+        def listener(*args):
+            _pool_counters[name] += 1
+        return listener
+
+    event.listen(engine, 'connect', count('connects'))
+    event.listen(engine, 'checkout', count('checkouts'))
+    event.listen(engine, 'checkin', count('checkins'))
+    event.listen(engine, 'invalidate', count('invalidations'))
+
+
+def get_engine():
+    """
+    프로세스 전체에서 공유하는 데이터베이스 엔진을 반환합니다.
+    최초 호출 시 DatabaseConfig의 커넥션 풀 설정으로 엔진을 생성합니다.
+    """
+    global _engine, _session_factory
+
+    if _engine is not None:
+        return _engine
+
+    with _engine_lock:
+        if _engine is None:
+            try:
+                pool_options = DatabaseConfig.get_pool_options()
+                engine = create_engine(
+                    DatabaseConfig.get_connection_str(),
+                    **pool_options
+                )
+                _register_pool_metrics(engine)
+                logger.info(f'데이터베이스 엔진 생성 완료 (풀 설정: {pool_options})')
+
+            except Exception as e:
+                logger.error(f'엔진 생성 실패: {str(e)}')
+                raise
+
+            try:
+                _session_factory = sessionmaker(
+                    autocommit=False,
+                    autoflush=False,
+                    bind=engine
+                )
+                logger.info('세션 팩토리 생성 완료')
+
+            except Exception as e:
+                logger.error(f'세션 생성 실패: {str(e)}')
+                raise
+
+            _engine = engine
+
+    return _engine
+
+
+def get_session_factory():
+    """
+    공유 엔진에 바인딩된 세션 팩토리를 반환합니다.
+    """
+    get_engine()
+    return _session_factory
+
+
+def get_pool_status():
+    """
+    커넥션 풀 사용 현황을 반환합니다.
+        Returns: 풀 크기, 사용 중/대기 중 커넥션 수, 오버플로 수와 누적 이벤트 횟수
+    """
+    if _engine is None:
+        return {'initialized': False, **_pool_counters}
+
+    pool = _engine.pool
+    return {
+        'initialized': True,
+        'size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'checked_in': pool.checkedin(),
+        # QueuePool.overflow()는 풀이 다 차기 전에는 음수를 반환함
+        'overflow': max(0, pool.overflow()),
+        **_pool_counters,
+    }
+
+
+def dispose_engine():
+    """
+    공유 엔진의 커넥션을 모두 닫습니다. 봇 종료 시(ManagementBot.close) 호출하며,
+    이후 get_engine()을 호출하면 현재 설정으로 엔진을 새로 만듭니다.
+    """
+    global _engine, _session_factory
+
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
+            _session_factory = None
+
+
+def get_async_engine():
+    """
+    프로세스 전체에서 공유하는 비동기(asyncpg) 데이터베이스 엔진을 반환합니다.
+    커넥션은 처음 사용한 이벤트 루프에 묶이므로 봇의 이벤트 루프에서만 사용합니다.
+    """
+    global _async_engine, _async_session_factory
+
+    if _async_engine is not None:
+        return _async_engine
+
+    with _engine_lock:
+        if _async_engine is None:
+            try:
+                pool_options = DatabaseConfig.get_pool_options()
+                engine = create_async_engine(
+                    DatabaseConfig.get_async_connection_str(),
+                    **pool_options
+                )
+                _register_pool_metrics(engine.sync_engine)
+                logger.info(f'비동기 데이터베이스 엔진 생성 완료 (풀 설정: {pool_options})')
+
+            except Exception as e:
+                logger.error(f'비동기 엔진 생성 실패: {str(e)}')
+                raise
+
+            # 커밋 후에도 조회한 객체의 속성을 추가 쿼리 없이 읽을 수 있도록 만료하지 않음
+            _async_session_factory = async_sessionmaker(
+                bind=engine,
+                autoflush=False,
+                expire_on_commit=False
+            )
+            _async_engine = engine
+
+    return _async_engine
+
+
+def get_async_session_factory():
+    """
+    비동기 엔진에 바인딩된 세션 팩토리를 반환합니다.
+    """
+    get_async_engine()
+    return _async_session_factory
+
+
+async def dispose_async_engine():
+    """
+    비동기 엔진의 커넥션을 모두 닫습니다. 봇 종료 시(ManagementBot.close) 호출합니다.
+    """
+    global _async_engine, _async_session_factory
+
+    engine = _async_engine
+    _async_engine = None
+    _async_session_factory = None
+
+    if engine is not None:
+        await engine.dispose()
+
+
 # 데이터베이스 셋업
 class DatabaseSetup:
     engine = None
     session = None
-    
+
     def __init__(self) -> None:
         """
         데이터베이스 셋업을 초기화하는 메소드입니다.
+        인스턴스마다 엔진을 만들지 않고 프로세스 공유 엔진과 세션 팩토리를 사용합니다.
         """
-        try:
-            self.engine = create_engine(
-                DatabaseConfig.get_connection_str(),
-            )
-            logger.info('데이터베이스 엔진 생성 완료')
-        
-        except Exception as e:
-            logger.error(f'엔진 생성 실패: {str(e)}')
-            raise
-            
-        try:
-            self.SessionLocal = sessionmaker(
-                autocommit=False,
-                autoflush=False,
-                bind=self.engine
-            )
-            logger.info('세션 팩토리 생성 완료')
-
-        except Exception as e:
-            logger.error(f'세션 생성 실패: {str(e)}')
-            raise
+        self.engine = get_engine()
+        self.SessionLocal = get_session_factory()
 
     def get_session(self):
         """
@@ -48,4 +207,13 @@ class DatabaseSetup:
         return self.SessionLocal()
 
 
-        
\ No newline at end of file
+# 비동기 데이터베이스 셋업
+class AsyncDatabaseSetup:
+
+    def get_session(self):
+        """
+        새로운 비동기 데이터베이스 세션을 반환합니다.
+        엔진은 첫 세션을 열 때 생성합니다.
+            사용 예: async with db.get_session() as session: ...
+        """
+        return get_async_session_factory()()
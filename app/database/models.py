@@ -32,6 +32,13 @@ class Product(Base):
         'tags',
         name='uq_product'
         ),
+        # 플랫폼 제품 1개당 1행 (bulk upsert의 ON CONFLICT 대상)
+        UniqueConstraint(
+        'platform',
+        'seller_id',
+        'product_id',
+        name='uq_product_platform_seller_product_id'
+        ),
     )
 
 class Margin(Base):
@@ -202,3 +209,30 @@ class CrawledDataPoint(Base):
     crawled_data = relationship('CrawledData', back_populates='point', uselist=False)
 
 
+
+class TagPrediction(Base):
+    """
+    자동 태깅 예측 기록 SQLAlchemy 모델입니다.
+    """
+    __tablename__ = 'tag_prediction'
+
+    id = Column(Integer, primary_key=True, nullable=False, autoincrement=True)
+    product_id = Column(Integer, ForeignKey('product.id', name='fk_tag_prediction_product', ondelete='CASCADE'), nullable=False, index=True)
+    model_version = Column(TEXT, nullable=False)
+    predictions = Column(JSON, nullable=False)
+    confidence_scores = Column(JSON, nullable=False)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False)
+
+class TagFeedback(Base):
+    """
+    자동 태깅 사용자 피드백 SQLAlchemy 모델입니다.
+    """
+    __tablename__ = 'tag_feedback'
+
+    id = Column(Integer, primary_key=True, nullable=False, autoincrement=True)
+    product_id = Column(Integer, ForeignKey('product.id', name='fk_tag_feedback_product', ondelete='CASCADE'), nullable=False, index=True)
+    user_id = Column(TEXT, nullable=True)
+    model_version = Column(TEXT, nullable=True)
+    original_tags = Column(JSON, nullable=False)
+    corrected_tags = Column(JSON, nullable=False)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
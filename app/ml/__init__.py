@@ -2,10 +2,27 @@
 머신러닝 기반 제품 태깅 시스템
 
 이 모듈은 제품 정보를 자동으로 태깅하기 위한 머신러닝 기반 시스템을 제공합니다.
-"""
 
-from app.ml.tagger import AutoTaggingSystem
-from app.ml.feedback import FeedbackSystem
+scikit-learn을 불러오는 데 수 초가 걸리므로 하위 모듈은 처음 사용할 때 import합니다. (PEP 562)
+"""
+import importlib
 
 # 버전 정보
 __version__ = '0.1.0'
+
+# 지연 import 대상 (이름 -> 모듈)
+_LAZY_ATTRIBUTES = {
+    'AutoTaggingSystem': 'app.ml.tagger',
+    'FeedbackSystem': 'app.ml.feedback',
+    'TaggerService': 'app.ml.service',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
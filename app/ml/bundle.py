@@ -0,0 +1,291 @@
+"""
+모델 번들 (특성 추출기 + 분류 모델) 저장 및 로드
+
+번들은 pickle 없이 저장합니다. (manifest.json + serialization 모듈의 objects.json, arrays/*.npy)
+배열은 메모리 맵으로 열리므로 pickle 번들보다 로드 후 RSS가 적지만, 랜덤 포레스트 번들은 로드가 더 느립니다.
+manifest의 sha256 체크섬은 파일 손상을 확인하는 용도이며 (변조는 막지 못함) 맞지 않으면 로드하지 않습니다.
+이전 형식(pickle 번들, 모델 디렉토리에 직접 저장된 pickle 파일)도 읽을 수 있습니다.
+"""
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
+from datetime import datetime
+
+from app.ml import serialization
+from app.ml.extractors.combined import CombinedExtractor
+from app.ml.models.base import BaseModel
+from app.ml.models.company import CompanyModel
+from app.ml.models.category import CategoryModel
+from app.ml.models.tags import TagsModel
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 현재 사용 중인 번들 버전을 가리키는 파일 (모델 디렉토리 기준)
+CURRENT_FILE = 'CURRENT'
+
+# 번들 디렉토리 (모델 디렉토리 기준)
+BUNDLES_DIRECTORY = 'bundles'
+
+# 번들 매니페스트 파일 (번들 디렉토리 기준)
+MANIFEST_FILE = 'manifest.json'
+
+# 번들 저장 형식 버전 (매니페스트의 format)
+BUNDLE_FORMAT = 2
+
+# pickle 번들의 메타데이터 파일 (번들 디렉토리 기준)
+BUNDLE_META_FILE = 'bundle.json'
+
+# 이전 방식(모델 디렉토리에 직접 저장)의 모델 버전 파일
+LEGACY_VERSION_FILE = 'model_version'
+
+
+def create_components(config: Dict[str, Any]) -> Tuple[CombinedExtractor, Dict[str, BaseModel]]:
+    """
+    설정으로 학습되지 않은 특성 추출기와 분류 모델 생성
+
+    Args:
+        config: 자동 태깅 시스템 설정
+
+    Returns:
+        (특성 추출기, 모델 이름별 분류 모델)
+    """
+    extractor = CombinedExtractor(config.get('extractor', {}))
+    models = {
+        'company': CompanyModel(config.get('company_model', {})),
+        'category': CategoryModel(config.get('category_model', {})),
+        'tags': TagsModel(config.get('tags_model', {}))
+    }
+    return extractor, models
+
+
+def _file_checksum(path: str) -> str:
+    """
+    파일 sha256 체크섬
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ModelBundle:
+    """
+    한 번에 학습된 특성 추출기와 분류 모델 묶음
+
+    생성 후에는 수정하지 않습니다. 재학습은 새 번들을 만들고, 서비스 중인 번들은
+    AutoTaggingSystem에서 참조 한 번으로 교체되므로 추론은 항상 같은 번들 안의
+    추출기와 모델을 함께 사용합니다.
+    """
+
+    def __init__(self, version: str, extractor: CombinedExtractor, models: Dict[str, BaseModel],
+                 trained_at: Optional[datetime] = None):
+        """
+        Args:
+            version: 번들 버전
+            extractor: 학습된 특성 추출기
+            models: 모델 이름별 학습된 분류 모델
+            trained_at: 학습 데이터 기준 시각 (UTC, 이후 피드백이 재학습 대상)
+        """
+        self.version = version
+        self.extractor = extractor
+        self.models = MappingProxyType(dict(models))
+        self.trained_at = trained_at
+
+    def save(self, directory: str):
+        """
+        번들 저장 (pickle 없는 형식)
+
+        매니페스트는 나머지 파일을 모두 쓴 뒤 마지막에 씁니다.
+
+        Args:
+            directory: 저장할 번들 디렉토리
+        """
+        objects = {
+            'extractor_config': self.extractor.config,
+            'text_extractor': self.extractor.text_extractor,
+            'structural_extractor': self.extractor.structural_extractor,
+            'models': dict(self.models)
+        }
+        files = serialization.save_objects(objects, directory)
+
+        manifest = {
+            'format': BUNDLE_FORMAT,
+            'version': self.version,
+            'trained_at': self.trained_at.isoformat() if self.trained_at else None,
+            'files': {name: _file_checksum(os.path.join(directory, name)) for name in files}
+        }
+        with open(os.path.join(directory, MANIFEST_FILE), 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+    @classmethod
+    def load(cls, directory: str, config: Dict[str, Any]) -> 'ModelBundle':
+        """
+        번들 로드 (이전 형식의 pickle 번들과 모델 디렉토리도 허용)
+
+        Args:
+            directory: 번들 디렉토리
+            config: 자동 태깅 시스템 설정 (pickle 형식을 로드할 때 사용)
+
+        Returns:
+            로드된 번들
+        """
+        if os.path.exists(os.path.join(directory, MANIFEST_FILE)):
+            return cls._load_manifest(directory)
+        return cls._load_pickle(directory, config)
+
+    @classmethod
+    def _load_manifest(cls, directory: str) -> 'ModelBundle':
+        """
+        pickle 없는 형식의 번들 로드 (체크섬 확인 후 배열은 메모리 맵으로 로드)
+        """
+        with open(os.path.join(directory, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+
+        if manifest.get('format') != BUNDLE_FORMAT:
+            raise ValueError(f"지원하지 않는 번들 형식입니다: {manifest.get('format')}")
+
+        for name, checksum in manifest['files'].items():
+            if _file_checksum(os.path.join(directory, name)) != checksum:
+                raise ValueError(f"번들 파일 체크섬이 일치하지 않습니다: {name}")
+
+        objects = serialization.load_objects(directory)
+
+        extractor = CombinedExtractor(objects['extractor_config'])
+        extractor.text_extractor = objects['text_extractor']
+        extractor.structural_extractor = objects['structural_extractor']
+        extractor.is_fitted = True
+        extractor._update_version()
+
+        trained_at = datetime.fromisoformat(manifest['trained_at']) if manifest.get('trained_at') else None
+        return cls(manifest['version'], extractor, objects['models'], trained_at)
+
+    @classmethod
+    def _load_pickle(cls, directory: str, config: Dict[str, Any]) -> 'ModelBundle':
+        """
+        pickle 형식의 번들 또는 이전 방식의 모델 디렉토리 로드
+        """
+        extractor, models = create_components(config)
+        extractor.load(os.path.join(directory, 'extractors'))
+
+        for name, model in models.items():
+            model.load(os.path.join(directory, f"{name}_model.pkl"))
+
+        meta_path = os.path.join(directory, BUNDLE_META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            trained_at = datetime.fromisoformat(meta['trained_at']) if meta.get('trained_at') else None
+            return cls(meta['version'], extractor, models, trained_at)
+
+        # 이전 방식: 버전 파일과 모델 파일 수정 시각 사용
+        try:
+            with open(os.path.join(directory, LEGACY_VERSION_FILE)) as f:
+                version = f.read().strip() or 'legacy'
+        except FileNotFoundError:
+            version = 'legacy'
+        trained_at = datetime.utcfromtimestamp(os.path.getmtime(os.path.join(directory, "company_model.pkl")))
+        return cls(version, extractor, models, trained_at)
+
+
+class BundleStore:
+    """
+    모델 디렉토리의 번들 저장소
+
+    번들은 <모델 디렉토리>/bundles/<버전>/ 에 저장하고, 현재 번들 버전은 CURRENT 파일에 기록합니다.
+    번들 디렉토리를 모두 쓴 뒤 CURRENT를 원자적으로 교체하므로 로드하는 쪽에서
+    쓰기 중인 번들을 보는 일이 없습니다.
+    """
+
+    def __init__(self, root: str, keep: int = 3):
+        """
+        Args:
+            root: 모델 디렉토리
+            keep: 보관할 최근 번들 수 (현재 번들 포함)
+        """
+        self.root = root
+        self.keep = keep
+
+    def path(self, version: str) -> str:
+        """
+        번들 버전의 디렉토리 경로
+        """
+        return os.path.join(self.root, BUNDLES_DIRECTORY, version)
+
+    def current_version(self) -> Optional[str]:
+        """
+        현재 번들 버전 (없으면 None)
+        """
+        try:
+            with open(os.path.join(self.root, CURRENT_FILE)) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def publish(self, bundle: ModelBundle) -> str:
+        """
+        번들을 저장하고 현재 번들로 지정
+
+        Args:
+            bundle: 저장할 번들
+
+        Returns:
+            저장된 번들 디렉토리
+        """
+        bundles_directory = os.path.join(self.root, BUNDLES_DIRECTORY)
+        os.makedirs(bundles_directory, exist_ok=True)
+
+        # 임시 디렉토리에 모두 쓴 뒤 버전 디렉토리로 이동
+        temp_directory = tempfile.mkdtemp(prefix=f'.{bundle.version}.', dir=bundles_directory)
+        try:
+            bundle.save(temp_directory)
+            os.replace(temp_directory, self.path(bundle.version))
+        except Exception:
+            shutil.rmtree(temp_directory, ignore_errors=True)
+            raise
+
+        # CURRENT 원자적 교체
+        current_path = os.path.join(self.root, CURRENT_FILE)
+        temp_path = f'{current_path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w') as f:
+            f.write(bundle.version)
+        os.replace(temp_path, current_path)
+
+        self._remove_old_bundles(bundle.version)
+        return self.path(bundle.version)
+
+    def load_current(self, config: Dict[str, Any]) -> ModelBundle:
+        """
+        현재 번들 로드 (CURRENT가 없으면 이전 방식의 모델 디렉토리에서 로드)
+
+        Args:
+            config: 자동 태깅 시스템 설정
+
+        Returns:
+            로드된 번들
+        """
+        version = self.current_version()
+        if version:
+            return ModelBundle.load(self.path(version), config)
+        return ModelBundle.load(self.root, config)
+
+    def _remove_old_bundles(self, current_version: str):
+        """
+        최근 keep개를 제외한 이전 번들 삭제
+        """
+        bundles_directory = os.path.join(self.root, BUNDLES_DIRECTORY)
+        versions = sorted(
+            (name for name in os.listdir(bundles_directory)
+             if not name.startswith('.') and name != current_version),
+            key=lambda name: os.path.getmtime(os.path.join(bundles_directory, name)),
+            reverse=True
+        )
+        for version in versions[max(self.keep - 1, 0):]:
+            shutil.rmtree(os.path.join(bundles_directory, version), ignore_errors=True)
+            logger.info(f"이전 모델 번들 삭제: {version}")
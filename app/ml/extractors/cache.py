@@ -0,0 +1,182 @@
+"""
+특성 추출 결과 캐시
+"""
+import os
+import json
+import shutil
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+import numpy as np
+from scipy import sparse
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+class FeatureCache:
+    """
+    제품 특성 캐시
+
+    (추출기 버전, 제품 내용 해시)를 키로 추출 결과를 메모리에 LRU 방식으로 보관하고,
+    디렉토리가 지정된 경우 디스크(<directory>/<버전>/)에도 저장합니다.
+    디스크에는 pickle 대신 텍스트 특성 CSR 행렬의 배열과 나머지 특성(JSON 문자열)을 .npz 파일 하나로 저장하고,
+    allow_pickle=False로 읽습니다.
+    추출기를 다시 학습하면 버전이 바뀌므로 이전 결과는 자동으로 사용되지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = 10000, directory: Optional[str] = None):
+        """
+        특성 캐시 초기화
+
+        Args:
+            max_entries: 메모리에 보관할 최대 항목 수 (0이면 메모리 캐시 사용 안 함)
+            directory: 디스크 캐시 디렉토리 (None이면 디스크 캐시 사용 안 함)
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def content_hash(content: Dict[str, Any]) -> str:
+        """
+        제품 내용 해시 계산
+
+        Args:
+            content: 특성 추출에 쓰이는 제품 필드
+
+        Returns:
+            sha1 해시 문자열
+        """
+        serialized = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+
+    def _path(self, version: str, key: str) -> str:
+        return os.path.join(self.directory, version, key[:2], f'{key}.npz')
+
+    @staticmethod
+    def _write(f, features: Dict[str, Any]):
+        """
+        특성을 .npz 형식으로 저장 (텍스트 특성 행렬은 CSR 배열로, 나머지는 JSON으로)
+        """
+        text = dict(features['text'])
+        matrix = sparse.csr_matrix(text.pop('text_features'))
+        others = json.dumps({'text': text, 'structural': features['structural']}, ensure_ascii=False)
+        np.savez(f, data=matrix.data, indices=matrix.indices, indptr=matrix.indptr,
+                 shape=np.array(matrix.shape), others=np.array(others))
+
+    @staticmethod
+    def _read(path: str) -> Dict[str, Any]:
+        """
+        _write로 저장한 특성 로드
+        """
+        with np.load(path, allow_pickle=False) as arrays:
+            matrix = sparse.csr_matrix((arrays['data'], arrays['indices'], arrays['indptr']),
+                                       shape=tuple(arrays['shape']))
+            features = json.loads(arrays['others'].item())
+        features['text']['text_features'] = matrix
+        return features
+
+    def get(self, version: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 특성 조회
+
+        Args:
+            version: 추출기 버전
+            key: 제품 내용 해시
+
+        Returns:
+            캐시된 특성 (없으면 None)
+        """
+        with self._lock:
+            features = self._entries.get((version, key))
+            if features is not None:
+                self._entries.move_to_end((version, key))
+                self.hits += 1
+                return features
+
+        if self.directory:
+            try:
+                features = self._read(self._path(version, key))
+                self._remember(version, key, features)
+                with self._lock:
+                    self.hits += 1
+                return features
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"디스크 특성 캐시 로드 실패 ({key}): {str(e)}")
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, version: str, key: str, features: Dict[str, Any]):
+        """
+        특성 저장
+
+        Args:
+            version: 추출기 버전
+            key: 제품 내용 해시
+            features: 추출된 특성
+        """
+        self._remember(version, key, features)
+
+        if self.directory:
+            path = self._path(version, key)
+            temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(temp_path, 'wb') as f:
+                    self._write(f, features)
+                os.replace(temp_path, path)
+            except Exception as e:
+                logger.warning(f"디스크 특성 캐시 저장 실패 ({key}): {str(e)}")
+
+    def _remember(self, version: str, key: str, features: Dict[str, Any]):
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[(version, key)] = features
+            self._entries.move_to_end((version, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, keep_version: Optional[str] = None, remove_files: bool = False):
+        """
+        keep_version 이외 버전의 캐시 삭제 (추출기 재학습 시 호출)
+
+        디스크 캐시 디렉토리는 다른 번들(교체 전 번들 등)의 추출기와 함께 쓸 수 있으므로
+        remove_files가 True일 때만 다른 버전의 디렉토리를 삭제합니다.
+
+        Args:
+            keep_version: 유지할 추출기 버전 (None이면 전체 삭제)
+            remove_files: 디스크 캐시에서도 다른 버전을 삭제할지 여부
+        """
+        with self._lock:
+            for entry in [entry for entry in self._entries if entry[0] != keep_version]:
+                del self._entries[entry]
+
+        if remove_files and self.directory and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name != keep_version:
+                    shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 적중 통계
+
+        Returns:
+            메모리 항목 수, 적중 수, 미적중 수
+        """
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
@@ -3,12 +3,15 @@
 """
 import os
 import pickle
+import hashlib
 import numpy as np
+from scipy import sparse
 from typing import Dict, Any, List, Union
 
 from app.ml.extractors.base import BaseExtractor
 from app.ml.extractors.text import TextExtractor
 from app.ml.extractors.structural import StructuralExtractor
+from app.ml.extractors.cache import FeatureCache
 
 
 class CombinedExtractor(BaseExtractor):
@@ -28,6 +31,15 @@ class CombinedExtractor(BaseExtractor):
         structural_config = self.config.get('structural', {})
         self.structural_extractor = StructuralExtractor(structural_config)
         
+        # 특성 캐시 (max_entries: 메모리 항목 수, directory: 디스크 캐시 경로)
+        cache_config = self.config.get('cache', {})
+        self.cache = FeatureCache(
+            max_entries=cache_config.get('max_entries', 10000),
+            directory=cache_config.get('directory')
+        )
+        
+        # 학습 상태를 나타내는 버전 (어휘, idf, 플랫폼 매핑이 같으면 같은 값)
+        self.version = None
         self.is_fitted = False
     
     def extract(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -43,6 +55,12 @@ class CombinedExtractor(BaseExtractor):
         if not self.is_fitted:
             raise ValueError("통합 추출기가 학습되지 않았습니다. fit() 메서드를 먼저 호출하세요.")
         
+        # 같은 내용의 제품은 캐시된 특성 사용 (반환된 특성은 수정하지 않아야 함)
+        key = self._cache_key(data)
+        cached = self.cache.get(self.version, key)
+        if cached is not None:
+            return cached
+        
         # 텍스트 특성 추출
         text_features = self.text_extractor.extract(data)
         
@@ -55,8 +73,90 @@ class CombinedExtractor(BaseExtractor):
             'structural': structural_features
         }
         
+        self.cache.put(self.version, key, combined_features)
+        
         return combined_features
     
+    def _cache_key(self, data: Dict[str, Any]) -> str:
+        """
+        특성 계산에 쓰이는 필드(판매명, 플랫폼, 플랫폼별 관련 데이터)의 해시
+        
+        Args:
+            data: 제품 데이터
+        
+        Returns:
+            캐시 키
+        """
+        return FeatureCache.content_hash({
+            'sale_name': data.get('sale_name', ''),
+            'structural': self.structural_extractor.cache_fields(data)
+        })
+    
+    def _compute_version(self) -> str:
+        """
+        학습된 상태(텍스트 설정, 어휘, idf, 플랫폼 매핑)로부터 추출기 버전 계산
+        
+        Returns:
+            버전 문자열
+        """
+        vectorizer = self.text_extractor.vectorizer
+        digest = hashlib.sha1()
+        digest.update(repr(sorted(self.text_extractor.config.items())).encode('utf-8'))
+        if not self.text_extractor.is_stateless:
+            digest.update(repr(sorted(vectorizer.vocabulary_.items())).encode('utf-8'))
+            digest.update(np.ascontiguousarray(vectorizer.idf_).tobytes())
+        digest.update(repr(sorted(self.structural_extractor.platform_mapping.items())).encode('utf-8'))
+        return digest.hexdigest()[:16]
+    
+    def _update_version(self):
+        """
+        버전을 다시 계산하고 메모리에서 다른 버전의 캐시 삭제 (디스크 캐시는 유지)
+        """
+        self.version = self._compute_version()
+        self.cache.invalidate(keep_version=self.version)
+    
+    def get_text_feature_names(self) -> List[str]:
+        """
+        텍스트 특성 이름 목록 반환 (어휘 순서, 추출기 학습 시 한 번만 생성)
+        
+        Returns:
+            텍스트 특성 이름 목록
+        """
+        return self.text_extractor.feature_names_
+    
+    def extract_matrix(self, data: List[Dict[str, Any]]) -> sparse.csr_matrix:
+        """
+        여러 제품의 특성을 모델 입력용 행렬로 한 번에 추출
+        
+        열 순서는 모델의 _preprocess_features와 같습니다.
+        (텍스트 특성, 플랫폼 벡터, 플랫폼별 수치 특성)
+        
+        Args:
+            data: 제품 데이터 리스트
+        
+        Returns:
+            특성 CSR 희소 행렬 (제품 수 × 특성 수)
+        """
+        if not self.is_fitted:
+            raise ValueError("통합 추출기가 학습되지 않았습니다. fit() 메서드를 먼저 호출하세요.")
+        
+        # 텍스트 특성은 벡터라이저 한 번으로 변환
+        text_matrix = self.text_extractor.extract_batch(data)
+        
+        # 구조적 특성은 제품별로 벡터화
+        structural_rows = [
+            StructuralExtractor.to_vector(self.structural_extractor.extract(item))
+            for item in data
+        ]
+        
+        widths = {len(row) for row in structural_rows}
+        if len(widths) > 1:
+            raise ValueError(f"제품별 구조적 특성 수가 일치하지 않습니다: {sorted(widths)}")
+        
+        structural_matrix = np.array(structural_rows, dtype=float).reshape(len(data), -1)
+        
+        return sparse.hstack([text_matrix, sparse.csr_matrix(structural_matrix)], format='csr')
+    
     def fit(self, data: List[Dict[str, Any]]):
         """
         데이터를 기반으로 모든 추출기 학습
@@ -71,6 +171,7 @@ class CombinedExtractor(BaseExtractor):
         self.structural_extractor.fit(data)
         
         self.is_fitted = True
+        self._update_version()
     
     def save(self, path: str):
         """
@@ -121,3 +222,6 @@ class CombinedExtractor(BaseExtractor):
         
         self.is_fitted = meta['is_fitted']
         self.config = meta['config']
+        
+        if self.is_fitted:
+            self._update_version()
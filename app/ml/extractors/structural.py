@@ -118,6 +118,51 @@ class StructuralExtractor(BaseExtractor):
         
         return features
     
+    def cache_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        구조적 특성 계산에 쓰이는 필드만 추출 (특성 캐시 키 계산용)
+        
+        Args:
+            data: 제품 데이터
+        
+        Returns:
+            플랫폼과 플랫폼별 관련 필드
+        """
+        platform = data.get('platform', '')
+        platform_data = data.get('data') or {}
+        fields = {'platform': platform}
+        
+        if platform == 'naverCommerce':
+            channel_products = platform_data.get('channelProducts')
+            if isinstance(channel_products, list) and channel_products:
+                channel_product = channel_products[0]
+                fields.update({
+                    key: channel_product.get(key)
+                    for key in ('manufacturerName', 'brandName', 'categoryId', 'sellerTags')
+                })
+        elif platform == 'cafe24':
+            fields['product_tag'] = platform_data.get('product_tag', [])
+            fields['options'] = platform_data.get('options', {})
+        
+        return fields
+    
+    @staticmethod
+    def to_vector(features: Dict[str, Any]) -> List[float]:
+        """
+        구조적 특성 딕셔너리를 수치 벡터로 변환
+        
+        Args:
+            features: extract가 반환한 구조적 특성
+        
+        Returns:
+            플랫폼 벡터 뒤에 플랫폼별 수치 특성을 이어 붙인 벡터
+        """
+        vector = list(features.get('platform_vector', []))
+        for key, value in features.items():
+            if key != 'platform_vector' and isinstance(value, (int, float)):
+                vector.append(value)
+        return vector
+    
     def extract(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         데이터에서 구조적 특성 추출
@@ -4,8 +4,9 @@
 import re
 import pickle
 import numpy as np
+from scipy import sparse
 from typing import Dict, Any, List, Union
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
 
 from app.ml.extractors.base import BaseExtractor
 
@@ -20,16 +21,36 @@ class TextExtractor(BaseExtractor):
     def _initialize(self):
         """
         텍스트 추출기 초기화
+        
+        vectorizer 설정이 'hashing'이면 어휘를 학습하지 않는 HashingVectorizer를 사용합니다.
+        특성 공간이 고정되므로 재학습 시 벡터라이저를 다시 학습할 필요가 없습니다. (증분 학습용)
         """
-        self.vectorizer = TfidfVectorizer(
-            max_features=self.config.get('max_features', 1000),
-            ngram_range=self.config.get('ngram_range', (1, 2)),
-            min_df=self.config.get('min_df', 2),
-            max_df=self.config.get('max_df', 0.95),
-            sublinear_tf=self.config.get('sublinear_tf', True)
-        )
+        if self.config.get('vectorizer', 'tfidf') == 'hashing':
+            self.vectorizer = HashingVectorizer(
+                n_features=self.config.get('n_features', 2 ** 16),
+                ngram_range=self.config.get('ngram_range', (1, 2)),
+                alternate_sign=False,
+                norm='l2'
+            )
+        else:
+            self.vectorizer = TfidfVectorizer(
+                max_features=self.config.get('max_features', 1000),
+                ngram_range=self.config.get('ngram_range', (1, 2)),
+                min_df=self.config.get('min_df', 2),
+                max_df=self.config.get('max_df', 0.95),
+                sublinear_tf=self.config.get('sublinear_tf', True)
+            )
+        # 어휘 순서의 특성 이름 (학습/로드 시 한 번만 생성, 해싱 방식은 이름 없음)
+        self.feature_names_ = []
         self.is_fitted = False
     
+    @property
+    def is_stateless(self) -> bool:
+        """
+        학습 데이터와 무관하게 같은 특성 공간을 쓰는지 여부 (해싱 방식)
+        """
+        return isinstance(self.vectorizer, HashingVectorizer)
+    
     def _preprocess_text(self, text: str) -> str:
         """
         텍스트 전처리
@@ -67,7 +88,7 @@ class TextExtractor(BaseExtractor):
             data: 제품 데이터
         
         Returns:
-            텍스트 특성 벡터
+            텍스트 특성 벡터 (CSR 희소 행렬)
         """
         if not self.is_fitted:
             raise ValueError("텍스트 추출기가 학습되지 않았습니다. fit() 메서드를 먼저 호출하세요.")
@@ -78,20 +99,30 @@ class TextExtractor(BaseExtractor):
         # 텍스트 전처리
         processed_text = self._preprocess_text(sale_name)
         
-        # 벡터화
-        if processed_text:
-            text_vector = self.vectorizer.transform([processed_text])
-            # 희소 행렬을 일반 배열로 변환
-            text_features = text_vector.toarray()[0]
-        else:
-            # 빈 텍스트인 경우 0 벡터 반환
-            text_features = np.zeros(len(self.vectorizer.get_feature_names_out()))
+        # 벡터화 (희소 행렬 1 × 어휘 수, 빈 텍스트는 0 벡터)
+        text_features = self.vectorizer.transform([processed_text])
         
         return {
-            'text_features': text_features,
-            'text_feature_names': self.vectorizer.get_feature_names_out().tolist()
+            'text_features': text_features
         }
     
+    def extract_batch(self, data: List[Dict[str, Any]]) -> sparse.csr_matrix:
+        """
+        여러 제품의 텍스트 특성을 한 번에 추출
+        
+        Args:
+            data: 제품 데이터 리스트
+        
+        Returns:
+            텍스트 특성 CSR 희소 행렬 (제품 수 × 어휘 수, 빈 텍스트는 0 벡터)
+        """
+        if not self.is_fitted:
+            raise ValueError("텍스트 추출기가 학습되지 않았습니다. fit() 메서드를 먼저 호출하세요.")
+        
+        texts = [self._preprocess_text(item.get('sale_name', '')) for item in data]
+        
+        return self.vectorizer.transform(texts)
+    
     def fit(self, data: List[Dict[str, Any]]):
         """
         텍스트 데이터를 기반으로 벡터라이저 학습
@@ -110,8 +141,10 @@ class TextExtractor(BaseExtractor):
         if not texts:
             raise ValueError("학습할 텍스트 데이터가 없습니다.")
         
-        # 벡터라이저 학습
-        self.vectorizer.fit(texts)
+        # 벡터라이저 학습 (해싱 방식은 학습할 상태가 없음)
+        if not self.is_stateless:
+            self.vectorizer.fit(texts)
+            self.feature_names_ = self.vectorizer.get_feature_names_out().tolist()
         self.is_fitted = True
     
     def save(self, path: str):
@@ -142,3 +175,4 @@ class TextExtractor(BaseExtractor):
         self.vectorizer = state['vectorizer']
         self.is_fitted = state['is_fitted']
         self.config = state['config']
+        self.feature_names_ = self.vectorizer.get_feature_names_out().tolist() if self.is_fitted and not self.is_stateless else []
@@ -26,7 +26,8 @@ class FeedbackSystem:
         self.db = db_connection
     
     def record_feedback(self, product_id: int, original_tags: Dict[str, Any], 
-                        corrected_tags: Dict[str, Any], user_id: Optional[str] = None) -> bool:
+                        corrected_tags: Dict[str, Any], user_id: Optional[str] = None,
+                        model_version: Optional[str] = None) -> bool:
         """
         사용자 피드백 기록
         
@@ -35,6 +36,7 @@ class FeedbackSystem:
             original_tags: 원본 예측 태그
             corrected_tags: 사용자가 수정한 태그
             user_id: 피드백을 제공한 사용자 ID (선택적)
+            model_version: 원본 예측에 사용된 모델 버전 (선택적)
             
         Returns:
             피드백 기록 성공 여부
@@ -45,7 +47,8 @@ class FeedbackSystem:
             'original_tags': original_tags,
             'corrected_tags': corrected_tags,
             'user_id': user_id,
-            'timestamp': datetime.now()
+            'model_version': model_version,
+            'timestamp': datetime.utcnow()
         }
         
         try:
@@ -77,13 +80,8 @@ class FeedbackSystem:
                 logger.warning("데이터베이스 연결이 없어 피드백을 조회할 수 없습니다.")
                 return []
             
-            # 쿼리 조건 구성
-            query = {}
-            if since_timestamp:
-                query['timestamp'] = {'$gt': since_timestamp}
-            
             # 데이터베이스에서 피드백 조회
-            feedback_data = self.db.get_feedback(query)
+            feedback_data = self.db.get_feedback(since=since_timestamp)
             logger.info(f"총 {len(feedback_data)}개의 피드백 데이터를 조회했습니다.")
             
             return feedback_data
@@ -91,6 +89,26 @@ class FeedbackSystem:
             logger.error(f"피드백 조회 중 오류 발생: {str(e)}")
             return []
     
+    def count_feedback(self, since_timestamp: Optional[datetime] = None) -> int:
+        """
+        수집된 피드백 수 조회 (피드백 행을 불러오지 않고 개수만 집계)
+        
+        Args:
+            since_timestamp: 이 시간 이후의 피드백만 집계 (선택적)
+            
+        Returns:
+            피드백 수
+        """
+        try:
+            if not self.db:
+                logger.warning("데이터베이스 연결이 없어 피드백을 조회할 수 없습니다.")
+                return 0
+            
+            return self.db.count_feedback(since=since_timestamp)
+        except Exception as e:
+            logger.error(f"피드백 수 조회 중 오류 발생: {str(e)}")
+            return 0
+    
     def update_training_data(self, feedback_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         피드백을 학습 데이터로 변환
@@ -105,6 +123,14 @@ class FeedbackSystem:
             logger.warning("데이터베이스 연결이 없어 학습 데이터를 생성할 수 없습니다.")
             return []
         
+        # 피드백 대상 제품을 한 번에 조회
+        product_ids = [feedback.get('product_id') for feedback in feedback_data if feedback.get('product_id')]
+        try:
+            products = {row.id: row for row in self.db.get_products_by_ids(product_ids)}
+        except Exception as e:
+            logger.error(f"피드백 대상 제품 조회 중 오류 발생: {str(e)}")
+            return []
+        
         training_samples = []
         
         for feedback in feedback_data:
@@ -114,7 +140,7 @@ class FeedbackSystem:
                 if not product_id:
                     continue
                 
-                product = self.db.get_product(product_id)
+                product = products.get(product_id)
                 if not product:
                     logger.warning(f"제품 ID {product_id}에 대한 정보를 찾을 수 없습니다.")
                     continue
@@ -126,9 +152,9 @@ class FeedbackSystem:
                 
                 # 학습 샘플 생성
                 sample = {
-                    'sale_name': product.get('sale_name', ''),
-                    'data': product.get('data', {}),
-                    'platform': product.get('platform', ''),
+                    'sale_name': product.sale_name or '',
+                    'data': product.data or {},
+                    'platform': product.platform or '',
                     'company': corrected_tags.get('company', ''),
                     'category': corrected_tags.get('category', ''),
                     'tags': corrected_tags.get('tags', '')
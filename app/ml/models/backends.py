@@ -0,0 +1,85 @@
+"""
+분류기 백엔드 생성
+"""
+from typing import Dict, Any, Optional
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import SGDClassifier, LogisticRegression
+from sklearn.multiclass import OneVsRestClassifier
+
+# 증분 학습(partial_fit)을 지원하는 백엔드
+INCREMENTAL_BACKENDS = {'sgd'}
+
+
+def make_classifier(config: Dict[str, Any]):
+    """
+    설정의 backend 값에 맞는 분류기 생성
+    
+    - random_forest (기본값): RandomForestClassifier
+    - sgd: 로지스틱 손실 SGDClassifier (클래스별 one-vs-rest, partial_fit으로 증분 학습 가능)
+    - logistic_regression: one-vs-rest LogisticRegression (liblinear, 희소 TF-IDF 특성에 적합)
+    
+    Args:
+        config: 모델 설정 딕셔너리
+        
+    Returns:
+        학습되지 않은 scikit-learn 분류기
+    """
+    backend = config.get('backend', 'random_forest')
+    
+    if backend == 'random_forest':
+        return RandomForestClassifier(
+            n_estimators=config.get('n_estimators', 100),
+            max_depth=config.get('max_depth', None),
+            min_samples_split=config.get('min_samples_split', 2),
+            min_samples_leaf=config.get('min_samples_leaf', 1),
+            random_state=config.get('random_state', 42),
+            class_weight=config.get('class_weight', 'balanced')
+        )
+    
+    if backend == 'sgd':
+        # partial_fit은 class_weight='balanced'를 지원하지 않으므로 기본값은 None
+        return SGDClassifier(
+            loss='log_loss',
+            alpha=config.get('alpha', 1e-5),
+            max_iter=config.get('max_iter', 50),
+            tol=config.get('tol', 1e-3),
+            random_state=config.get('random_state', 42),
+            class_weight=config.get('class_weight', None)
+        )
+    
+    if backend == 'logistic_regression':
+        return OneVsRestClassifier(LogisticRegression(
+            solver='liblinear',
+            C=config.get('C', 10.0),
+            max_iter=config.get('max_iter', 100),
+            class_weight=config.get('class_weight', 'balanced')
+        ))
+    
+    raise ValueError(f"지원하지 않는 분류기 백엔드입니다: {backend}")
+
+
+def feature_importances(classifier) -> Optional[np.ndarray]:
+    """
+    학습된 분류기의 특성별 중요도
+    
+    트리 모델은 feature_importances_, 선형 모델은 클래스별 계수 절댓값의 평균을 사용합니다.
+    
+    Args:
+        classifier: 학습된 scikit-learn 분류기
+        
+    Returns:
+        특성 수 길이의 중요도 배열 (지원하지 않는 분류기면 None)
+    """
+    if hasattr(classifier, 'feature_importances_'):
+        return classifier.feature_importances_
+    
+    if isinstance(classifier, OneVsRestClassifier):
+        coef = np.vstack([estimator.coef_ for estimator in classifier.estimators_])
+    elif hasattr(classifier, 'coef_'):
+        coef = classifier.coef_
+    else:
+        return None
+    
+    return np.abs(coef).mean(axis=0)
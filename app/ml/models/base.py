@@ -4,9 +4,13 @@
 import os
 import pickle
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Tuple, Union
 
 import numpy as np
+from scipy import sparse
+
+from app.ml.extractors.structural import StructuralExtractor
+from app.ml.models.backends import INCREMENTAL_BACKENDS
 
 
 class BaseModel(ABC):
@@ -33,8 +37,7 @@ class BaseModel(ABC):
         """
         pass
     
-    @abstractmethod
-    def _preprocess_features(self, features: Dict[str, Any]) -> np.ndarray:
+    def _preprocess_features(self, features: Dict[str, Any]) -> sparse.csr_matrix:
         """
         특성 전처리
         
@@ -42,21 +45,93 @@ class BaseModel(ABC):
             features: 추출기에서 제공한 특성
             
         Returns:
-            모델 입력용 처리된 특성 벡터
+            모델 입력용 처리된 특성 벡터 (CSR 희소 행렬 1 × 특성 수)
         """
-        pass
+        # 텍스트 특성 (이전 형식의 밀집 배열도 허용)
+        text_features = features.get('text', {}).get('text_features')
+        if text_features is None:
+            text_features = sparse.csr_matrix((1, 0))
+        elif not sparse.issparse(text_features):
+            text_features = sparse.csr_matrix(np.asarray(text_features, dtype=float).reshape(1, -1))
+        
+        # 구조적 특성 (플랫폼 벡터 + 플랫폼별 수치 특성)
+        structural_features = StructuralExtractor.to_vector(features.get('structural', {}))
+        structural_features = sparse.csr_matrix(np.array(structural_features, dtype=float).reshape(1, -1))
+        
+        # 모든 특성 결합
+        return sparse.hstack([text_features, structural_features], format='csr')
     
     @abstractmethod
-    def fit(self, features: List[Dict[str, Any]], labels: List[str]):
+    def fit(self, features: List[Dict[str, Any]], labels: List[str], text_feature_names: List[str] = None):
         """
         모델 학습
         
         Args:
             features: 학습 데이터 특성 리스트
             labels: 학습 데이터 레이블 리스트
+            text_feature_names: 추출기의 텍스트 특성 이름 목록 (특성 중요도 표시용, 선택적)
         """
         pass
     
+    @property
+    def supports_partial_fit(self) -> bool:
+        """
+        증분 학습(partial_fit) 지원 여부 (backend가 INCREMENTAL_BACKENDS에 속하는 경우)
+        """
+        return self.config.get('backend', 'random_forest') in INCREMENTAL_BACKENDS
+    
+    def partial_fit(self, features: List[Dict[str, Any]], labels: List[str]):
+        """
+        학습된 모델에 새 데이터만 추가로 학습 (증분 학습)
+        
+        학습 때 없던 레이블이 있으면 클래스 목록을 늘릴 수 없으므로 ValueError가 발생하며,
+        이 경우 전체 재학습(fit)이 필요합니다.
+        
+        Args:
+            features: 추가 학습 데이터 특성 리스트
+            labels: 추가 학습 데이터 레이블 리스트
+        """
+        self._check_partial_fit(features, labels)
+        
+        unseen = set(labels) - set(self.classes_)
+        if unseen:
+            raise ValueError(f"학습되지 않은 레이블이 있어 증분 학습할 수 없습니다: {sorted(unseen)}")
+        
+        X = sparse.vstack([self._preprocess_features(f) for f in features], format='csr')
+        self.model.partial_fit(X, np.array(labels))
+    
+    def _check_partial_fit(self, features: List[Dict[str, Any]], labels: List[str]):
+        """
+        증분 학습 가능 여부 확인
+        
+        Args:
+            features: 추가 학습 데이터 특성 리스트
+            labels: 추가 학습 데이터 레이블 리스트
+        """
+        if not self.is_fitted:
+            raise ValueError("모델이 학습되지 않았습니다.")
+        
+        if not self.supports_partial_fit:
+            raise ValueError("증분 학습을 지원하지 않는 분류기입니다. backend 설정을 확인하세요.")
+        
+        if not features or not labels or len(features) != len(labels):
+            raise ValueError("특성과 레이블의 수가 일치하지 않거나 비어 있습니다.")
+    
+    def _set_feature_names(self, text_feature_names: List[str], n_features: int):
+        """
+        텍스트 특성 이름 뒤에 구조적 특성 이름을 붙여 특성 이름 목록 기록
+        
+        Args:
+            text_feature_names: 추출기의 텍스트 특성 이름 목록
+            n_features: 전체 특성 수
+        """
+        if not text_feature_names:
+            return
+        
+        structural_feature_count = n_features - len(text_feature_names)
+        structural_feature_names = [f'structural_{i}' for i in range(structural_feature_count)]
+        self.feature_names_ = list(text_feature_names) + structural_feature_names
+    
     @abstractmethod
     def predict(self, features: Dict[str, Any]) -> str:
         """
@@ -83,6 +158,50 @@ class BaseModel(ABC):
         """
         pass
     
+    def predict_with_confidence(self, features: Dict[str, Any]) -> Tuple[str, Dict[str, float]]:
+        """
+        예측 레이블과 클래스별 확률을 한 번의 확률 계산으로 함께 반환
+        
+        레이블은 확률에서 도출하므로(labels_from_proba) predict와 같은 결과이며,
+        신뢰도가 필요할 때 predict와 predict_proba를 따로 호출하지 않아도 됩니다.
+        
+        Args:
+            features: 예측할 데이터의 특성
+            
+        Returns:
+            (예측 레이블, 각 클래스별 예측 확률)
+        """
+        proba = self.predict_proba_batch(self._preprocess_features(features))
+        label = self.labels_from_proba(proba)[0]
+        return label, {class_name: float(prob) for class_name, prob in zip(self.classes_, proba[0])}
+    
+    def predict_proba_batch(self, X: sparse.csr_matrix) -> np.ndarray:
+        """
+        여러 제품의 예측 확률을 한 번에 계산
+        
+        Args:
+            X: 추출기의 extract_matrix로 만든 특성 행렬 (제품 수 × 특성 수)
+            
+        Returns:
+            확률 행렬 (제품 수 × 클래스 수, 열 순서는 classes_와 동일)
+        """
+        if not self.is_fitted:
+            raise ValueError("모델이 학습되지 않았습니다.")
+        
+        return self.model.predict_proba(X)
+    
+    def labels_from_proba(self, proba: np.ndarray) -> List[str]:
+        """
+        확률 행렬에서 제품별 예측 레이블 도출 (predict와 같은 결과)
+        
+        Args:
+            proba: predict_proba_batch가 반환한 확률 행렬
+            
+        Returns:
+            제품별 예측 레이블 목록
+        """
+        return np.asarray(self.classes_)[np.argmax(proba, axis=1)].tolist()
+    
     def save(self, path: str):
         """
         모델 저장
@@ -2,10 +2,11 @@
 회사명 분류 모델 구현
 """
 import numpy as np
+from scipy import sparse
 from typing import Dict, Any, List, Union
-from sklearn.ensemble import RandomForestClassifier
 
 from app.ml.models.base import BaseModel
+from app.ml.models.backends import make_classifier, feature_importances
 
 
 class CompanyModel(BaseModel):
@@ -19,15 +20,8 @@ class CompanyModel(BaseModel):
         """
         회사명 모델 초기화
         """
-        # 기본 분류기는 RandomForest 사용
-        self.model = RandomForestClassifier(
-            n_estimators=self.config.get('n_estimators', 100),
-            max_depth=self.config.get('max_depth', None),
-            min_samples_split=self.config.get('min_samples_split', 2),
-            min_samples_leaf=self.config.get('min_samples_leaf', 1),
-            random_state=self.config.get('random_state', 42),
-            class_weight=self.config.get('class_weight', 'balanced')
-        )
+        # 기본 분류기는 RandomForest 사용 (backend 설정으로 변경)
+        self.model = make_classifier(self.config)
         
         # 클래스 레이블 (회사명) 목록
         self.classes_ = []
@@ -35,60 +29,24 @@ class CompanyModel(BaseModel):
         # 특성 이름 목록 (디버깅 및 분석용)
         self.feature_names_ = []
     
-    def _preprocess_features(self, features: Dict[str, Any]) -> np.ndarray:
-        """
-        특성 전처리
-        
-        Args:
-            features: 추출기에서 제공한 특성
-            
-        Returns:
-            모델 입력용 처리된 특성 벡터
-        """
-        # 텍스트 특성 추출
-        text_features = features.get('text', {}).get('text_features', [])
-        
-        # 구조적 특성 추출
-        structural_features = []
-        
-        # 플랫폼 벡터
-        platform_vector = features.get('structural', {}).get('platform_vector', [])
-        structural_features.extend(platform_vector)
-        
-        # 플랫폼별 특수 특성
-        for key, value in features.get('structural', {}).items():
-            if key != 'platform_vector' and isinstance(value, (int, float)):
-                structural_features.append(value)
-        
-        # 모든 특성 결합
-        combined_features = np.concatenate([
-            text_features if isinstance(text_features, np.ndarray) else np.array(text_features),
-            np.array(structural_features)
-        ])
-        
-        return combined_features
-    
-    def fit(self, features: List[Dict[str, Any]], labels: List[str]):
+    def fit(self, features: List[Dict[str, Any]], labels: List[str], text_feature_names: List[str] = None):
         """
         회사명 모델 학습
         
         Args:
             features: 학습 데이터 특성 리스트
             labels: 학습 데이터 회사명 리스트
+            text_feature_names: 추출기의 텍스트 특성 이름 목록 (특성 중요도 표시용, 선택적)
         """
         if not features or not labels or len(features) != len(labels):
             raise ValueError("특성과 레이블의 수가 일치하지 않거나 비어 있습니다.")
         
         # 전처리된 특성 생성
-        X = np.array([self._preprocess_features(f) for f in features])
+        X = sparse.vstack([self._preprocess_features(f) for f in features], format='csr')
         y = np.array(labels)
         
-        # 특성 이름 기록 (첫 번째 샘플만 사용)
-        if features and 'text' in features[0] and 'text_feature_names' in features[0]['text']:
-            text_feature_names = features[0]['text']['text_feature_names']
-            structural_feature_count = X.shape[1] - len(text_feature_names)
-            structural_feature_names = [f'structural_{i}' for i in range(structural_feature_count)]
-            self.feature_names_ = text_feature_names + structural_feature_names
+        # 특성 이름 기록
+        self._set_feature_names(text_feature_names, X.shape[1])
         
         # 모델 학습
         self.model.fit(X, y)
@@ -108,16 +66,7 @@ class CompanyModel(BaseModel):
         Returns:
             예측된 회사명
         """
-        if not self.is_fitted:
-            raise ValueError("모델이 학습되지 않았습니다.")
-        
-        # 특성 전처리
-        X = self._preprocess_features(features).reshape(1, -1)
-        
-        # 예측 수행
-        prediction = self.model.predict(X)[0]
-        
-        return prediction
+        return self.predict_with_confidence(features)[0]
     
     def predict_proba(self, features: Dict[str, Any]) -> Dict[str, float]:
         """
@@ -129,19 +78,7 @@ class CompanyModel(BaseModel):
         Returns:
             각 회사명별 예측 확률
         """
-        if not self.is_fitted:
-            raise ValueError("모델이 학습되지 않았습니다.")
-        
-        # 특성 전처리
-        X = self._preprocess_features(features).reshape(1, -1)
-        
-        # 확률 예측 수행
-        probabilities = self.model.predict_proba(X)[0]
-        
-        # 회사명-확률 매핑
-        result = {class_name: float(prob) for class_name, prob in zip(self.classes_, probabilities)}
-        
-        return result
+        return self.predict_with_confidence(features)[1]
     
     def get_feature_importance(self) -> Dict[str, float]:
         """
@@ -153,10 +90,9 @@ class CompanyModel(BaseModel):
         if not self.is_fitted:
             raise ValueError("모델이 학습되지 않았습니다.")
         
-        # 특성 중요도가 있는 경우
-        if hasattr(self.model, 'feature_importances_'):
-            importances = self.model.feature_importances_
-            
+        # 특성 중요도가 있는 경우 (선형 모델은 계수 크기)
+        importances = feature_importances(self.model)
+        if importances is not None:
             # 특성 이름이 있는 경우
             if len(self.feature_names_) == len(importances):
                 return {name: float(importance) for name, importance in zip(self.feature_names_, importances)}
@@ -3,12 +3,13 @@
 """
 import re
 import numpy as np
-from typing import Dict, Any, List, Union
-from sklearn.ensemble import RandomForestClassifier
+from scipy import sparse
+from typing import Dict, Any, List, Tuple, Union
 from sklearn.multioutput import MultiOutputClassifier
 from sklearn.preprocessing import MultiLabelBinarizer
 
 from app.ml.models.base import BaseModel
+from app.ml.models.backends import make_classifier
 
 
 class TagsModel(BaseModel):
@@ -16,21 +17,17 @@ class TagsModel(BaseModel):
     태그 분류 모델
     
     제품 특성을 바탕으로 태그를 예측하는 다중 레이블 분류 모델
+    
+    예측은 태그별 양성 확률 행렬을 한 번 계산한 뒤 임계값(threshold, 태그별 tag_thresholds)을
+    넘는 태그를 선택합니다. 예측과 신뢰도가 같은 확률에서 나오므로 태그 분류기는 요청마다 한 번만 실행됩니다.
     """
     
     def _initialize(self):
         """
         태그 모델 초기화
         """
-        # 기본 분류기로 RandomForest 사용
-        base_classifier = RandomForestClassifier(
-            n_estimators=self.config.get('n_estimators', 100),
-            max_depth=self.config.get('max_depth', None),
-            min_samples_split=self.config.get('min_samples_split', 2),
-            min_samples_leaf=self.config.get('min_samples_leaf', 1),
-            random_state=self.config.get('random_state', 42),
-            class_weight=self.config.get('class_weight', 'balanced')
-        )
+        # 태그별 이진 분류기 (기본값 RandomForest, backend 설정으로 변경)
+        base_classifier = make_classifier(self.config)
         
         # 다중 레이블 분류를 위한 멀티아웃풋 분류기
         self.model = MultiOutputClassifier(base_classifier)
@@ -79,46 +76,14 @@ class TagsModel(BaseModel):
         tags = [tag.strip() for tag in tags_str.split('|')]
         return [tag for tag in tags if tag]  # 빈 태그 제거
     
-    def _preprocess_features(self, features: Dict[str, Any]) -> np.ndarray:
-        """
-        특성 전처리
-        
-        Args:
-            features: 추출기에서 제공한 특성
-            
-        Returns:
-            모델 입력용 처리된 특성 벡터
-        """
-        # 텍스트 특성 추출
-        text_features = features.get('text', {}).get('text_features', [])
-        
-        # 구조적 특성 추출
-        structural_features = []
-        
-        # 플랫폼 벡터
-        platform_vector = features.get('structural', {}).get('platform_vector', [])
-        structural_features.extend(platform_vector)
-        
-        # 플랫폼별 특수 특성
-        for key, value in features.get('structural', {}).items():
-            if key != 'platform_vector' and isinstance(value, (int, float)):
-                structural_features.append(value)
-        
-        # 모든 특성 결합
-        combined_features = np.concatenate([
-            text_features if isinstance(text_features, np.ndarray) else np.array(text_features),
-            np.array(structural_features)
-        ])
-        
-        return combined_features
-    
-    def fit(self, features: List[Dict[str, Any]], labels: List[str]):
+    def fit(self, features: List[Dict[str, Any]], labels: List[str], text_feature_names: List[str] = None):
         """
         태그 모델 학습
         
         Args:
             features: 학습 데이터 특성 리스트
             labels: 학습 데이터 태그 문자열 리스트 ('|'로 구분)
+            text_feature_names: 추출기의 텍스트 특성 이름 목록 (특성 중요도 표시용, 선택적)
         """
         if not features or not labels or len(features) != len(labels):
             raise ValueError("특성과 레이블의 수가 일치하지 않거나 비어 있습니다.")
@@ -130,20 +95,35 @@ class TagsModel(BaseModel):
         y = self.mlb.fit_transform(tag_sets)
         
         # 전처리된 특성 생성
-        X = np.array([self._preprocess_features(f) for f in features])
+        X = sparse.vstack([self._preprocess_features(f) for f in features], format='csr')
         
-        # 특성 이름 기록 (첫 번째 샘플만 사용)
-        if features and 'text' in features[0] and 'text_feature_names' in features[0]['text']:
-            text_feature_names = features[0]['text']['text_feature_names']
-            structural_feature_count = X.shape[1] - len(text_feature_names)
-            structural_feature_names = [f'structural_{i}' for i in range(structural_feature_count)]
-            self.feature_names_ = text_feature_names + structural_feature_names
+        # 특성 이름 기록
+        self._set_feature_names(text_feature_names, X.shape[1])
         
         # 모델 학습
         self.model.fit(X, y)
         
         self.is_fitted = True
     
+    def partial_fit(self, features: List[Dict[str, Any]], labels: List[str]):
+        """
+        학습된 태그 모델에 새 데이터만 추가로 학습 (증분 학습)
+        
+        Args:
+            features: 추가 학습 데이터 특성 리스트
+            labels: 추가 학습 데이터 태그 문자열 리스트 ('|'로 구분)
+        """
+        self._check_partial_fit(features, labels)
+        
+        tag_sets = [self._preprocess_tags(tag_str) for tag_str in labels]
+        
+        unseen = {tag for tags in tag_sets for tag in tags} - set(self.mlb.classes_)
+        if unseen:
+            raise ValueError(f"학습되지 않은 태그가 있어 증분 학습할 수 없습니다: {sorted(unseen)}")
+        
+        X = sparse.vstack([self._preprocess_features(f) for f in features], format='csr')
+        self.model.partial_fit(X, self.mlb.transform(tag_sets))
+    
     def predict(self, features: Dict[str, Any], category: str = None) -> str:
         """
         태그 예측
@@ -155,17 +135,35 @@ class TagsModel(BaseModel):
         Returns:
             예측된 태그 문자열 ('|'로 구분)
         """
-        if not self.is_fitted:
-            raise ValueError("모델이 학습되지 않았습니다.")
-        
-        # 특성 전처리
-        X = self._preprocess_features(features).reshape(1, -1)
+        return self.predict_with_confidence(features, category)[0]
+    
+    def predict_with_confidence(self, features: Dict[str, Any], category: str = None) -> Tuple[str, Dict[str, float]]:
+        """
+        태그와 태그별 확률을 한 번의 확률 계산으로 함께 예측 (BaseModel.predict_with_confidence에 카테고리 필터링 추가)
         
-        # 이진 예측 수행
-        y_pred_binary = self.model.predict(X)[0]
+        Args:
+            features: 예측할 데이터의 특성
+            category: 제품 카테고리 (제공된 경우 카테고리에 맞는 태그 필터링)
+            
+        Returns:
+            (예측된 태그 문자열, 각 태그별 예측 확률)
+        """
+        proba = self.predict_proba_batch(self._preprocess_features(features))
+        tags = self.labels_from_proba(proba, [category])[0]
+        return tags, {tag: float(prob) for tag, prob in zip(self.mlb.classes_, proba[0])}
+    
+    def _filter_tags_by_category(self, predicted_tags, category: str = None) -> List[str]:
+        """
+        카테고리에 적합한 태그만 남기고 소분류 태그를 맨 앞에 배치
         
-        # 이진 예측을 태그 목록으로 변환
-        predicted_tags = self.mlb.inverse_transform(y_pred_binary.reshape(1, -1))[0]
+        Args:
+            predicted_tags: 예측된 태그 목록
+            category: 제품 카테고리
+            
+        Returns:
+            필터링된 태그 목록
+        """
+        predicted_tags = list(predicted_tags)
         
         # 카테고리가 제공된 경우 해당 카테고리에 적합한 태그만 필터링
         if category and category in self.category_tags_mapping:
@@ -195,8 +193,7 @@ class TagsModel(BaseModel):
                 
                 predicted_tags = filtered_tags
         
-        # 태그 목록을 문자열로 변환
-        return '|'.join(predicted_tags)
+        return predicted_tags
     
     def predict_proba(self, features: Dict[str, Any]) -> Dict[str, float]:
         """
@@ -208,21 +205,66 @@ class TagsModel(BaseModel):
         Returns:
             각 태그별 예측 확률
         """
+        return self.predict_with_confidence(features)[1]
+    
+    def predict_proba_batch(self, X: sparse.csr_matrix) -> np.ndarray:
+        """
+        여러 제품의 태그별 양성 확률을 한 번에 계산
+        
+        Args:
+            X: 추출기의 extract_matrix로 만든 특성 행렬 (제품 수 × 특성 수)
+            
+        Returns:
+            확률 행렬 (제품 수 × 태그 수, 열 순서는 mlb.classes_와 동일)
+        """
         if not self.is_fitted:
             raise ValueError("모델이 학습되지 않았습니다.")
         
-        # 특성 전처리
-        X = self._preprocess_features(features).reshape(1, -1)
+        columns = []
+        for estimator, proba in zip(self.model.estimators_, self.model.predict_proba(X)):
+            if proba.shape[1] == 1:
+                # 학습 데이터에 한 가지 값만 있던 태그는 확률 열이 하나뿐임
+                columns.append(np.full(X.shape[0], float(estimator.classes_[0] == 1)))
+            else:
+                columns.append(proba[:, 1])
+        
+        return np.column_stack(columns)
+    
+    def thresholds(self) -> np.ndarray:
+        """
+        태그별 선택 임계값 (mlb.classes_ 순서)
+        
+        기본값은 설정의 threshold(0.5)이고, tag_thresholds에 지정한 태그는 해당 값을 사용합니다.
         
-        # 확률 예측 (다중 레이블이라 각 클래스에 대한 확률을 개별적으로 계산)
-        y_proba = []
-        for estimator in self.model.estimators_:
-            y_proba.append(estimator.predict_proba(X)[0, 1])  # 양성 클래스 확률만 추출
+        Returns:
+            태그 수 길이의 임계값 배열
+        """
+        default = self.config.get('threshold', 0.5)
+        tag_thresholds = self.config.get('tag_thresholds', {})
+        return np.array([tag_thresholds.get(tag, default) for tag in self.mlb.classes_], dtype=float)
+    
+    def labels_from_proba(self, proba: np.ndarray, categories: List[str] = None, threshold: float = None) -> List[str]:
+        """
+        확률 행렬에서 제품별 태그 문자열 도출
+        
+        Args:
+            proba: predict_proba_batch가 반환한 확률 행렬
+            categories: 제품별 카테고리 (제공된 경우 카테고리에 맞는 태그 필터링)
+            threshold: 태그를 선택할 최소 확률 (초과, 기본값은 태그별 설정 임계값)
+            
+        Returns:
+            제품별 태그 문자열 목록 ('|'로 구분)
+        """
+        classes = self.mlb.classes_
+        selected = proba > (self.thresholds() if threshold is None else threshold)
+        labels = []
         
-        # 태그-확률 매핑
-        result = {tag: float(prob) for tag, prob in zip(self.mlb.classes_, y_proba)}
+        for i, row in enumerate(selected):
+            predicted_tags = [classes[j] for j in np.flatnonzero(row)]
+            category = categories[i] if categories else None
+            labels.append('|'.join(self._filter_tags_by_category(predicted_tags, category)))
         
-        return result
+        return labels
     
     def build_tag_from_category(self, category: str, subtags: List[str] = None, options: List[str] = None) -> str:
         """
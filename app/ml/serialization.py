@@ -0,0 +1,312 @@
+"""
+pickle 없이 모델 객체를 저장하고 로드하는 직렬화
+
+객체 구조는 JSON(objects.json)으로, 배열(트리 노드 테이블, idf 벡터, 계수 등)은 dtype별로
+하나의 .npy 파일에 이어 붙여 저장합니다. 로드할 때 .npy는 mmap_mode로 열어 실제로 접근하는
+부분만 메모리에 올리므로 pickle보다 RSS가 적습니다. 다만 객체를 JSON에서 하나씩 복원하므로
+트리가 많은 랜덤 포레스트는 pickle보다 로드가 느립니다.
+
+객체는 ALLOWED_CLASSES에 등록된 클래스로만 생성하지만, 그 클래스의 생성자와 __setstate__는
+파일 내용을 그대로 받으므로 신뢰할 수 없는 출처의 파일을 로드해도 안전하다는 뜻은 아닙니다.
+"""
+import os
+import json
+import math
+import copyreg
+import importlib
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+# 객체 생성을 허용하는 클래스 (모델 번들에 들어가는 클래스만, 새 백엔드/추출기를 추가하면 함께 등록)
+ALLOWED_CLASSES = frozenset({
+    # 특성 추출기
+    'app.ml.extractors.text:TextExtractor',
+    'app.ml.extractors.structural:StructuralExtractor',
+    'sklearn.feature_extraction.text:TfidfVectorizer',
+    'sklearn.feature_extraction.text:TfidfTransformer',
+    'sklearn.feature_extraction.text:HashingVectorizer',
+    # 모델
+    'app.ml.models.company:CompanyModel',
+    'app.ml.models.category:CategoryModel',
+    'app.ml.models.tags:TagsModel',
+    'sklearn.multioutput:MultiOutputClassifier',
+    'sklearn.preprocessing._label:MultiLabelBinarizer',
+    'sklearn.preprocessing._label:LabelBinarizer',
+    # random_forest 백엔드
+    'sklearn.ensemble._forest:RandomForestClassifier',
+    'sklearn.tree._classes:DecisionTreeClassifier',
+    'sklearn.tree._tree:Tree',
+    # sgd 백엔드
+    'sklearn.linear_model._stochastic_gradient:SGDClassifier',
+    'sklearn._loss._loss:CyHalfBinomialLoss',
+    # logistic_regression 백엔드
+    'sklearn.multiclass:OneVsRestClassifier',
+    'sklearn.linear_model._logistic:LogisticRegression',
+    # dtype 인자 (TfidfVectorizer 등)
+    'numpy:float64',
+    'numpy:float32',
+})
+
+# 객체 구조 파일 이름
+OBJECTS_FILE = 'objects.json'
+
+# 배열 파일 디렉토리 이름
+ARRAYS_DIRECTORY = 'arrays'
+
+
+def _class_path(cls) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+@lru_cache(maxsize=None)
+def _import_class(path: str):
+    """
+    허용된 클래스(또는 타입) 가져오기
+    """
+    if path not in ALLOWED_CLASSES:
+        raise ValueError(f"허용되지 않은 클래스의 객체입니다: {path}")
+
+    module_name, qualname = path.split(':')
+
+    obj = importlib.import_module(module_name)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+
+    if not isinstance(obj, type):
+        raise ValueError(f"클래스가 아닌 객체입니다: {path}")
+    return obj
+
+
+class ArrayWriter:
+    """
+    배열을 dtype별로 모아 .npy 파일로 저장
+    """
+
+    def __init__(self):
+        self._groups = {}
+
+    def add(self, array: np.ndarray) -> Dict[str, Any]:
+        """
+        배열 추가
+
+        Args:
+            array: 저장할 배열 (object dtype 제외)
+
+        Returns:
+            배열 참조 (파일 번호, 시작 위치, 모양)
+        """
+        group = self._groups.setdefault(array.dtype, {'index': len(self._groups), 'arrays': [], 'size': 0})
+        ref = {'file': group['index'], 'offset': group['size'], 'shape': list(array.shape)}
+        group['arrays'].append(np.ascontiguousarray(array).ravel())
+        group['size'] += array.size
+        return ref
+
+    def write(self, directory: str) -> List[str]:
+        """
+        배열 파일 저장
+
+        Args:
+            directory: 저장 디렉토리
+
+        Returns:
+            저장한 파일의 상대 경로 목록
+        """
+        os.makedirs(os.path.join(directory, ARRAYS_DIRECTORY), exist_ok=True)
+
+        files = []
+        for dtype, group in self._groups.items():
+            name = os.path.join(ARRAYS_DIRECTORY, f"{group['index']}.npy")
+            data = np.concatenate(group['arrays']) if group['arrays'] else np.empty(0, dtype=dtype)
+            np.save(os.path.join(directory, name), data, allow_pickle=False)
+            files.append(name)
+        return files
+
+
+class ArrayReader:
+    """
+    배열 파일을 필요할 때 열어 참조에 해당하는 구간 반환
+    """
+
+    def __init__(self, directory: str, mmap_mode: Optional[str] = 'r'):
+        self.directory = directory
+        self.mmap_mode = mmap_mode
+        self._files = {}
+
+    def get(self, ref: Dict[str, Any]) -> np.ndarray:
+        data = self._files.get(ref['file'])
+        if data is None:
+            path = os.path.join(self.directory, ARRAYS_DIRECTORY, f"{ref['file']}.npy")
+            # memmap 하위 클래스 대신 같은 버퍼를 보는 일반 ndarray로 잘라 씀
+            data = np.asarray(np.load(path, mmap_mode=self.mmap_mode, allow_pickle=False))
+            self._files[ref['file']] = data
+
+        size = math.prod(ref['shape'])
+        return data[ref['offset']:ref['offset'] + size].reshape(ref['shape'])
+
+
+def encode(obj: Any, arrays: ArrayWriter) -> Any:
+    """
+    객체를 JSON으로 저장할 수 있는 형태로 변환 (배열은 arrays에 추가하고 참조만 남김)
+
+    Args:
+        obj: 변환할 객체
+        arrays: 배열 저장소
+
+    Returns:
+        JSON 직렬화 가능한 값
+    """
+    if obj is None or type(obj) in (bool, int, float, str):
+        return obj
+
+    if type(obj) is list:
+        return [encode(item, arrays) for item in obj]
+
+    if type(obj) is tuple:
+        return {'__tuple__': [encode(item, arrays) for item in obj]}
+
+    if type(obj) is dict:
+        # 키가 모두 문자열이면 JSON 객체로 저장 (로드가 더 빠름)
+        if all(type(key) is str for key in obj):
+            return {'__dict__': {key: encode(value, arrays) for key, value in obj.items()}}
+        return {'__dict__': [[encode(key, arrays), encode(value, arrays)] for key, value in obj.items()]}
+
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            return {'__objects__': [encode(item, arrays) for item in obj.ravel().tolist()], 'shape': list(obj.shape)}
+        return {'__ndarray__': arrays.add(obj)}
+
+    if isinstance(obj, np.generic):
+        return {'__scalar__': obj.dtype.str, 'value': obj.item()}
+
+    if isinstance(obj, type):
+        _import_class(_class_path(obj))
+        return {'__type__': _class_path(obj)}
+
+    # 그 밖의 객체는 pickle 프로토콜(__reduce_ex__)의 생성 정보와 상태를 저장
+    reduced = obj.__reduce_ex__(4)
+    if any(item is not None for item in reduced[3:]):
+        raise TypeError(f"직렬화할 수 없는 객체입니다: {type(obj)}")
+
+    func, args = reduced[0], reduced[1]
+    state = reduced[2] if len(reduced) > 2 else None
+
+    if func is copyreg.__newobj__:
+        cls, args, new = args[0], args[1:], True
+    elif isinstance(func, type):
+        cls, new = func, False
+    else:
+        raise TypeError(f"직렬화할 수 없는 객체입니다: {type(obj)}")
+
+    _import_class(_class_path(cls))
+    return {
+        '__object__': _class_path(cls),
+        'new': new,
+        'args': encode(list(args), arrays),
+        'state': encode(state, arrays)
+    }
+
+
+def _decode_object(value: Dict[str, Any], arrays: ArrayReader) -> Any:
+    cls = _import_class(value['__object__'])
+    args = decode(value['args'], arrays)
+    obj = cls.__new__(cls, *args) if value['new'] else cls(*args)
+
+    state = decode(value['state'], arrays)
+    if state is not None:
+        if hasattr(obj, '__setstate__'):
+            obj.__setstate__(state)
+        else:
+            obj.__dict__.update(state)
+    return obj
+
+
+def _decode_objects(value: Dict[str, Any], arrays: ArrayReader) -> np.ndarray:
+    result = np.empty(len(value['__objects__']), dtype=object)
+    result[:] = [decode(item, arrays) for item in value['__objects__']]
+    return result.reshape(value['shape'])
+
+
+def _decode_dict(value: Dict[str, Any], arrays: ArrayReader) -> Dict[Any, Any]:
+    items = value['__dict__']
+    if type(items) is dict:
+        return {key: decode(item, arrays) for key, item in items.items()}
+    return {decode(key, arrays): decode(item, arrays) for key, item in items}
+
+
+# 태그(변환된 dict의 첫 번째 키)별 복원 함수
+_DECODERS = {
+    '__tuple__': lambda value, arrays: tuple(decode(item, arrays) for item in value['__tuple__']),
+    '__dict__': _decode_dict,
+    '__ndarray__': lambda value, arrays: arrays.get(value['__ndarray__']),
+    '__objects__': _decode_objects,
+    '__scalar__': lambda value, arrays: np.array(value['value'], dtype=np.dtype(value['__scalar__']))[()],
+    '__type__': lambda value, arrays: _import_class(value['__type__']),
+    '__object__': _decode_object,
+}
+
+
+def decode(value: Any, arrays: ArrayReader) -> Any:
+    """
+    encode로 변환한 값을 객체로 복원
+
+    Args:
+        value: JSON에서 읽은 값
+        arrays: 배열 파일 읽기 객체
+
+    Returns:
+        복원된 객체
+    """
+    value_type = type(value)
+    if value_type is list:
+        return [decode(item, arrays) for item in value]
+
+    if value_type is not dict:
+        return value
+
+    tag = next(iter(value), None)
+    if tag not in _DECODERS:
+        raise ValueError(f"알 수 없는 직렬화 값입니다: {tag}")
+    return _DECODERS[tag](value, arrays)
+
+
+def save_objects(objects: Dict[str, Any], directory: str) -> List[str]:
+    """
+    객체 묶음 저장
+
+    Args:
+        objects: 이름별 저장할 객체
+        directory: 저장 디렉토리
+
+    Returns:
+        저장한 파일의 상대 경로 목록
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    arrays = ArrayWriter()
+    encoded = {name: encode(obj, arrays) for name, obj in objects.items()}
+
+    files = arrays.write(directory)
+    with open(os.path.join(directory, OBJECTS_FILE), 'w', encoding='utf-8') as f:
+        json.dump(encoded, f, ensure_ascii=False)
+
+    return [OBJECTS_FILE] + files
+
+
+def load_objects(directory: str, mmap_mode: Optional[str] = 'r') -> Dict[str, Any]:
+    """
+    save_objects로 저장한 객체 묶음 로드
+
+    Args:
+        directory: 저장 디렉토리
+        mmap_mode: 배열 파일을 여는 방식 ('r'이면 메모리 맵, None이면 전체 읽기)
+
+    Returns:
+        이름별 객체
+    """
+    with open(os.path.join(directory, OBJECTS_FILE), encoding='utf-8') as f:
+        encoded = json.load(f)
+
+    arrays = ArrayReader(directory, mmap_mode)
+    return {name: decode(value, arrays) for name, value in encoded.items()}
@@ -0,0 +1,87 @@
+"""
+자동 태깅 서비스 (태거 지연 초기화)
+"""
+import time
+import logging
+import threading
+from typing import Dict, Any, Optional
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+class TaggerNotReadyError(RuntimeError):
+    """
+    자동 태깅 시스템이 아직 준비되지 않았을 때 발생하는 예외
+    """
+
+
+class TaggerService:
+    """
+    AutoTaggingSystem 지연 초기화 래퍼
+
+    생성할 때는 scikit-learn을 import하지 않고, load()를 처음 호출할 때 태거를 만듭니다.
+    (모델 번들 로드, 번들이 없으면 초기 학습) load()는 블로킹 함수이므로 작업 스레드에서 호출하며,
+    완료 전까지 is_ready는 False이고 tagger에 접근하면 TaggerNotReadyError가 발생합니다.
+
+    사용 예:
+        service = TaggerService(db_connection=crud)
+        await ml_runner.run(service.load)
+        result = await ml_runner.run(service.tagger.tag_product, product_id)
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, db_connection=None):
+        """
+        Args:
+            config: 자동 태깅 시스템 설정
+            db_connection: 데이터베이스 연결 객체
+        """
+        self.config = config
+        self.db = db_connection
+        self._tagger = None
+        self._lock = threading.Lock()
+        # 마지막 load() 실패 원인 (성공하면 None)
+        self.last_error = None
+
+    @property
+    def is_ready(self) -> bool:
+        """
+        태거가 준비되어 명령을 처리할 수 있는지 여부
+        """
+        return self._tagger is not None
+
+    @property
+    def tagger(self):
+        """
+        준비된 AutoTaggingSystem
+
+        Raises:
+            TaggerNotReadyError: 아직 load()가 완료되지 않은 경우
+        """
+        if self._tagger is None:
+            raise TaggerNotReadyError("자동 태깅 시스템을 준비 중입니다.")
+        return self._tagger
+
+    def load(self):
+        """
+        태거 생성 (이미 준비되었으면 그대로 반환, 여러 스레드에서 호출해도 한 번만 생성)
+
+        Returns:
+            AutoTaggingSystem
+        """
+        with self._lock:
+            if self._tagger is None:
+                start_time = time.perf_counter()
+
+                # scikit-learn을 포함한 무거운 import는 여기서 처음 실행
+                from app.ml.tagger import AutoTaggingSystem
+
+                try:
+                    self._tagger = AutoTaggingSystem(config=self.config, db_connection=self.db)
+                except Exception as e:
+                    self.last_error = e
+                    raise
+
+                self.last_error = None
+                logger.info(f"자동 태깅 시스템 준비 완료 ({time.perf_counter() - start_time:.1f}초)")
+        return self._tagger
@@ -1,26 +1,36 @@
 """
 자동 태깅 시스템 구현
 """
-import os
 import logging
-from typing import Dict, Any, List, Union, Optional
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, List, Union, Optional, Tuple
 from datetime import datetime
 
-from app.ml.extractors.combined import CombinedExtractor
-from app.ml.models.company import CompanyModel
-from app.ml.models.category import CategoryModel
-from app.ml.models.tags import TagsModel
+from app.ml.bundle import ModelBundle, BundleStore
 from app.ml.feedback import FeedbackSystem
+from app.ml import training
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 전체 신뢰도 계산 시 모델별 가중치
+CONFIDENCE_WEIGHTS = {
+    'company': 0.3,
+    'category': 0.4,
+    'tags': 0.3
+}
+
 
 class AutoTaggingSystem:
     """
     자동 태깅 시스템
     
     특성 추출기와 분류 모델을 통합하여 제품 태깅을 자동화하는 시스템
+    
+    추출기와 모델은 하나의 모델 번들(ModelBundle)로 묶여 있으며, 재학습은 새 번들을 만든 뒤
+    self.bundle 참조를 한 번에 교체합니다. 추론 메소드는 시작할 때 번들을 한 번 가져와
+    끝까지 사용하므로 재학습 중에도 서로 맞지 않는 추출기와 모델을 함께 쓰는 일이 없습니다.
     """
     
     def __init__(self, config: Dict[str, Any] = None, db_connection=None):
@@ -34,23 +44,44 @@ class AutoTaggingSystem:
         self.config = config or {}
         self.db = db_connection
         
-        # 특성 추출기 초기화
-        extractor_config = self.config.get('extractor', {})
-        self.extractor = CombinedExtractor(extractor_config)
+        # 모델 번들 저장소
+        model_directory = self.config.get('model_directory', './models')
+        self.bundle_store = BundleStore(model_directory, keep=self.config.get('keep_bundles', 3))
         
-        # 분류 모델 초기화
-        self.models = {
-            'company': CompanyModel(self.config.get('company_model', {})),
-            'category': CategoryModel(self.config.get('category_model', {})),
-            'tags': TagsModel(self.config.get('tags_model', {}))
-        }
+        # 서비스 중인 모델 번들
+        self.bundle = None
         
         # 피드백 시스템 초기화
         self.feedback_system = FeedbackSystem(self.db)
         
+        # 백그라운드 학습 상태
+        self._training_lock = threading.Lock()
+        self._training_future = None
+        
         # 모델 로드 또는 초기 학습
         self._initialize_models()
     
+    @property
+    def extractor(self):
+        """
+        서비스 중인 번들의 특성 추출기
+        """
+        return self.bundle.extractor
+    
+    @property
+    def models(self):
+        """
+        서비스 중인 번들의 분류 모델 (이름별, 읽기 전용)
+        """
+        return self.bundle.models
+    
+    @property
+    def model_version(self) -> str:
+        """
+        서비스 중인 번들 버전 (예측 기록에 함께 저장)
+        """
+        return self.bundle.version
+    
     def tag_product(self, product_id: int) -> Dict[str, Any]:
         """
         제품 자동 태깅
@@ -66,23 +97,14 @@ class AutoTaggingSystem:
         if not product:
             return {"error": "Product not found"}
         
+        # 예측 도중 번들이 교체되어도 같은 번들을 사용
+        bundle = self.bundle
+        
         try:
-            # 특성 추출
-            features = self.extractor.extract(product)
+            predictions, confidence = self._predict_product(bundle, product)
             
-            # 각 모델별 예측 수행
-            predictions = {
-                "company": self.models['company'].predict(features),
-                "category": self.models['category'].predict(features),
-                "tags": ""  # 태그는 카테고리 예측 이후에 예측
-            }
-            
-            # 카테고리 예측을 기반으로 태그 예측
-            category = predictions["category"]
-            predictions["tags"] = self.models['tags'].predict(features, category)
-            
-            # 예측 신뢰도 계산
-            confidence = self._get_confidence_scores(features, predictions)
+            # 피드백 시 원본 예측으로 쓰기 위해 예측 기록 저장
+            self._record_prediction(product_id, predictions, confidence, bundle.version)
             
             # 결과 반환
             result = {
@@ -96,6 +118,139 @@ class AutoTaggingSystem:
             logger.error(f"제품 {product_id} 태깅 중 오류 발생: {str(e)}")
             return {"error": f"Processing error: {str(e)}"}
     
+    def _predict_product(self, bundle: ModelBundle, product: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, float]]:
+        """
+        제품 하나 예측
+        
+        Args:
+            bundle: 예측에 사용할 번들
+            product: 제품 정보 딕셔너리
+            
+        Returns:
+            (예측 결과, 예측 신뢰도)
+        """
+        # 특성 추출
+        features = bundle.extractor.extract(product)
+        
+        # 각 모델별 예측 수행 (모델마다 한 번의 확률 계산으로 레이블과 확률을 함께 얻음)
+        company, company_probs = bundle.models['company'].predict_with_confidence(features)
+        category, category_probs = bundle.models['category'].predict_with_confidence(features)
+        
+        # 카테고리 예측을 기반으로 태그 예측
+        tags, tags_probs = bundle.models['tags'].predict_with_confidence(features, category)
+        
+        predictions = {
+            "company": company,
+            "category": category,
+            "tags": tags
+        }
+        
+        # 예측 신뢰도 계산
+        confidence = self._get_confidence_scores(predictions, {
+            'company': company_probs,
+            'category': category_probs,
+            'tags': tags_probs
+        })
+        
+        return predictions, confidence
+    
+    def _tag_products_one_by_one(self, products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        제품을 하나씩 예측 (일괄 예측이 실패했을 때 문제 제품만 실패로 처리하기 위함)
+        
+        Args:
+            products: 제품 정보 딕셔너리 리스트
+            
+        Returns:
+            제품 순서대로의 태깅 결과 리스트 (실패한 제품은 error 포함)
+        """
+        bundle = self.bundle
+        
+        results = []
+        for product in products:
+            product_id = product.get('id')
+            try:
+                predictions, confidence = self._predict_product(bundle, product)
+                results.append({
+                    "product_id": product_id,
+                    "predictions": predictions,
+                    "confidence_scores": confidence
+                })
+            except Exception as e:
+                logger.error(f"제품 {product_id} 태깅 중 오류 발생: {str(e)}")
+                results.append({"product_id": product_id, "error": f"Processing error: {str(e)}"})
+        
+        self._record_predictions(results, bundle.version)
+        
+        return results
+    
+    def tag_products_batch(self, products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        여러 제품 일괄 자동 태깅
+        
+        전체 제품의 특성 행렬을 한 번에 만들고 모델마다 predict_proba를 한 번만 호출한 뒤
+        확률에서 예측 레이블과 신뢰도를 함께 도출합니다. 결과는 tag_product와 같은 형식이며,
+        예측 기록도 tag_product처럼 저장하되 전체 제품을 한 번에 저장합니다.
+        
+        Args:
+            products: 제품 정보 딕셔너리 리스트 (id 포함)
+            
+        Returns:
+            제품 순서대로의 태깅 결과 리스트
+        """
+        if not products:
+            return []
+        
+        # 예측 도중 번들이 교체되어도 같은 번들을 사용
+        bundle = self.bundle
+        models = bundle.models
+        
+        # 특성 추출 (제품 수 × 특성 수)
+        X = bundle.extractor.extract_matrix(products)
+        
+        # 모델별 확률 행렬
+        company_proba = models['company'].predict_proba_batch(X)
+        category_proba = models['category'].predict_proba_batch(X)
+        tags_proba = models['tags'].predict_proba_batch(X)
+        
+        # 확률에서 예측 레이블 도출 (태그는 카테고리 예측을 기반으로 필터링)
+        companies = models['company'].labels_from_proba(company_proba)
+        categories = models['category'].labels_from_proba(category_proba)
+        tags = models['tags'].labels_from_proba(tags_proba, categories)
+        
+        # 클래스별 열 위치
+        company_index = {c: i for i, c in enumerate(models['company'].classes_)}
+        category_index = {c: i for i, c in enumerate(models['category'].classes_)}
+        tags_index = {t: i for i, t in enumerate(models['tags'].mlb.classes_)}
+        
+        results = []
+        for i, product in enumerate(products):
+            predictions = {
+                "company": companies[i],
+                "category": categories[i],
+                "tags": tags[i]
+            }
+            
+            # 예측 신뢰도 (태그는 첫 번째 태그의 확률 사용)
+            first_tag = tags[i].split('|')[0] if tags[i] else None
+            confidence = {
+                'company': float(company_proba[i, company_index[companies[i]]]) if companies[i] in company_index else 0.0,
+                'category': float(category_proba[i, category_index[categories[i]]]) if categories[i] in category_index else 0.0,
+                'tags': float(tags_proba[i, tags_index[first_tag]]) if first_tag in tags_index else 0.0
+            }
+            confidence['overall'] = self._get_overall_confidence(confidence)
+            
+            results.append({
+                "product_id": product.get('id'),
+                "predictions": predictions,
+                "confidence_scores": confidence
+            })
+        
+        # 피드백 시 원본 예측으로 쓰기 위해 예측 기록 저장
+        self._record_predictions(results, bundle.version)
+        
+        return results
+    
     def process_feedback(self, product_id: int, corrected_tags: Dict[str, str], user_id: Optional[str] = None) -> Dict[str, Any]:
         """
         사용자 피드백 처리
@@ -109,26 +264,36 @@ class AutoTaggingSystem:
             처리 결과
         """
         try:
-            # 제품 정보 조회
-            product = self._get_product(product_id)
-            if not product:
-                return {"error": "Product not found"}
-            
-            # 원본 예측 태그 가져오기
-            features = self.extractor.extract(product)
-            original_predictions = {
-                "company": self.models['company'].predict(features),
-                "category": self.models['category'].predict(features)
-            }
-            # 카테고리 예측을 기반으로 태그 예측
-            original_predictions["tags"] = self.models['tags'].predict(features, original_predictions["category"])
+            # 태깅 시 저장한 원본 예측 조회
+            record = self.db.get_latest_tag_prediction(product_id) if self.db else None
+            
+            if record:
+                original_predictions = record["predictions"]
+                model_version = record["model_version"]
+            else:
+                # 예측 기록이 없는 경우(기록 도입 이전 태깅 등) 현재 모델로 다시 예측
+                logger.info(f"제품 {product_id}의 예측 기록이 없어 현재 모델로 원본 예측을 다시 계산합니다.")
+                product = self._get_product(product_id)
+                if not product:
+                    return {"error": "Product not found"}
+                
+                bundle = self.bundle
+                features = bundle.extractor.extract(product)
+                original_predictions = {
+                    "company": bundle.models['company'].predict(features),
+                    "category": bundle.models['category'].predict(features)
+                }
+                # 카테고리 예측을 기반으로 태그 예측
+                original_predictions["tags"] = bundle.models['tags'].predict(features, original_predictions["category"])
+                model_version = bundle.version
             
             # 피드백 기록
             feedback_recorded = self.feedback_system.record_feedback(
                 product_id, 
                 original_predictions, 
                 corrected_tags, 
-                user_id
+                user_id,
+                model_version=model_version
             )
             
             if not feedback_recorded:
@@ -170,24 +335,28 @@ class AutoTaggingSystem:
                 "products": []
             }
             
+            # 전체 제품 일괄 예측
+            try:
+                tagging_results = self.tag_products_batch(untagged_products)
+            except Exception as e:
+                # 일부 제품(data가 없는 제품 등) 때문에 일괄 예측 전체가 실패하면 제품별로 다시 예측
+                logger.warning(f"일괄 예측 실패, 제품별로 다시 예측합니다: {str(e)}")
+                tagging_results = self._tag_products_one_by_one(untagged_products)
+            
             # 각 제품 처리
-            for product in untagged_products:
-                product_id = product.get("id")
+            for tagging_result in tagging_results:
+                product_id = tagging_result["product_id"]
+                
+                if "error" in tagging_result:
+                    results["failed"] += 1
+                    results["products"].append({
+                        "id": product_id,
+                        "status": "failed",
+                        "error": tagging_result["error"]
+                    })
+                    continue
                 
                 try:
-                    # 태그 예측
-                    tagging_result = self.tag_product(product_id)
-                    
-                    if "error" in tagging_result:
-                        # 태깅 실패
-                        results["failed"] += 1
-                        results["products"].append({
-                            "id": product_id,
-                            "status": "failed",
-                            "error": tagging_result["error"]
-                        })
-                        continue
-                    
                     # 데이터베이스에 태그 적용
                     predictions = tagging_result["predictions"]
                     update_result = self.db.update_product_tags(
@@ -227,6 +396,48 @@ class AutoTaggingSystem:
             logger.error(f"배치 처리 중 오류 발생: {str(e)}")
             return {"error": f"Batch processing error: {str(e)}"}
     
+    def _record_prediction(self, product_id: int, predictions: Dict[str, str], confidence: Dict[str, float],
+                           model_version: str):
+        """
+        예측 기록 저장 (실패해도 태깅 결과에는 영향 없음)
+        
+        Args:
+            product_id: 제품 ID
+            predictions: 예측 결과
+            confidence: 예측 신뢰도 점수
+            model_version: 예측에 사용한 번들 버전
+        """
+        if not self.db:
+            return
+        
+        try:
+            self.db.save_tag_prediction(product_id, model_version, predictions, confidence)
+        except Exception as e:
+            logger.warning(f"제품 {product_id} 예측 기록 저장 실패: {str(e)}")
+    
+    def _record_predictions(self, results: List[Dict[str, Any]], model_version: str):
+        """
+        여러 제품의 예측 기록을 한 번에 저장 (실패해도 태깅 결과에는 영향 없음)
+        
+        Args:
+            results: 태깅 결과 리스트 (error가 있는 결과는 제외)
+            model_version: 예측에 사용한 번들 버전
+        """
+        if not self.db:
+            return
+        
+        records = [{
+            'product_id': result['product_id'],
+            'model_version': model_version,
+            'predictions': result['predictions'],
+            'confidence_scores': result['confidence_scores']
+        } for result in results if 'error' not in result]
+        
+        try:
+            self.db.save_tag_predictions(records)
+        except Exception as e:
+            logger.warning(f"예측 기록 {len(records)}건 일괄 저장 실패: {str(e)}")
+    
     def _get_product(self, product_id: int) -> Dict[str, Any]:
         """
         제품 정보 조회 및 딕셔너리로 변환
@@ -276,23 +487,12 @@ class AutoTaggingSystem:
     
     def _initialize_models(self):
         """
-        모델 초기화 (로드 또는 학습)
+        모델 초기화 (현재 번들 로드 또는 초기 학습)
         """
-        model_directory = self.config.get('model_directory', './models')
-        extractor_directory = os.path.join(model_directory, 'extractors')
-        
         try:
-            # 특성 추출기 로드 시도
-            self.extractor.load(extractor_directory)
-            logger.info("특성 추출기를 성공적으로 로드했습니다.")
-            
-            # 각 모델 로드 시도
-            for name, model in self.models.items():
-                model_path = os.path.join(model_directory, f"{name}_model.pkl")
-                model.load(model_path)
-                logger.info(f"{name} 모델을 성공적으로 로드했습니다.")
-            
-            logger.info("모든 모델이 성공적으로 로드되었습니다.")
+            bundle = self.bundle_store.load_current(self.config)
+            self._swap_bundle(bundle)
+            logger.info(f"모든 모델이 성공적으로 로드되었습니다. (버전: {bundle.version})")
         
         except Exception as e:
             logger.warning(f"모델 로드 중 오류 발생: {str(e)}. 초기 학습을 시도합니다.")
@@ -300,7 +500,7 @@ class AutoTaggingSystem:
     
     def _train_initial_models(self):
         """
-        초기 모델 학습
+        초기 모델 학습 (서비스할 번들이 없으므로 현재 프로세스에서 학습)
         """
         if not self.db:
             logger.error("데이터베이스 연결 없이 초기 모델을 학습할 수 없습니다.")
@@ -308,6 +508,7 @@ class AutoTaggingSystem:
         
         # 태깅된 제품 데이터 가져오기
         tagged_products_limit = self.config.get('initial_training_limit', 200)
+        trained_at = datetime.utcnow()
         initial_data = self.db.get_tagged_products(limit=tagged_products_limit)
         
         if not initial_data:
@@ -316,37 +517,25 @@ class AutoTaggingSystem:
         
         logger.info(f"총 {len(initial_data)}개의 데이터로 초기 모델을 학습합니다.")
         
-        # 특성 추출기 학습
-        self.extractor.fit(initial_data)
-        
-        # 각 모델 학습을 위한 특성 및 레이블 준비
-        features = []
-        labels = {
-            'company': [],
-            'category': [],
-            'tags': []
-        }
-        
-        for product in initial_data:
-            # 특성 추출
-            feature = self.extractor.extract(product)
-            features.append(feature)
-            
-            # 레이블 추출
-            labels['company'].append(product.get('company', ''))
-            labels['category'].append(product.get('category', ''))
-            labels['tags'].append(product.get('tags', ''))
-        
-        # 각 모델 학습
-        for name, model in self.models.items():
-            model.fit(features, labels[name])
-            logger.info(f"{name} 모델 학습 완료")
-        
-        # 모델 저장
-        self._save_models()
+        bundle = training.train_full(self.config, initial_data, trained_at)
+        self.bundle_store.publish(bundle)
+        self._swap_bundle(bundle)
         
         logger.info("초기 모델 학습 및 저장 완료")
     
+    def _swap_bundle(self, bundle: ModelBundle):
+        """
+        서비스 중인 번들 교체 (참조 한 번 대입이라 원자적)
+        
+        Args:
+            bundle: 완전히 로드된 새 번들
+        """
+        self.bundle = bundle
+        if bundle.trained_at:
+            # 번들 학습 이후의 피드백만 재학습 임계값에 반영
+            self.config['last_model_update'] = bundle.trained_at
+        logger.info(f"모델 번들 교체 완료 (버전: {bundle.version})")
+    
     def _update_model_if_needed(self):
         """
         필요시 모델 업데이트
@@ -355,105 +544,196 @@ class AutoTaggingSystem:
         last_update = self.config.get('last_model_update')
         
         # 마지막 업데이트 이후 수집된 피드백 수 확인
-        feedback_data = self.feedback_system.get_feedback_data(since_timestamp=last_update)
-        feedback_count = len(feedback_data)
+        feedback_count = self.feedback_system.count_feedback(since_timestamp=last_update)
         
         # 피드백 임계값 확인
         feedback_threshold = self.config.get('feedback_threshold', 20)
         
         if feedback_count >= feedback_threshold:
             logger.info(f"피드백 임계값({feedback_threshold})을 초과하여 모델을 재학습합니다.")
-            self._retrain_models()
+            if self.config.get('background_training', True):
+                self.retrain_in_background()
+            else:
+                self._retrain_models()
+    
+    def _training_mode(self) -> str:
+        """
+        재학습 방식 ('full' 또는 'incremental')
+        """
+        return self.config.get('training_mode', 'full')
+    
+    def _collect_training_data(self, mode: str) -> Dict[str, Any]:
+        """
+        재학습 데이터 수집
+        
+        Args:
+            mode: 'full' 또는 'incremental'
+            
+        Returns:
+            training.build_bundle/run_training 인자 (training_data, feedback_samples, trained_at)
+        """
+        trained_at = datetime.utcnow()
+        
+        if mode == 'incremental':
+            # 마지막 업데이트 이후 피드백만 사용
+            feedback_data = self.feedback_system.get_feedback_data(since_timestamp=self.config.get('last_model_update'))
+            training_data = []
+        else:
+            # 기존 태깅 데이터와 전체 피드백 사용
+            training_limit = self.config.get('retraining_limit', 500)
+            training_data = self.db.get_tagged_products(limit=training_limit)
+            if not training_data:
+                raise ValueError("재학습을 위한 태깅 데이터가 없습니다.")
+            feedback_data = self.feedback_system.get_feedback_data()
+        
+        feedback_samples = self.feedback_system.update_training_data(feedback_data)
+        
+        return {
+            'training_data': training_data,
+            'feedback_samples': feedback_samples,
+            'trained_at': trained_at
+        }
     
     def _retrain_models(self):
         """
-        모델 재학습
+        모델 재학습 (현재 프로세스에서 학습하고 끝날 때까지 대기)
+        
+        training_mode 설정이 'incremental'이면 마지막 업데이트 이후의 피드백만 증분 학습하고,
+        증분 학습을 할 수 없는 경우(새 레이블, partial_fit 미지원 백엔드)에는 전체 재학습합니다.
+        봇에서는 학습 프로세스를 사용하는 retrain_in_background를 사용합니다.
         """
         if not self.db:
             logger.error("데이터베이스 연결 없이 모델을 재학습할 수 없습니다.")
             return
         
-        try:
-            # 기존 태깅 데이터 가져오기
-            training_limit = self.config.get('retraining_limit', 500)
-            training_data = self.db.get_tagged_products(limit=training_limit)
-            
-            if not training_data:
-                logger.warning("재학습을 위한 태깅 데이터가 없습니다.")
+        mode = self._training_mode()
+        if mode == 'incremental':
+            try:
+                data = self._collect_training_data(mode)
+                if not data['feedback_samples']:
+                    logger.info("증분 학습할 새 피드백이 없습니다.")
+                    return
+                self._publish_and_swap(training.build_bundle(self.config, mode, base=self.bundle, **data))
                 return
-            
-            # 피드백 데이터 가져오기
-            feedback_data = self.feedback_system.get_feedback_data()
-            
-            # 피드백 데이터를 학습 데이터로 변환
-            feedback_samples = self.feedback_system.update_training_data(feedback_data)
-            
-            # 학습 데이터 결합
-            combined_data = training_data + feedback_samples
-            
-            logger.info(f"총 {len(combined_data)}개의 데이터로 모델을 재학습합니다.")
-            
-            # 특성 추출기 재학습
-            self.extractor.fit(combined_data)
-            
-            # 각 모델 학습을 위한 특성 및 레이블 준비
-            features = []
-            labels = {
-                'company': [],
-                'category': [],
-                'tags': []
-            }
-            
-            for product in combined_data:
-                # 특성 추출
-                feature = self.extractor.extract(product)
-                features.append(feature)
-                
-                # 레이블 추출
-                labels['company'].append(product.get('company', ''))
-                labels['category'].append(product.get('category', ''))
-                labels['tags'].append(product.get('tags', ''))
-            
-            # 각 모델 재학습
-            for name, model in self.models.items():
-                model.fit(features, labels[name])
-                logger.info(f"{name} 모델 재학습 완료")
-            
-            # 모델 저장
-            self._save_models()
-            
-            # 마지막 업데이트 시간 기록
-            self.config['last_model_update'] = datetime.now()
-            
+            except ValueError as e:
+                logger.info(f"증분 학습을 할 수 없어 전체 재학습합니다: {str(e)}")
+            except Exception as e:
+                logger.error(f"증분 학습 중 오류 발생: {str(e)}. 전체 재학습합니다.")
+        
+        try:
+            data = self._collect_training_data('full')
+            logger.info(f"총 {len(data['training_data']) + len(data['feedback_samples'])}개의 데이터로 모델을 재학습합니다.")
+            self._publish_and_swap(training.build_bundle(self.config, 'full', **data))
             logger.info("모델 재학습 및 저장 완료")
         
         except Exception as e:
             logger.error(f"모델 재학습 중 오류 발생: {str(e)}")
     
-    def _save_models(self):
+    def _publish_and_swap(self, bundle: ModelBundle):
         """
-        모델 저장
+        새 번들을 저장하고 서비스 번들로 교체
+        
+        Args:
+            bundle: 새 번들
         """
-        model_directory = self.config.get('model_directory', './models')
-        os.makedirs(model_directory, exist_ok=True)
+        self.bundle_store.publish(bundle)
+        self._swap_bundle(bundle)
+    
+    def retrain_in_background(self) -> Future:
+        """
+        학습 프로세스에서 모델 재학습
+        
+        학습 데이터는 현재 프로세스에서 조회해 넘기고, 학습 프로세스가 새 번들을 저장하면
+        그 번들을 로드한 뒤 교체합니다. 학습 중에도 기존 번들로 추론을 계속합니다.
+        이미 진행 중인 학습이 있으면 새로 시작하지 않고 그 학습의 Future를 반환합니다.
+        
+        Returns:
+            새 번들 버전을 결과로 갖는 Future
+        """
+        with self._training_lock:
+            if self._training_future and not self._training_future.done():
+                logger.info("이미 진행 중인 모델 재학습이 있습니다.")
+                return self._training_future
+            
+            result = Future()
+            self._training_future = result
+        
+        try:
+            if not self.db:
+                raise ValueError("Database connection is required for retraining")
+            self._submit_training(self._training_mode(), result)
+        except Exception as e:
+            logger.error(f"모델 재학습 시작 중 오류 발생: {str(e)}")
+            result.set_exception(e)
+        
+        return result
+    
+    def _submit_training(self, mode: str, result: Future):
+        """
+        학습 프로세스에 학습 작업 제출
+        
+        Args:
+            mode: 'full' 또는 'incremental'
+            result: 학습 결과를 전달할 Future
+        """
+        data = self._collect_training_data(mode)
         
-        # 특성 추출기 저장
-        extractor_directory = os.path.join(model_directory, 'extractors')
-        os.makedirs(extractor_directory, exist_ok=True)
-        self.extractor.save(extractor_directory)
+        if mode == 'incremental' and not data['feedback_samples']:
+            logger.info("증분 학습할 새 피드백이 없습니다.")
+            result.set_result(self.model_version)
+            return
         
-        # 각 모델 저장
-        for name, model in self.models.items():
-            model_path = os.path.join(model_directory, f"{name}_model.pkl")
-            model.save(model_path)
+        future = training.get_training_pool().submit(
+            training.run_training, self.config, self.bundle_store.root, mode, **data
+        )
+        future.add_done_callback(lambda done: self._on_training_done(done, mode, result))
     
-    def _get_confidence_scores(self, features: Dict[str, Any], predictions: Dict[str, str]) -> Dict[str, float]:
+    def _on_training_done(self, done: Future, mode: str, result: Future):
+        """
+        학습 프로세스 완료 처리: 새 번들을 로드한 뒤 교체
+        
+        Args:
+            done: 학습 프로세스 작업의 Future
+            mode: 학습 방식
+            result: 학습 결과를 전달할 Future
+        """
+        try:
+            version = done.result()
+        except ValueError as e:
+            if mode != 'incremental':
+                logger.error(f"모델 재학습 중 오류 발생: {str(e)}")
+                result.set_exception(e)
+                return
+            
+            logger.info(f"증분 학습을 할 수 없어 전체 재학습합니다: {str(e)}")
+            try:
+                self._submit_training('full', result)
+            except Exception as submit_error:
+                logger.error(f"모델 재학습 시작 중 오류 발생: {str(submit_error)}")
+                result.set_exception(submit_error)
+            return
+        except Exception as e:
+            logger.error(f"모델 재학습 중 오류 발생: {str(e)}")
+            result.set_exception(e)
+            return
+        
+        try:
+            # 완전히 로드한 뒤에만 교체
+            bundle = ModelBundle.load(self.bundle_store.path(version), self.config)
+            self._swap_bundle(bundle)
+            result.set_result(version)
+        except Exception as e:
+            logger.error(f"새 모델 번들 로드 중 오류 발생: {str(e)}")
+            result.set_exception(e)
+    
+    def _get_confidence_scores(self, predictions: Dict[str, str],
+                               probabilities: Dict[str, Dict[str, float]]) -> Dict[str, float]:
         """
         예측 신뢰도 점수 계산
         
         Args:
-            features: 특성 데이터
             predictions: 예측 결과
+            probabilities: 모델별 predict_with_confidence가 반환한 클래스별 확률
             
         Returns:
             각 예측의 신뢰도 점수
@@ -461,32 +741,32 @@ class AutoTaggingSystem:
         confidence = {}
         
         # 회사명 신뢰도
-        company_probs = self.models['company'].predict_proba(features)
-        predicted_company = predictions.get('company', '')
-        confidence['company'] = company_probs.get(predicted_company, 0.0)
+        confidence['company'] = probabilities['company'].get(predictions.get('company', ''), 0.0)
         
         # 카테고리 신뢰도
-        category_probs = self.models['category'].predict_proba(features)
-        predicted_category = predictions.get('category', '')
-        confidence['category'] = category_probs.get(predicted_category, 0.0)
+        confidence['category'] = probabilities['category'].get(predictions.get('category', ''), 0.0)
         
         # 태그 신뢰도 (첫 번째 태그의 신뢰도 사용)
-        tags_probs = self.models['tags'].predict_proba(features)
         predicted_tags = predictions.get('tags', '')
         if predicted_tags:
-            first_tag = predicted_tags.split('|')[0] if '|' in predicted_tags else predicted_tags
-            confidence['tags'] = tags_probs.get(first_tag, 0.0)
+            first_tag = predicted_tags.split('|')[0]
+            confidence['tags'] = probabilities['tags'].get(first_tag, 0.0)
         else:
             confidence['tags'] = 0.0
         
         # 전체 신뢰도 (가중 평균)
-        weights = {
-            'company': 0.3,
-            'category': 0.4, 
-            'tags': 0.3
-        }
-        
-        overall_score = sum(confidence[key] * weights[key] for key in confidence) / sum(weights.values())
-        confidence['overall'] = overall_score
+        confidence['overall'] = self._get_overall_confidence(confidence)
         
         return confidence
+    
+    def _get_overall_confidence(self, confidence: Dict[str, float]) -> float:
+        """
+        모델별 신뢰도의 가중 평균 계산
+        
+        Args:
+            confidence: 모델별 신뢰도 점수
+            
+        Returns:
+            전체 신뢰도 점수
+        """
+        return sum(confidence[key] * CONFIDENCE_WEIGHTS[key] for key in CONFIDENCE_WEIGHTS) / sum(CONFIDENCE_WEIGHTS.values())
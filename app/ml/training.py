@@ -0,0 +1,179 @@
+"""
+모델 학습 (번들 생성)
+
+학습은 서비스 중인 추출기와 모델을 수정하지 않고 항상 새 번들을 만듭니다.
+run_training은 학습 프로세스에서 실행되는 진입점으로, 번들을 저장하고 현재 번들로 지정한 뒤
+버전만 반환합니다. 서비스 쪽은 그 버전을 로드해 참조를 교체합니다.
+"""
+import os
+import copy
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+
+from app.ml.bundle import ModelBundle, BundleStore, create_components
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 학습 프로세스 풀 (처음 사용할 때 생성)
+_training_pool = None
+
+
+def _lower_priority():
+    """
+    학습 프로세스의 CPU 우선순위를 낮춤 (추론이 CPU를 먼저 쓰도록)
+    """
+    if hasattr(os, 'nice'):
+        os.nice(10)
+
+
+def get_training_pool() -> ProcessPoolExecutor:
+    """
+    학습 전용 프로세스 풀 (작업자 1개, spawn 방식, 낮은 CPU 우선순위)
+
+    Returns:
+        프로세스 풀
+    """
+    global _training_pool
+    if _training_pool is None:
+        _training_pool = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_lower_priority
+        )
+    return _training_pool
+
+
+def new_version(extractor_version: str) -> str:
+    """
+    새 번들 버전 생성 (학습 시각 + 추출기 버전)
+
+    Args:
+        extractor_version: 특성 추출기 버전
+
+    Returns:
+        번들 버전 문자열
+    """
+    return f"{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')}-{extractor_version[:8]}"
+
+
+def _labels(products: List[Dict[str, Any]], model_names) -> Dict[str, List[str]]:
+    """
+    모델별 레이블 목록 추출
+    """
+    return {name: [product.get(name, '') for product in products] for name in model_names}
+
+
+def train_full(config: Dict[str, Any], training_data: List[Dict[str, Any]],
+               trained_at: Optional[datetime] = None) -> ModelBundle:
+    """
+    특성 추출기와 모든 모델을 처음부터 학습
+
+    Args:
+        config: 자동 태깅 시스템 설정
+        training_data: 학습 데이터 (태깅된 제품 + 피드백 샘플)
+        trained_at: 학습 데이터 기준 시각
+
+    Returns:
+        새 번들
+    """
+    if not training_data:
+        raise ValueError("No training data available")
+
+    extractor, models = create_components(config)
+
+    # 특성 추출기 학습
+    extractor.fit(training_data)
+
+    # 각 모델 학습
+    features = [extractor.extract(product) for product in training_data]
+    labels = _labels(training_data, models)
+    for name, model in models.items():
+        model.fit(features, labels[name], text_feature_names=extractor.get_text_feature_names())
+        logger.info(f"{name} 모델 학습 완료")
+
+    return ModelBundle(new_version(extractor.version), extractor, models, trained_at)
+
+
+def train_incremental(base: ModelBundle, feedback_samples: List[Dict[str, Any]],
+                      trained_at: Optional[datetime] = None) -> ModelBundle:
+    """
+    기존 번들의 모델 복사본을 피드백 샘플로 증분 학습 (partial_fit)
+
+    특성 추출기는 다시 학습하지 않으므로 특성 공간이 유지됩니다.
+    (해싱 벡터라이저를 쓰면 새 단어도 특성에 반영됨)
+    학습 때 없던 레이블이 있거나 partial_fit을 지원하지 않는 모델이면 ValueError가 발생합니다.
+
+    Args:
+        base: 현재 번들
+        feedback_samples: 마지막 학습 이후의 피드백 샘플
+        trained_at: 학습 데이터 기준 시각
+
+    Returns:
+        새 번들 (base는 변경되지 않음)
+    """
+    if not feedback_samples:
+        raise ValueError("No feedback samples for incremental training")
+
+    features = [base.extractor.extract(product) for product in feedback_samples]
+    labels = _labels(feedback_samples, base.models)
+
+    models = {}
+    for name, model in base.models.items():
+        updated_model = copy.deepcopy(model)
+        updated_model.partial_fit(features, labels[name])
+        models[name] = updated_model
+
+    return ModelBundle(new_version(base.extractor.version), base.extractor, models, trained_at)
+
+
+def build_bundle(config: Dict[str, Any], mode: str, training_data: List[Dict[str, Any]],
+                 feedback_samples: List[Dict[str, Any]], trained_at: Optional[datetime] = None,
+                 base: Optional[ModelBundle] = None) -> ModelBundle:
+    """
+    학습 방식에 맞게 새 번들 생성
+
+    Args:
+        config: 자동 태깅 시스템 설정
+        mode: 'full' 또는 'incremental'
+        training_data: 전체 학습용 태깅 데이터 (증분 학습에서는 사용하지 않음)
+        feedback_samples: 피드백 샘플
+        trained_at: 학습 데이터 기준 시각
+        base: 증분 학습의 기준 번들
+
+    Returns:
+        새 번들
+    """
+    if mode == 'incremental':
+        return train_incremental(base, feedback_samples, trained_at)
+    return train_full(config, list(training_data or []) + list(feedback_samples or []), trained_at)
+
+
+def run_training(config: Dict[str, Any], model_directory: str, mode: str,
+                 training_data: List[Dict[str, Any]], feedback_samples: List[Dict[str, Any]],
+                 trained_at: Optional[datetime] = None) -> str:
+    """
+    학습 프로세스 진입점: 새 번들을 학습하고 저장한 뒤 현재 번들로 지정
+
+    Args:
+        config: 자동 태깅 시스템 설정
+        model_directory: 모델 디렉토리
+        mode: 'full' 또는 'incremental'
+        training_data: 전체 학습용 태깅 데이터
+        feedback_samples: 피드백 샘플
+        trained_at: 학습 데이터 기준 시각
+
+    Returns:
+        새 번들 버전
+    """
+    store = BundleStore(model_directory, keep=config.get('keep_bundles', 3))
+    base = store.load_current(config) if mode == 'incremental' else None
+
+    bundle = build_bundle(config, mode, training_data, feedback_samples, trained_at, base)
+    store.publish(bundle)
+
+    logger.info(f"모델 번들 학습 및 저장 완료 (버전: {bundle.version}, 방식: {mode})")
+    return bundle.version
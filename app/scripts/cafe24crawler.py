@@ -0,0 +1,268 @@
+from app.utils.logger import mainLogger
+from app.utils.http import create_session
+
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import threading
+import requests
+import time
+import json
+
+# 로거 정의
+logger = mainLogger()
+
+
+class Cafe24CallLimiter:
+    """
+    카페24 API 호출 제한(leaky bucket)을 응답 헤더 기반으로 추적하는 클래스입니다.
+
+    카페24는 X-Api-Call-Limit 헤더로 '사용량/버킷 크기'를 알려주며,
+    버킷은 초당 drain_rate 만큼 비워집니다.
+    버킷 사용률이 threshold를 넘으면 요청 전에 대기하여 429 응답을 피합니다.
+    """
+
+    def __init__(self, threshold: float = 0.8, drain_rate: float = 2.0, default_backoff: float = 1.0):
+        self.threshold = threshold
+        self.drain_rate = drain_rate
+        self.default_backoff = default_backoff
+
+        self._lock = threading.Lock()
+        self._used = 0.0
+        self._limit = None
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+
+    def _estimated_usage(self, now: float) -> float:
+        """
+        마지막 헤더 이후 흘러간 시간만큼 비워진 버킷 사용량을 추정합니다.
+        """
+        return max(0.0, self._used - (now - self._updated_at) * self.drain_rate)
+
+    def wait(self):
+        """
+        요청을 보내도 되는 시점까지 대기한 뒤 버킷 한 칸을 예약합니다.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                delay = self._paused_until - now
+
+                if delay <= 0 and self._limit:
+                    usage = self._estimated_usage(now)
+                    allowed = self._limit * self.threshold
+                    if usage + 1 > allowed:
+                        delay = (usage + 1 - allowed) / self.drain_rate
+
+                if delay <= 0:
+                    # 응답 헤더가 오기 전까지 동시 요청이 버킷을 넘지 않도록 미리 예약
+                    self._used = self._estimated_usage(now) + 1
+                    self._updated_at = now
+                    return
+
+            time.sleep(delay)
+
+    def update(self, response):
+        """
+        응답 헤더로 버킷 상태를 갱신합니다.
+        Args:
+            response (requests.Response): 카페24 API 응답
+        """
+        header = response.headers.get('X-Api-Call-Limit')
+
+        with self._lock:
+            now = time.monotonic()
+
+            if header:
+                try:
+                    used, limit = header.split('/')
+                    self._used = float(used)
+                    self._limit = float(limit)
+                    self._updated_at = now
+                except ValueError:
+                    logger.warning(f'X-Api-Call-Limit 헤더 형식이 올바르지 않습니다: {header}')
+
+            if response.status_code == 429:
+                retry_after = response.headers.get('Retry-After')
+                try:
+                    backoff = float(retry_after) if retry_after else self.default_backoff
+                except ValueError:
+                    backoff = self.default_backoff
+                self._paused_until = max(self._paused_until, now + backoff)
+
+
+class Cafe24ProductCrawler:
+    """
+    카페24 제품 목록을 병렬로 수집하는 크롤러 클래스입니다.
+
+    since_product_no 구간을 여러 개 동시에 요청하고,
+    keep-alive 커넥션 풀을 재사용합니다. 호출 제한은 Cafe24CallLimiter가 조절합니다.
+    5xx 응답과 연결 오류, 시간 초과는 지수 백오프로 재시도하고, 429 응답은 Cafe24CallLimiter가 정한 시간만큼 기다린 뒤 재시도합니다.
+    (재시도도 호출 제한 버킷을 거치도록 세션 어댑터 대신 fetch_page에서 재시도)
+    """
+
+    def __init__(self, mall_id: str, access_token: str, base_url: str = None, page_size: int = 100,
+                 max_workers: int = 4, max_retries: int = 5, backoff_factor: float = 0.5, timeout: float = 30,
+                 embed: str = 'options', session=None, limiter: Cafe24CallLimiter = None):
+        self.base_url = base_url if base_url else f'https://{mall_id}.cafe24api.com/api/v2/admin'
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.embed = embed
+
+        self.session = session if session else create_session(
+            pool_maxsize=max_workers,
+            headers={
+                'Authorization': f'Bearer {access_token}',
+                'Content-Type': 'application/json'
+            }
+        )
+        self.limiter = limiter if limiter else Cafe24CallLimiter()
+
+    def fetch_page(self, since_product_no: int, **filters) -> list:
+        """
+        since_product_no 이후의 제품 한 페이지를 가져오는 메소드입니다.
+        Args:
+            since_product_no (int): 조회 시작 상품 번호
+            filters: 추가 조회 조건 (updated_start_date 등)
+        Returns:
+            products (list): 제품 데이터 목록
+        """
+        params = {'since_product_no': since_product_no, 'limit': self.page_size, **filters}
+        if self.embed:
+            params['embed'] = self.embed
+
+        for attempt in range(1, self.max_retries + 1):
+            # 재시도 간 대기 시간 (backoff_factor * 2^(재시도 횟수 - 1)초)
+            backoff = self.backoff_factor * 2 ** (attempt - 1)
+
+            self.limiter.wait()
+            try:
+                response = self.session.get(f'{self.base_url}/products', params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                logger.warning(f'{since_product_no} 조회 재시도 ({attempt}/{self.max_retries}), 오류: {e}')
+                time.sleep(backoff)
+                continue
+            self.limiter.update(response)
+
+            if response.status_code == 429 or response.status_code >= 500:
+                if attempt == self.max_retries:
+                    break
+                logger.warning(f'{since_product_no} 조회 재시도 ({attempt}/{self.max_retries}), 상태 코드: {response.status_code}')
+                # 429는 Cafe24CallLimiter가 Retry-After만큼 대기
+                if response.status_code >= 500:
+                    time.sleep(backoff)
+                continue
+
+            response.raise_for_status()
+
+            if not response.text.strip():
+                return []
+
+            try:
+                return response.json().get('products', [])
+            except json.JSONDecodeError:
+                logger.error(f'{since_product_no} 조회 JSON 파싱 실패')
+                raise
+
+        response.raise_for_status()
+        return []
+
+    def iter_pages(self, start_no: int = 1):
+        """
+        제품 페이지를 순서대로 생성하는 제너레이터입니다.
+        max_workers 개의 구간을 미리 요청해두고, 완료되는 순서와 상관없이 구간 순서대로 반환합니다.
+
+        가득 찬 페이지를 받으면 그 페이지의 마지막 상품 번호까지는 모두 수집한 것이므로 다음 구간은 그 번호부터
+        시작하고, 구간 폭은 최근 페이지가 차지한 상품 번호 범위로 맞춥니다. (삭제된 상품으로 번호가 띄엄띄엄해도
+        요청 수가 제품 수에 비례하도록) 번호가 다시 촘촘해져 구간 사이가 비면 빈 부분부터 다시 조회합니다.
+        Args:
+            start_no (int): 조회 시작 상품 번호
+        Yields:
+            products (list): 구간에 속한 제품 데이터 목록
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = deque()
+            next_no = start_no
+            # 이 번호까지의 제품은 모두 반환함
+            covered = start_no
+            # 한 페이지가 차지하는 상품 번호 범위 (가득 찬 페이지를 받을 때마다 갱신)
+            span = self.page_size
+
+            def submit():
+                nonlocal next_no
+                since_no = max(next_no, covered)
+                in_flight.append((since_no, executor.submit(self.fetch_page, since_no)))
+                next_no = since_no + span
+
+            for _ in range(self.max_workers):
+                submit()
+
+            try:
+                while in_flight:
+                    since_no, future = in_flight.popleft()
+                    products = future.result()
+
+                    # 앞 페이지가 이 구간 시작 번호까지 닿지 못했으면 빈 부분부터 다시 조회
+                    if since_no > covered:
+                        since_no, products = covered, self.fetch_page(covered)
+
+                    logger.info(f'{since_no} 조회, 상품 수: {len(products)}')
+
+                    # 앞 페이지에서 이미 반환한 제품 제외
+                    new_products = [p for p in products if p['product_no'] > covered]
+
+                    # 마지막 페이지: 남은 제품이 모두 포함되어 있음
+                    if len(products) < self.page_size:
+                        yield new_products
+                        return
+
+                    last_no = max(p['product_no'] for p in products)
+                    span = max(self.page_size, last_no - since_no)
+                    covered = last_no
+                    yield new_products
+
+                    submit()
+            finally:
+                for _, future in in_flight:
+                    future.cancel()
+
+    def iter_filtered_pages(self, start_no: int = 1, **filters):
+        """
+        조회 조건에 맞는 제품 페이지를 순차적으로 생성하는 제너레이터입니다.
+        조건에 맞는 제품은 상품 번호가 드문드문하므로 구간 대신 마지막 상품 번호를 커서로 사용합니다.
+        Args:
+            start_no (int): 조회 시작 상품 번호
+            filters: 조회 조건 (updated_start_date, created_start_date 등)
+        Yields:
+            products (list): 제품 데이터 목록
+        """
+        since_no = start_no
+
+        while True:
+            products = self.fetch_page(since_no, **filters)
+
+            logger.info(f'{since_no} 이후 조건 조회 {filters}, 상품 수: {len(products)}')
+
+            yield products
+
+            if len(products) < self.page_size:
+                return
+
+            since_no = max(p['product_no'] for p in products)
+
+    def crawl(self, start_no: int = 1) -> list:
+        """
+        전체 제품 데이터를 가져오는 메소드입니다.
+        Args:
+            start_no (int): 조회 시작 상품 번호
+        Returns:
+            all_products (list): 제품 데이터 목록
+        """
+        all_products = []
+        for products in self.iter_pages(start_no):
+            all_products.extend(products)
+        return all_products
@@ -1,10 +1,9 @@
 from app.utils.logger import mainLogger
 from app.scripts.cafe24tokenmanager import TokenManager
+from app.scripts.cafe24crawler import Cafe24ProductCrawler
+from app.scripts.syncstatemanager import SyncStateManager
 from app.database.crud.product_crud import ProductCRUD
-from app.database.models import Product
 
-import requests
-import json
 import datetime
 
 # 로거 정의
@@ -13,6 +12,12 @@ logger = mainLogger()
 # 제품 데이터 관리 클래스   
 crud = ProductCRUD()
 
+# 카페24 API 기준 시간대 (KST)
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
+# 변경분 동기화 시 워터마크를 앞당기는 여유 시간
+SYNC_OVERLAP = datetime.timedelta(minutes=5)
+
 class Cafe24DataManager():
     """
     카페 24 관련 데이터를 처리하는 클래스입니다.
@@ -30,46 +35,85 @@ class Cafe24DataManager():
         returns:
             all_products (dict): 제품 데이터 객체
         """
-        token = TokenManager(config_prefix=seller_id)
+        all_products = []
+        for products in self.iter_product_pages(seller_id):
+            all_products.extend(products)
+
+        logger.info(f'전체 상품 수: {len(all_products)}')
+
+        return all_products
+
+    def _get_crawler(self, seller_id: str):
+        """
+        판매자 토큰으로 카페24 크롤러를 생성하는 메소드입니다.
+        """
+        token = TokenManager.for_seller(seller_id)
         access_token = token.get_access_token()
         logger.info(f'액세스 토큰: {access_token}')
 
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json'
-        }
+        return Cafe24ProductCrawler(mall_id=seller_id, access_token=access_token)
 
-        all_products = []
-        start_no = 1
-        limit = 100
+    def iter_product_pages(self, seller_id: str):
+        """
+        카페 24 전체 제품 데이터를 페이지 단위로 생성하는 제너레이터입니다.
+        Args:
+            seller_id (str): 카페24 스토어명입니다.
+        Yields:
+            products (list): 한 페이지의 제품 데이터 목록
+        """
+        yield from self._get_crawler(seller_id).iter_pages()
 
-        while True:
-            info = f'products?embed=options&since_product_no={start_no}&limit={limit}'
-            url = f'https://{seller_id}.cafe24api.com/api/v2/admin/{info}'
-            response = requests.get(url, headers=headers)
-
-            if response.status_code != 200 or not response.text.strip():
-                logger.info(f'response: {response.text}')
-                logger.error('응답이 비어 있습니다. 종료합니다.')
-                break
-            try:
-                data = response.json()
-            except json.JSONDecodeError:
-                logger.error('JSON 파싱 실패. 종료합니다.')
+    def iter_changed_product_pages(self, seller_id: str, since: datetime.datetime):
+        """
+        워터마크 이후 등록되거나 수정된 카페 24 제품 데이터를 페이지 단위로 생성하는 제너레이터입니다.
+        등록일/수정일 조건을 차례로 조회하므로 같은 제품이 두 번 나올 수 있습니다.
+        Args:
+            seller_id (str): 카페24 스토어명입니다.
+            since (datetime): 마지막 동기화 시각
+        Yields:
+            products (list): 한 페이지의 등록/수정된 제품 데이터 목록
+        """
+        crawler = self._get_crawler(seller_id)
+        since_date = since.isoformat(timespec='seconds')
 
-            products = data.get('products',[])
+        for date_filter in ('created_start_date', 'updated_start_date'):
+            yield from crawler.iter_filtered_pages(**{date_filter: since_date})
 
-            num_products = len(products)
-            all_products.extend(products)
+    def iter_sync_pages(self, seller_id: str, full: bool = False):
+        """
+        워터마크를 기준으로 동기화할 제품 페이지를 준비하는 메소드입니다.
+        워터마크가 없거나 full이 True이면 전체 제품을 가져옵니다.
+        Args:
+            seller_id (str): 카페24 스토어명입니다.
+            full (bool): 전체 동기화 여부
+        returns:
+            pages (generator): 제품 데이터 페이지 제너레이터
+            synced_at (datetime): 동기화가 끝난 뒤 저장할 다음 워터마크
+        """
+        sync_state = SyncStateManager(config_prefix=seller_id, platform='cafe24')
+        watermark = sync_state.get_watermark()
 
-            logger.info(f'{start_no} 조회, 상품 수: {num_products}')
+        # 시계 오차를 고려하여 워터마크를 약간 앞당겨 저장
+        synced_at = datetime.datetime.now(KST) - SYNC_OVERLAP
 
-            if num_products < limit:
-                break
+        if full or watermark is None:
+            logger.info(f'{seller_id} 전체 동기화를 진행합니다.')
+            pages = self.iter_product_pages(seller_id)
+        else:
+            logger.info(f'{seller_id} 변경분 동기화를 진행합니다. (워터마크: {watermark.isoformat()})')
+            pages = self.iter_changed_product_pages(seller_id, watermark)
 
-            start_no += limit
+        return pages, synced_at
 
-        return all_products
+    def save_sync_watermark(self, seller_id: str, synced_at: datetime.datetime):
+        """
+        동기화가 끝난 뒤 워터마크를 저장하는 메소드입니다.
+        Args:
+            seller_id (str): 카페24 스토어명입니다.
+            synced_at (datetime): iter_sync_pages가 반환한 워터마크
+        """
+        sync_state = SyncStateManager(config_prefix=seller_id, platform='cafe24')
+        sync_state.save_watermark(synced_at)
     
     def sort_products_data(self, all_products: dict, seller_id: str):
         """
@@ -121,24 +165,37 @@ class Cafe24DataManager():
         returns:
             filtered_products (list): 중복 제품을 제외한 제품 데이터 객체
         """
+        filtered_products, _ = self.split_duplicated_products(all_products, seller_id)
 
-        filtered_products = []
-        session = crud.db.get_session()
+        return filtered_products
 
-        db_products = session.query(Product.product_id).filter(
-            Product.platform == 'cafe24',
-            Product.seller_id == seller_id
-        ).all()
+    def split_duplicated_products(self, all_products: dict, seller_id: str):
+        """
+        제품을 DB에 없는 신규 제품과 이미 저장된 제품으로 나누는 메소드입니다.
+        Args:
+            all_products (dict): 제품 데이터 객체
+            seller_id (str): 카페24 스토어명입니다.
+        returns:
+            new_products (list): DB에 없는 제품 데이터 객체
+            existing_products (list): DB에 이미 있는 제품 데이터 객체
+        """
+
+        new_products = []
+        existing_products = []
 
-        db_product_ids = { pid for (pid,) in db_products }
+        db_product_ids = crud.get_existing_product_ids(
+            'cafe24',
+            seller_id,
+            [product['product_no'] for product in all_products]
+        )
 
         for product in all_products:
             if product['product_no'] not in db_product_ids:
-                filtered_products.append(product)
-
-        session.close()
+                new_products.append(product)
+            else:
+                existing_products.append(product)
 
-        return filtered_products
+        return new_products, existing_products
 
 
     def select_category(self):
@@ -1,17 +1,38 @@
 import requests, json
-from datetime import datetime
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import os
 import base64
+import threading
 from app.utils.logger import mainLogger
+from app.utils.filelock import FileLock
 
 # 환경 변수 로드
 load_dotenv()
 
 # 로거 설정
 logger = mainLogger()
+
+# 만료 시각보다 이만큼 먼저 토큰을 재발급
+REFRESH_MARGIN = timedelta(minutes=5)
+
 class TokenManager:
 
+    # 판매자별 공유 인스턴스
+    _instances = {}
+    _registry_lock = threading.Lock()
+
+    @classmethod
+    def for_seller(cls, config_prefix: str):
+        """
+        판매자별로 하나만 생성되는 공유 토큰 매니저를 반환합니다.
+        토큰을 메모리에 유지하므로 호출할 때마다 토큰 파일을 다시 읽거나 클라이언트 정보를 인코딩하지 않습니다.
+        """
+        with cls._registry_lock:
+            if config_prefix not in cls._instances:
+                cls._instances[config_prefix] = cls(config_prefix=config_prefix)
+            return cls._instances[config_prefix]
+
     def __init__(self, config_prefix: str, code=None, mall_id=None, filename=None, redirect_uri=None):
 
         self.config_prefix = config_prefix
@@ -31,6 +52,9 @@ class TokenManager:
         self.base64encode_atr = self.encode_client()
         self.tokens = self.load_tokens()
 
+        # 같은 프로세스 안의 동시 재발급 방지 (프로세스 간에는 FileLock 사용)
+        self._lock = threading.RLock()
+
     def get_auth_code(self):
         """
         최초 인증 코드를 받기 위한 함수입니다.
@@ -87,8 +111,9 @@ class TokenManager:
         except Exception as e:
             logger.info(f'토큰 발급 실패 {str(e)}')
 
-        with open(filename,'w') as json_file:
-            json.dump(tokens, json_file, indent=4)
+        with FileLock(filename):
+            self.tokens = tokens
+            self.save_token()
 
         return access_token
 
@@ -107,14 +132,24 @@ class TokenManager:
     def save_token(self):
         """
         토큰 파일을 저장, 업데이트합니다.
+        임시 파일에 쓴 뒤 교체하므로 다른 프로세스가 쓰다 만 파일을 읽지 않습니다.
         """
-        with open(self.filename, 'w') as json_file:
+        temp_filename = f'{self.filename}.{os.getpid()}.tmp'
+        with open(temp_filename, 'w') as json_file:
             json.dump(self.tokens, json_file, indent=4)
+        os.replace(temp_filename, self.filename)
 
     def refresh_access_token(self):
         """
         리프레시 토큰을 기반으로 토큰을 재발급받습니다.
         """
+        with self._lock, FileLock(self.filename):
+            return self._refresh_access_token()
+
+    def _refresh_access_token(self):
+        """
+        잠금을 얻은 상태에서 토큰을 재발급하고 파일에 저장합니다.
+        """
         url = f'https://{self.mall_id}.cafe24api.com/api/v2/oauth/token'
         payload = f"grant_type=refresh_token&refresh_token={self.tokens['refresh_token']}"
         headers = {
@@ -145,27 +180,42 @@ class TokenManager:
             if isinstance(value, datetime):
                 return value
             return datetime.fromisoformat(value)
-        except ValueError:
+        except (TypeError, ValueError):
             return None
         
+    def is_token_fresh(self, now=None):
+        """
+        메모리에 있는 엑세스 토큰이 만료 여유 시간 이전인지 확인합니다.
+        """
+        now = now if now else datetime.now()
+        expires_at = self.is_valid_datetime((self.tokens or {}).get('expires_at'))
+        return bool(expires_at) and now < expires_at - REFRESH_MARGIN
+
     def get_access_token(self):
         """
         유효한 엑세스 토큰을 반환하거나 새로 발급받습니다.
+        만료 5분 전부터 재발급하며, 재발급은 프로세스 내 잠금과 토큰 파일 잠금을 얻은 뒤
+        파일을 다시 읽어 다른 프로세스가 이미 재발급했는지 확인하고 진행합니다.
         """
-        now = datetime.now()
-        logger.info(f'현재 시각: {now}')
-
-        # 기존 접속 토큰의 유효성 확인
-        expires_at = self.is_valid_datetime(self.tokens.get('expires_at'))
-        if expires_at and now < expires_at:
-            logger.info(f'토큰이 유효합니다.')
+        # 유효한 토큰이 메모리에 있으면 잠금 없이 반환
+        if self.is_token_fresh():
             return self.tokens['access_token']
 
-        # 리프레시 토큰 유효성 확인
-        refresh_token_expires_at = self.is_valid_datetime(self.tokens.get('refresh_token_expires_at'))
-        if refresh_token_expires_at and now < refresh_token_expires_at:
-            logger.info('리프레시 토큰으로 재발급을 시도합니다.')
-            return self.refresh_access_token()
-        
-        raise Exception('리프레시 토큰도 만료되었습니다. 신규 인증을 진행하세요.')
+        with self._lock, FileLock(self.filename):
+            # 다른 스레드/프로세스가 먼저 재발급했을 수 있으므로 파일을 다시 읽음
+            self.tokens = self.load_tokens() or self.tokens or {}
+
+            now = datetime.now()
+            logger.info(f'현재 시각: {now}')
+
+            if self.is_token_fresh(now):
+                logger.info(f'토큰이 유효합니다.')
+                return self.tokens['access_token']
 
+            # 리프레시 토큰 유효성 확인
+            refresh_token_expires_at = self.is_valid_datetime(self.tokens.get('refresh_token_expires_at'))
+            if refresh_token_expires_at and now < refresh_token_expires_at:
+                logger.info('리프레시 토큰으로 재발급을 시도합니다.')
+                return self._refresh_access_token()
+
+        raise Exception('리프레시 토큰도 만료되었습니다. 신규 인증을 진행하세요.')
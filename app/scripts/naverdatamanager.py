@@ -1,5 +1,6 @@
 from app.utils.logger import mainLogger
 from app.scripts.navertokenmanager import NaverTokenManager
+from app.scripts.naverfetcher import NaverProductDetailFetcher
 from app.database.crud.product_crud import ProductCRUD
 import datetime
 import requests
@@ -11,14 +12,24 @@ logger = mainLogger()
 # 제품 데이터 관리 클래스
 crud = ProductCRUD()
 
+# 네이버커머스 API 주소
+NAVER_API_URL = 'https://api.commerce.naver.com/external/v1'
+
 class NaverDataManager:
     """
     네이버커머스 스마트스토어 관련 데이터를 처리하는 클래스입니다.
     """
 
-    def __init__(self):
+    def __init__(self, api_url: str = NAVER_API_URL):
         self.logger = logger
-        self.url = 'https://api.commerce.naver.com/external/v1/products/'
+        self.api_url = api_url
+        self.url = f'{api_url}/products/'
+
+    def _get_token_manager(self, config_prefix: str):
+        """
+        API 주소에 맞는 토큰 매니저를 생성하는 메소드입니다.
+        """
+        return NaverTokenManager(config_prefix=config_prefix, token_url=f'{self.api_url}/oauth2/token')
 
     def get_all_products_list(self, config_prefix: str):
         """
@@ -27,9 +38,22 @@ class NaverDataManager:
             all_products_list (list): 네이버커머스 스마트스토어 전체 제품 목록
         """
 
-        token = NaverTokenManager(config_prefix=config_prefix)
-
         all_products_list = []
+
+        for data in self.iter_products_list_pages(config_prefix):
+            all_products_list.extend(data)
+
+        return all_products_list
+
+    def iter_products_list_pages(self, config_prefix: str):
+        """
+        네이버커머스 스마트스토어 전체 제품 목록을 페이지 단위로 생성하는 제너레이터입니다.
+        Yields:
+            data (list): 한 페이지의 제품 목록
+        """
+
+        token = self._get_token_manager(config_prefix)
+
         page = 0
         limit = 500
 
@@ -55,47 +79,34 @@ class NaverDataManager:
 
             logger.info(f'{page}페이지 조회, 상품 수: {len(data)}')
 
-            all_products_list.extend(data)
+            yield data
 
             if len(data) < limit:
                 break
 
             page += 1
 
-        return all_products_list
-    
-            
-
-    def get_product_data(self, all_products_list: list, config_prefix: str):
+    def get_product_data(self, all_products_list: list, config_prefix: str, max_workers: int = 8):
         """
         all_products_list를 기반으로 네이버커머스 제품 데이터를 가져오는 메소드입니다.
+        토큰은 한 번만 발급받아 재사용하고, 제품 상세는 max_workers 개씩 동시에 조회합니다.
         Args:
             all_products_list (list): 네이버커머스 제품 ID 리스트
+            config_prefix (str): 판매자 ID
+            max_workers (int): 동시 요청 수
         Returns:
             product_data (list): 네이버커머스 제품 데이터
         """
 
-        token = NaverTokenManager(config_prefix=config_prefix)
-
-        product_data = []
-
-        for channel_product_number in all_products_list:
-            url = f'{self.url}{channel_product_number}'
-
-            payload = {}
-            headers = {
-                'Accept': 'application/json;charset=UTF-8',
-                'Authorization': f'Bearer {token.get_access_token()}'
-            }
+        token = self._get_token_manager(config_prefix)
+        access_token = token.get_access_token()
 
-            response = requests.request('GET',url,headers=headers,data=payload)
-            response.raise_for_status()
-            data = response.text
+        if not access_token:
+            raise RuntimeError(f'{config_prefix} 네이버 토큰 발급에 실패했습니다.')
 
-            product_data.append(data)
+        fetcher = NaverProductDetailFetcher(access_token, base_url=self.url, max_workers=max_workers)
 
-        return product_data
-            
+        return fetcher.fetch_all(all_products_list)
 
     def sort_product_data(self, product_data: dict, config_prefix: str):
         """
@@ -0,0 +1,66 @@
+from app.utils.logger import mainLogger
+from app.utils.http import create_session
+
+from concurrent.futures import ThreadPoolExecutor
+
+# 로거 정의
+logger = mainLogger()
+
+
+class NaverProductDetailFetcher:
+    """
+    네이버커머스 제품 상세 데이터를 병렬로 가져오는 클래스입니다.
+
+    발급받은 액세스 토큰 하나를 모든 요청에 재사용하고, keep-alive 커넥션 풀을 공유합니다.
+    429/5xx 응답은 세션 어댑터가 지수 백오프로 재시도합니다.
+    """
+
+    def __init__(self, access_token: str, base_url: str, max_workers: int = 8, max_retries: int = 3,
+                 backoff_factor: float = 0.5, session=None):
+        """
+        Args:
+            access_token (str): 네이버커머스 액세스 토큰
+            base_url (str): 제품 API 주소 (예: https://api.commerce.naver.com/external/v1/products/)
+            max_workers (int): 동시 요청 수
+            max_retries (int): 429/5xx 응답 시 재시도 횟수
+            backoff_factor (float): 재시도 간 지수 백오프 계수
+            session (requests.Session, optional): 재사용할 세션
+        """
+        self.base_url = base_url
+        self.max_workers = max_workers
+
+        self.session = session if session else create_session(
+            pool_maxsize=max_workers,
+            headers={
+                'Accept': 'application/json;charset=UTF-8',
+                'Authorization': f'Bearer {access_token}'
+            },
+            retries=max_retries,
+            backoff_factor=backoff_factor
+        )
+
+    def fetch(self, channel_product_number) -> str:
+        """
+        제품 하나의 상세 데이터를 가져오는 메소드입니다.
+        Args:
+            channel_product_number (int): 채널 상품 번호
+        Returns:
+            data (str): 제품 상세 데이터 (JSON 문자열)
+        """
+        response = self.session.get(f'{self.base_url}{channel_product_number}')
+        response.raise_for_status()
+        return response.text
+
+    def fetch_all(self, channel_product_numbers: list) -> list:
+        """
+        여러 제품의 상세 데이터를 max_workers 개씩 동시에 가져오는 메소드입니다.
+        Args:
+            channel_product_numbers (list): 채널 상품 번호 목록
+        Returns:
+            product_data (list): 입력 순서와 같은 순서의 제품 상세 데이터 목록
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            product_data = list(executor.map(self.fetch, channel_product_numbers))
+
+        logger.info(f'네이버커머스 제품 상세 {len(product_data)}개 조회 완료')
+        return product_data
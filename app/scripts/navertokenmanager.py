@@ -1,65 +1,156 @@
 import time
+import threading
 import requests
 import bcrypt
 import pybase64
 import os
-import urllib.parse
 from app.utils.logger import mainLogger
 
 logger = mainLogger()
 
+# 토큰 발급 API 주소
+NAVER_TOKEN_URL = 'https://api.commerce.naver.com/external/v1/oauth2/token'
+
+# 만료 몇 초 전부터 백그라운드 재발급을 시작할지
+REFRESH_MARGIN = 600
+
+# 응답에 expires_in이 없을 때 사용할 토큰 유효 시간 (3시간)
+DEFAULT_EXPIRES_IN = 10800
+
+
 class NaverTokenManager:
     """
     네이버 토큰 매니저 클래스입니다.
+
+    발급받은 토큰은 판매자(config_prefix)별로 프로세스 전체에서 공유하는 캐시에 만료 시각과 함께 저장합니다.
+    만료가 가까워지면 기존 토큰을 그대로 반환하면서 백그라운드에서 재발급하고,
+    같은 판매자에 대한 동시 재발급 요청은 하나로 합칩니다.
+    전자서명(bcrypt)은 실제 발급 시점에만 계산합니다.
     """
-    def __init__(self, config_prefix: str):
+
+    # {(config_prefix, token_url): (access_token, expires_at, issued_at)}
+    _cache = {}
+    # {(config_prefix, token_url): threading.Lock}
+    _locks = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, config_prefix: str, token_url: str = NAVER_TOKEN_URL):
         """
         네이버 토큰 매니저 초기화 함수
+        Args:
+            config_prefix (str): 판매자 ID
+            token_url (str): 토큰 발급 API 주소
         """
         self.config_prefix = config_prefix
-        
-        self.timestamp = str(int(time.time() * 1000))
+        self.token_url = token_url
+
         self.client_id = os.getenv(f'{self.config_prefix}_NAVER_CLIENT_ID')
         self.client_secret = os.getenv(f'{self.config_prefix}_NAVER_CLIENT_SECRET')
-        self.client_id_timestamp = self.client_id + "_" + self.timestamp
-        self.hashed_info = bcrypt.hashpw(self.client_id_timestamp.encode('utf-8'), self.client_secret.encode('utf-8'))
-        self.signature = pybase64.b64encode(self.hashed_info).decode('utf-8')
 
-        logger.info(f'생성된 네이버 토큰 전자서명: {self.signature}')
+        self._key = (config_prefix, token_url)
+        with NaverTokenManager._registry_lock:
+            self._lock = NaverTokenManager._locks.setdefault(self._key, threading.Lock())
 
+    @classmethod
+    def clear_cache(cls):
+        """
+        캐시된 토큰을 모두 삭제합니다.
+        """
+        with cls._registry_lock:
+            cls._cache.clear()
 
-    # 어차피 3시간마다 발급하면 되니까 굳이 재발급 로직은 필요 없을 듯 싶음.
-    def get_access_token(self):
+    def create_signature(self, timestamp: str) -> str:
         """
-        네이버 토큰 엑세스 토큰을 반환하는 함수입니다.
+        토큰 발급용 전자서명을 생성하는 함수입니다.
+        Args:
+            timestamp (str): 밀리초 단위 타임스탬프
         Returns:
-            access_token (str): 네이버 토큰 엑세스 토큰
-            expires_in (int): 토큰 만료 시간
+            signature (str): base64 인코딩된 bcrypt 서명
+        """
+        client_id_timestamp = self.client_id + "_" + timestamp
+        hashed_info = bcrypt.hashpw(client_id_timestamp.encode('utf-8'), self.client_secret.encode('utf-8'))
+        return pybase64.b64encode(hashed_info).decode('utf-8')
+
+    def request_access_token(self):
+        """
+        네이버 토큰 발급 API를 호출하는 함수입니다.
+        Returns:
+            access_token (str): 네이버 토큰 엑세스 토큰 (실패 시 None)
+            expires_in (int): 토큰 만료 시간(초)
         """
+        timestamp = str(int(time.time() * 1000))
+        signature = self.create_signature(timestamp)
 
         headers = {'Content-Type': 'application/x-www-form-urlencoded',
                    'Accept': 'application/json'}
 
         payload = {'client_id': self.client_id,
-                   'timestamp': self.timestamp,
-                   'client_secret_sign': self.signature,
+                   'timestamp': timestamp,
+                   'client_secret_sign': signature,
                    'grant_type': 'client_credentials',
                    'type': 'SELF'}
-        
-        url = f'https://api.commerce.naver.com/external/v1/oauth2/token'
 
-        response = requests.request('POST', url, headers=headers, data=payload)
+        response = requests.request('POST', self.token_url, headers=headers, data=payload)
         if response.status_code == 200:
             data = response.json()
             access_token = data.get('access_token')
-            logger.info(f'네이버 토큰 발급 성공: {access_token}')
-            return access_token
+            logger.info(f'{self.config_prefix} 네이버 토큰 발급 성공')
+            return access_token, int(data.get('expires_in', DEFAULT_EXPIRES_IN))
         else:
             logger.error(f'네이버 토큰 발급 실패: {response.text}')
-            return None
+            return None, 0
+
+    def refresh(self):
+        """
+        토큰을 재발급하여 캐시에 저장하는 함수입니다.
+        이미 다른 스레드가 재발급 중이면 끝날 때까지 기다린 뒤 그 결과를 사용합니다.
+        Returns:
+            access_token (str): 네이버 토큰 엑세스 토큰 (실패 시 None)
+        """
+        issued_before = time.time()
 
+        with self._lock:
+            # 기다리는 동안 다른 스레드가 새 토큰을 발급했으면 그대로 사용
+            cached = NaverTokenManager._cache.get(self._key)
+            if cached and cached[2] >= issued_before:
+                return cached[0]
 
+            try:
+                access_token, expires_in = self.request_access_token()
+            except requests.RequestException as e:
+                logger.error(f'네이버 토큰 발급 요청 실패: {e}')
+                access_token, expires_in = None, 0
 
+            if not access_token:
+                return cached[0] if cached and time.time() < cached[1] else None
 
+            now = time.time()
+            NaverTokenManager._cache[self._key] = (access_token, now + expires_in, now)
+            return access_token
+
+    def _refresh_in_background(self):
+        """
+        재발급 중이 아닐 때만 백그라운드 스레드에서 토큰을 재발급합니다.
+        """
+        if self._lock.locked():
+            return
+
+        threading.Thread(target=self.refresh, daemon=True, name=f'naver-token-{self.config_prefix}').start()
+
+    def get_access_token(self):
+        """
+        네이버 토큰 엑세스 토큰을 반환하는 함수입니다.
+        캐시된 토큰이 유효하면 바로 반환하고, 만료가 가까우면 백그라운드 재발급을 시작합니다.
+        캐시가 없거나 만료된 경우에만 발급이 끝날 때까지 기다립니다.
+        Returns:
+            access_token (str): 네이버 토큰 엑세스 토큰
+        """
+        cached = NaverTokenManager._cache.get(self._key)
+        now = time.time()
 
+        if cached and now < cached[1]:
+            if now >= cached[1] - REFRESH_MARGIN:
+                self._refresh_in_background()
+            return cached[0]
 
+        return self.refresh()
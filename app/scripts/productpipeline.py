@@ -0,0 +1,91 @@
+from app.utils.logger import mainLogger
+from app.database.crud.product_crud import ProductCRUD
+
+# 로거 정의
+logger = mainLogger()
+
+# 제품 데이터 관리 클래스
+crud = ProductCRUD()
+
+class ProductIngestPipeline:
+    """
+    플랫폼 API에서 받은 제품 페이지를 바로 데이터베이스에 기록하는 스트리밍 파이프라인 클래스입니다.
+
+    페이지 수집 -> 정규화 -> 일괄 upsert를 페이지 단위로 처리하므로
+    카탈로그 크기와 상관없이 한 페이지 분량만 메모리에 유지합니다.
+    """
+
+    def __init__(self, seller_id: str, normalize, update_existing: bool = True, batch_size: int = 1000):
+        """
+        Args:
+            seller_id (str): 판매자 ID (config_prefix)
+            normalize (callable): (products, seller_id) -> DB 저장용 제품 데이터 목록
+            update_existing (bool): 이미 저장된 제품의 원본 데이터를 갱신할지 여부
+            batch_size (int): 한 번의 INSERT 구문에 담을 제품 수
+        """
+        self.seller_id = seller_id
+        self.normalize = normalize
+        self.update_existing = update_existing
+        self.batch_size = batch_size
+
+    def iter_batches(self, pages):
+        """
+        제품 페이지를 DB 저장용 정규화 데이터 묶음으로 변환하는 제너레이터입니다.
+        Args:
+            pages (iterable): 플랫폼 제품 데이터 페이지
+        Yields:
+            products (list): 저장할 제품 데이터 목록
+        """
+        for products in pages:
+            if not products:
+                continue
+
+            yield self.normalize(products, self.seller_id)
+
+    def run(self, pages) -> dict:
+        """
+        파이프라인을 실행하고 처리 결과를 반환합니다.
+        Args:
+            pages (iterable): 플랫폼 제품 데이터 페이지
+        Returns:
+            stats (dict): 페이지 수, 신규 저장 수, 갱신 수
+        """
+        stats = {'pages': 0, 'inserted': 0, 'updated': 0}
+
+        for products in self.iter_batches(pages):
+            result = crud.bulk_upsert_products(
+                products,
+                batch_size=self.batch_size,
+                update_existing=self.update_existing
+            )
+            stats['inserted'] += result['inserted']
+            stats['updated'] += result['updated']
+
+            stats['pages'] += 1
+            logger.info(f"{self.seller_id} {stats['pages']}페이지 저장 완료 (누적 신규 {stats['inserted']}개, 갱신 {stats['updated']}개)")
+
+        return stats
+
+    def backfill(self, pages) -> dict:
+        """
+        판매자 최초 등록용 백필 모드입니다.
+        모든 페이지를 하나의 COPY 스트림으로 임시 테이블에 적재한 뒤 한 번에 병합합니다.
+        페이지는 COPY가 읽는 시점에 가져오므로 메모리에는 한 페이지 분량만 유지합니다.
+        Args:
+            pages (iterable): 플랫폼 제품 데이터 페이지
+        Returns:
+            stats (dict): 페이지 수, 신규 저장 수, 갱신 수
+        """
+        stats = {'pages': 0, 'inserted': 0, 'updated': 0}
+
+        def rows():
+            for products in self.iter_batches(pages):
+                stats['pages'] += 1
+                logger.info(f"{self.seller_id} {stats['pages']}페이지 적재 중")
+                yield from products
+
+        result = crud.backfill_products(rows(), update_existing=self.update_existing)
+        stats['inserted'] = result['inserted']
+        stats['updated'] = result['updated']
+
+        return stats
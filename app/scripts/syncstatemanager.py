@@ -0,0 +1,63 @@
+import json
+import os
+from datetime import datetime
+from app.utils.logger import mainLogger
+
+# 로거 설정
+logger = mainLogger()
+
+class SyncStateManager:
+    """
+    판매자별 동기화 워터마크(마지막 동기화 시각)를 파일로 관리하는 클래스입니다.
+    토큰 파일과 마찬가지로 {config_prefix}_sync_state.json 파일에 플랫폼별로 저장합니다.
+    """
+
+    def __init__(self, config_prefix: str, platform: str, filename=None):
+
+        self.config_prefix = config_prefix
+        self.platform = platform
+        self.filename = filename if filename else f'{self.config_prefix}_sync_state.json'
+        self.state = self.load_state()
+
+    def load_state(self):
+        """
+        동기화 상태 파일을 로드합니다.
+        """
+        try:
+            with open(self.filename, 'r') as json_file:
+                return json.load(json_file)
+        except FileNotFoundError:
+            logger.info(f'동기화 상태 파일이 없습니다. 전체 동기화가 필요합니다.')
+        except json.JSONDecodeError:
+            logger.error(f'올바른 json 파일 형식이 아닙니다.')
+        return {}
+
+    def get_watermark(self):
+        """
+        마지막 동기화 시각을 반환합니다.
+        Returns:
+            watermark (datetime|None): 마지막 동기화 시각, 기록이 없으면 None
+        """
+        value = self.state.get(self.platform, {}).get('last_synced_at')
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            logger.error(f'워터마크 형식이 올바르지 않습니다: {value}')
+            return None
+
+    def save_watermark(self, synced_at: datetime):
+        """
+        동기화 시각을 저장합니다. 임시 파일에 쓴 뒤 교체하여 파일이 깨지지 않도록 합니다.
+        Args:
+            synced_at (datetime): 이번 동기화를 시작한 시각
+        """
+        self.state.setdefault(self.platform, {})['last_synced_at'] = synced_at.isoformat()
+
+        temp_filename = f'{self.filename}.tmp'
+        with open(temp_filename, 'w') as json_file:
+            json.dump(self.state, json_file, indent=4)
+        os.replace(temp_filename, self.filename)
+
+        logger.info(f'{self.config_prefix} {self.platform} 워터마크 저장: {synced_at.isoformat()}')
@@ -0,0 +1,96 @@
+"""
+분류기 백엔드 벤치마크
+
+같은 합성 데이터를 학습/평가용으로 나눠 백엔드별로 다음을 비교합니다.
+- 학습: train_full (추출기 + 세 모델) 소요 시간
+- 추론: 제품 하나를 태깅하는 시간 (특성 추출 + 회사명/카테고리/태그 predict, 평가 데이터 평균)
+- 크기: 저장된 번들 디렉토리 크기
+- 정확도: 평가 데이터에서 회사명/카테고리 정확도, 태그 집합 일치율
+
+판매명에서 제조사 이름을 일부 제품(--hide-company 비율)에서 지워 회사명 예측이 쉽지 않게 합니다.
+
+실행: python -m app.tests.backend_benchmark [--size 2000] [--test-ratio 0.2] [--hide-company 0.3]
+"""
+
+import os
+import time
+import random
+import argparse
+import tempfile
+
+from app.ml.training import train_full
+from app.tests.ml_benchmark_data import make_products
+
+BACKENDS = {
+    'random_forest': {'backend': 'random_forest', 'n_estimators': 100},
+    'sgd': {'backend': 'sgd'},
+    'logistic_regression': {'backend': 'logistic_regression'},
+}
+
+
+def make_dataset(size: int, hide_company: float):
+    rng = random.Random(7)
+    products = make_products(size, seed=1)
+    for product in products:
+        if rng.random() < hide_company:
+            product['sale_name'] = product['sale_name'].replace(product['company'], '').strip()
+    return products
+
+
+def directory_size(directory: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, names in os.walk(directory) for name in names)
+
+
+def measure(name: str, train: list, test: list):
+    model_config = BACKENDS[name]
+    config = {'company_model': model_config, 'category_model': model_config, 'tags_model': model_config}
+
+    start = time.perf_counter()
+    bundle = train_full(config, train)
+    train_seconds = time.perf_counter() - start
+
+    # 추출 캐시가 추론 시간에 섞이지 않도록 평가 데이터는 한 번씩만 추출
+    start = time.perf_counter()
+    results = []
+    for product in test:
+        features = bundle.extractor.extract(product)
+        category = bundle.models['category'].predict(features)
+        results.append((
+            bundle.models['company'].predict(features),
+            category,
+            bundle.models['tags'].predict(features, category)
+        ))
+    predict_ms = (time.perf_counter() - start) / len(test) * 1000
+
+    with tempfile.TemporaryDirectory() as directory:
+        bundle.save(directory)
+        size_mb = directory_size(directory) / 1024 / 1024
+
+    company_accuracy = sum(r[0] == p['company'] for r, p in zip(results, test)) / len(test)
+    category_accuracy = sum(r[1] == p['category'] for r, p in zip(results, test)) / len(test)
+    tags_accuracy = sum(set(filter(None, r[2].split('|'))) == set(filter(None, p['tags'].split('|')))
+                        for r, p in zip(results, test)) / len(test)
+
+    print(f"{name:20s} | 학습 {train_seconds:7.2f}s | 추론 {predict_ms:7.2f}ms/건 | 크기 {size_mb:7.1f}MB | "
+          f"정확도 회사명 {company_accuracy:.3f} 카테고리 {category_accuracy:.3f} 태그 {tags_accuracy:.3f}")
+
+
+def main(size: int, test_ratio: float, hide_company: float, backends: list):
+    products = make_dataset(size, hide_company)
+    split = int(len(products) * (1 - test_ratio))
+    train, test = products[:split], products[split:]
+
+    for name in backends:
+        measure(name, train, test)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=2000)
+    parser.add_argument('--test-ratio', type=float, default=0.2)
+    parser.add_argument('--hide-company', type=float, default=0.3)
+    parser.add_argument('--backends', nargs='+', default=list(BACKENDS), choices=list(BACKENDS))
+    args = parser.parse_args()
+
+    main(args.size, args.test_ratio, args.hide_company, args.backends)
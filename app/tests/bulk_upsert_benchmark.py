@@ -0,0 +1,107 @@
+"""
+제품 일괄 저장 벤치마크
+
+PG_* 환경 변수가 가리키는 데이터베이스에 가상의 판매자로 10,000개 제품을 저장하면서
+기존 방식(create_product 반복, 제품당 1트랜잭션), bulk_upsert_products, backfill_products(COPY)를 비교합니다.
+벤치마크가 끝나면 저장한 제품을 삭제합니다.
+측정 중에는 create_product가 제품마다 남기는 INFO 로그가 로그 파일에 쌓이지 않도록 Management 로거를 WARNING으로 낮춥니다.
+
+실행: python -m app.tests.bulk_upsert_benchmark [--rows 10000] [--batch-size 1000]
+"""
+
+import argparse
+import logging
+import time
+
+from app.database.crud.product_crud import ProductCRUD
+from app.database.models import Product
+from app.utils.logger import mainLogger
+
+logger = mainLogger()
+
+crud = ProductCRUD()
+
+PLATFORM = 'benchmark'
+
+
+def make_products(seller_id: str, count: int, payload: int = 50) -> list:
+    """
+    sort_products_data 결과와 같은 형태의 가상 제품 데이터를 생성합니다.
+    """
+    return [
+        {
+            'platform': PLATFORM,
+            'seller_id': seller_id,
+            'product_id': product_id,
+            'sale_name': f'벤치마크 제품 {product_id}',
+            'data': {
+                'product_no': product_id,
+                'price': '10000.00',
+                'description': '<p>상세 설명</p>' * payload,
+                'options': {'has_option': 'F'}
+            }
+        }
+        for product_id in range(1, count + 1)
+    ]
+
+
+def cleanup(seller_id: str):
+    """
+    벤치마크용 제품을 삭제합니다.
+    """
+    session = crud.db.get_session()
+    try:
+        session.query(Product).filter(
+            Product.platform == PLATFORM,
+            Product.seller_id == seller_id
+        ).delete(synchronize_session=False)
+        session.commit()
+    finally:
+        session.close()
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    duration = time.perf_counter() - start
+    return label, duration, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--payload', type=int, default=50, help='data JSON 크기 배수')
+    parser.add_argument('--skip-loop', action='store_true', help='create_product 반복 측정 생략')
+    args = parser.parse_args()
+
+    results = []
+
+    # 제품마다 남는 INFO 로그 생략 (결과 출력 전에 원래 수준으로 되돌림)
+    management_logger = logging.getLogger('Management')
+    log_level = management_logger.level
+    management_logger.setLevel(logging.WARNING)
+
+    try:
+        for seller_id in ('loop', 'bulk', 'copy'):
+            cleanup(seller_id)
+
+        if not args.skip_loop:
+            products = make_products('loop', args.rows, args.payload)
+            results.append(timed('create_product 반복', lambda: [crud.create_product(p) for p in products] and None))
+
+        products = make_products('bulk', args.rows, args.payload)
+        results.append(timed('bulk_upsert (신규)', lambda: crud.bulk_upsert_products(products, batch_size=args.batch_size)))
+        results.append(timed('bulk_upsert (갱신)', lambda: crud.bulk_upsert_products(products, batch_size=args.batch_size)))
+
+        # 제너레이터로 전달하여 COPY 스트리밍 경로를 그대로 측정
+        results.append(timed('backfill COPY (신규)', lambda: crud.backfill_products(iter(make_products('copy', args.rows, args.payload)))))
+        results.append(timed('backfill COPY (갱신)', lambda: crud.backfill_products(iter(make_products('copy', args.rows, args.payload)))))
+
+    finally:
+        for seller_id in ('loop', 'bulk', 'copy'):
+            cleanup(seller_id)
+        management_logger.setLevel(log_level)
+
+    for label, duration, result in results:
+        logger.info(f'{label} | {args.rows}개 | {duration:.2f}초 | {args.rows / duration:.0f} rows/sec | {result if result else ""}')
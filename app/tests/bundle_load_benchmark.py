@@ -0,0 +1,116 @@
+"""
+모델 번들 콜드 로드 벤치마크
+
+같은 번들을 pickle 형식(이전 방식)과 pickle 없는 형식(manifest + 메모리 맵 배열)으로 저장한 뒤,
+새 프로세스에서 각각 로드하는 데 걸리는 시간과 메모리(RSS 증가량, 최대 RSS)를 비교합니다.
+
+실행: python -m app.tests.bundle_load_benchmark [--size 2000] [--trees 100] [--repeat 3]
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+import tempfile
+import time
+
+from app.ml.bundle import ModelBundle, BUNDLE_META_FILE
+from app.ml.training import train_full
+from app.tests.ml_benchmark_data import make_products
+
+
+def save_pickle(bundle: ModelBundle, directory: str):
+    """
+    pickle 형식으로 번들 저장 (구성 요소별 save + bundle.json)
+    """
+    os.makedirs(directory, exist_ok=True)
+    bundle.extractor.save(os.path.join(directory, 'extractors'))
+    for name, model in bundle.models.items():
+        model.save(os.path.join(directory, f"{name}_model.pkl"))
+    with open(os.path.join(directory, BUNDLE_META_FILE), 'w') as f:
+        json.dump({'version': bundle.version, 'trained_at': None}, f)
+
+
+def read_memory() -> dict:
+    """
+    현재 프로세스의 RSS와 최대 RSS (KB, /proc/self/status)
+    """
+    memory = {}
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(('VmRSS:', 'VmHWM:')):
+                name, value = line.split(':')
+                memory[name] = int(value.split()[0])
+    return memory
+
+
+def load_once(directory: str, config: dict):
+    """
+    (자식 프로세스) 번들을 로드하고 결과를 JSON으로 출력
+    """
+    before = read_memory()
+    start = time.perf_counter()
+    ModelBundle.load(directory, config)
+    duration = time.perf_counter() - start
+    after = read_memory()
+
+    print(json.dumps({
+        'seconds': duration,
+        'rss_delta_kb': after['VmRSS'] - before['VmRSS'],
+        'peak_kb': after['VmHWM']
+    }))
+
+
+def directory_size(directory: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, names in os.walk(directory) for name in names)
+
+
+def measure(name: str, directory: str, config: dict, repeat: int):
+    results = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-m', 'app.tests.bundle_load_benchmark', '--load', directory,
+             '--config', json.dumps(config)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    best = min(results, key=lambda result: result['seconds'])
+    print(f"{name:8s} | 파일 {directory_size(directory) / 1024 / 1024:7.1f}MB | "
+          f"로드 {best['seconds']:7.3f}s | RSS 증가 {best['rss_delta_kb'] / 1024:7.1f}MB | "
+          f"최대 RSS {best['peak_kb'] / 1024:7.1f}MB")
+
+
+def main(size: int, trees: int, repeat: int):
+    config = {
+        'company_model': {'n_estimators': trees},
+        'category_model': {'n_estimators': trees},
+        'tags_model': {'n_estimators': trees}
+    }
+    bundle = train_full(config, make_products(size, seed=1))
+
+    with tempfile.TemporaryDirectory() as root:
+        pickle_directory = os.path.join(root, 'pickle')
+        manifest_directory = os.path.join(root, 'manifest')
+        save_pickle(bundle, pickle_directory)
+        bundle.save(manifest_directory)
+
+        measure('pickle', pickle_directory, config, repeat)
+        measure('manifest', manifest_directory, config, repeat)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=2000)
+    parser.add_argument('--trees', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--load')
+    parser.add_argument('--config', default='{}')
+    args = parser.parse_args()
+
+    if args.load:
+        load_once(args.load, json.loads(args.config))
+    else:
+        main(args.size, args.trees, args.repeat)
@@ -0,0 +1,142 @@
+"""
+카페24 제품 API 목 서버
+
+크롤러 테스트 및 벤치마크에서 사용하는 로컬 HTTP 서버입니다.
+since_product_no/limit 페이지네이션과 X-Api-Call-Limit 헤더(leaky bucket)를 흉내냅니다.
+"""
+
+import bisect
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+
+class MockCafe24Server:
+    """
+    카페24 제품 목록 API 목 서버 클래스입니다.
+    """
+
+    def __init__(self, product_count: int = 1000, product_gap: int = 1, bucket_size: int = 40,
+                 drain_rate: float = 2.0, latency: float = 0.0, changed_product_nos: list = None):
+        """
+        Args:
+            product_count (int): 제공할 제품 수
+            product_gap (int): 상품 번호 간격 (1보다 크면 번호가 띄엄띄엄 존재)
+            bucket_size (int): 호출 제한 버킷 크기
+            drain_rate (float): 초당 버킷이 비워지는 호출 수
+            latency (float): 요청당 인위적인 지연 시간(초)
+            changed_product_nos (list): 날짜 조건(updated_start_date 등) 조회 시 반환할 상품 번호
+        """
+        self.product_nos = [1 + i * product_gap for i in range(1, product_count + 1)]
+        self.changed_product_nos = sorted(changed_product_nos) if changed_product_nos else []
+        self.bucket_size = bucket_size
+        self.drain_rate = drain_rate
+        self.latency = latency
+
+        self.request_count = 0
+        self.throttled_count = 0
+
+        self._lock = threading.Lock()
+        self._bucket = 0.0
+        self._bucket_updated_at = time.monotonic()
+        self._server = None
+        self._thread = None
+
+    def _take_call(self):
+        """
+        버킷에 호출 한 건을 추가하고 (허용 여부, 현재 사용량)을 반환합니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._bucket = max(0.0, self._bucket - (now - self._bucket_updated_at) * self.drain_rate)
+            self._bucket_updated_at = now
+            self.request_count += 1
+
+            if self._bucket + 1 > self.bucket_size:
+                self.throttled_count += 1
+                return False, int(self._bucket)
+
+            self._bucket += 1
+            return True, int(self._bucket)
+
+    def _get_products(self, since_product_no: int, limit: int, date_filtered: bool = False) -> list:
+        """
+        since_product_no 이후 limit 개의 제품을 반환합니다.
+        """
+        product_nos = self.changed_product_nos if date_filtered else self.product_nos
+        start = bisect.bisect_right(product_nos, since_product_no)
+        products = []
+        for product_no in product_nos[start:start + limit]:
+            products.append({
+                'product_no': product_no,
+                'product_name': f'테스트 상품 {product_no}',
+                'product_tag': [],
+                'options': {'has_option': 'F', 'options': []}
+            })
+        return products
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+
+                allowed, usage = server._take_call()
+                if not allowed:
+                    body = json.dumps({'error': {'code': 429, 'message': 'Too Many Requests'}}).encode('utf-8')
+                    self.send_response(429)
+                else:
+                    query = parse_qs(urlparse(self.path).query)
+                    since_product_no = int(query.get('since_product_no', ['0'])[0])
+                    limit = int(query.get('limit', ['100'])[0])
+                    date_filtered = 'updated_start_date' in query or 'created_start_date' in query
+                    products = server._get_products(since_product_no, limit, date_filtered)
+                    body = json.dumps({'products': products}, ensure_ascii=False).encode('utf-8')
+                    self.send_response(200)
+
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('X-Api-Call-Limit', f'{usage}/{server.bucket_size}')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> str:
+        """
+        서버를 백그라운드 스레드에서 시작합니다.
+        Returns:
+            base_url (str): 크롤러에 전달할 API 기본 URL
+        """
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        host, port = self._server.server_address
+        return f'http://{host}:{port}/api/v2/admin'
+
+    def stop(self):
+        """
+        서버를 종료합니다.
+        """
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.base_url = self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,59 @@
+"""
+특성 추출 마이크로벤치마크
+
+학습 데이터 전체를 extract로 변환해 리스트에 보관하는 학습 패스(_train_initial_models와 같은 방식)에서
+제품당 추출 시간과 메모리(tracemalloc)를 측정합니다.
+'이전'은 extract마다 get_feature_names_out()으로 어휘 목록을 만들어 특성 딕셔너리에 붙이던 방식입니다.
+
+실행: python -m app.tests.extract_benchmark [--rows 10000] [--max-features 1000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from app.ml.extractors.combined import CombinedExtractor
+from app.tests.ml_benchmark_data import make_products
+
+
+def legacy_extract(extractor: CombinedExtractor, product: dict) -> dict:
+    """
+    이전 방식: 제품마다 전체 어휘 목록을 새로 만들어 특성에 포함
+    """
+    features = extractor.extract(product)
+    features['text']['text_feature_names'] = extractor.text_extractor.vectorizer.get_feature_names_out().tolist()
+    return features
+
+
+def measure(name: str, extract, products: list):
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    features = [extract(product) for product in products]
+
+    duration = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'{name:<4} | 제품당 {duration / len(products) * 1e6:8.1f}us | 전체 {duration:6.2f}s '
+          f'| 보관 메모리 {current / 1024 / 1024:8.1f}MB | 최대 {peak / 1024 / 1024:8.1f}MB')
+    return features
+
+
+def main(rows: int, max_features: int):
+    products = make_products(rows, seed=1)
+    extractor = CombinedExtractor({'text': {'max_features': max_features}})
+    extractor.fit(products)
+
+    print(f'제품 {rows}개, 텍스트 특성 {len(extractor.get_text_feature_names())}개')
+    measure('이전', lambda product: legacy_extract(extractor, product), products)
+    measure('현재', extractor.extract, products)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--max-features', type=int, default=1000)
+    args = parser.parse_args()
+
+    main(args.rows, args.max_features)
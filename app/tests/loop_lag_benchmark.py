@@ -0,0 +1,87 @@
+"""
+이벤트 루프 지연 벤치마크
+
+auto_tag_batch와 비슷한 작업(제품마다 RandomForest 추론 + DB 커밋)을
+코루틴 안에서 직접 실행할 때와 ml_runner(전용 스레드 풀)로 넘길 때
+이벤트 루프 지연(heartbeat latency)을 비교합니다.
+
+실행: python -m app.tests.loop_lag_benchmark [--products 200] [--commit-ms 5] [--interval 0.01]
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+from app.utils.executor import BlockingTaskRunner
+from app.utils.looplag import LoopLagMonitor
+
+
+def build_model(n_features: int = 300, n_classes: int = 20) -> RandomForestClassifier:
+    """
+    태깅 모델과 비슷한 크기의 RandomForest를 학습합니다.
+    """
+    rng = np.random.default_rng(0)
+    X = rng.random((2000, n_features))
+    y = rng.integers(0, n_classes, 2000)
+    return RandomForestClassifier(n_estimators=100, random_state=42).fit(X, y)
+
+
+def batch_tag(model, rows, commit_seconds: float) -> int:
+    """
+    batch_tag_products처럼 제품을 하나씩 예측하고 커밋합니다.
+    """
+    for row in rows:
+        model.predict_proba(row.reshape(1, -1))
+        time.sleep(commit_seconds)
+    return len(rows)
+
+
+async def measure(name: str, job, interval: float) -> dict:
+    """
+    job을 실행하는 동안 루프 지연을 측정합니다.
+    """
+    monitor = LoopLagMonitor(interval=interval, window=100000).start()
+    await asyncio.sleep(interval * 5)
+
+    start = time.perf_counter()
+    await job()
+    duration = time.perf_counter() - start
+
+    await asyncio.sleep(interval * 5)
+    monitor.stop()
+
+    stats = monitor.stats()
+    print(f"{name:<10} 소요 {duration:6.2f}s | 루프 지연 평균 {stats['avg_ms']:7.1f}ms, "
+          f"p99 {stats['p99_ms']:7.1f}ms, 최대 {stats['max_ms']:7.1f}ms ({stats['count']}회 측정)")
+    return stats
+
+
+async def main(products: int, commit_ms: float, interval: float):
+    model = build_model()
+    rows = np.random.default_rng(1).random((products, model.n_features_in_))
+    commit_seconds = commit_ms / 1000
+    runner = BlockingTaskRunner('bench', max_workers=1, max_pending=4)
+
+    async def inline():
+        batch_tag(model, rows, commit_seconds)
+
+    async def offloaded():
+        await runner.run(batch_tag, model, rows, commit_seconds)
+
+    print(f'제품 {products}개, 커밋 {commit_ms}ms, 측정 간격 {interval * 1000:.0f}ms')
+    await measure('루프 직접', inline, interval)
+    await measure('ml_runner', offloaded, interval)
+    runner.shutdown()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--products', type=int, default=200)
+    parser.add_argument('--commit-ms', type=float, default=5)
+    parser.add_argument('--interval', type=float, default=0.01)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.products, args.commit_ms, args.interval))
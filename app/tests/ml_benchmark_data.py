@@ -0,0 +1,144 @@
+"""
+자동 태깅 벤치마크/테스트용 합성 제품 데이터
+
+실제 판매명과 비슷한 형태(제조사 + 카테고리 키워드 + 옵션)의 제품을 만들고,
+AutoTaggingSystem에 db_connection으로 넘길 수 있는 메모리 저장소를 제공합니다.
+"""
+
+import random
+from datetime import datetime
+from types import SimpleNamespace
+
+COMPANIES = ['베이프랩', '스모크', '긱베이프', '부푸', '유웰', '아스파이어', '이지스', '쥴', '릴', '한빛액상',
+             '미스터솔트', '네이키드', '쿨민트랩', '다크호스', '제이웰']
+
+CATEGORY_WORDS = {
+    '액상': (['입호흡액상', '폐호흡액상'], ['액상', '솔트', '프리베이스', '30ml', '60ml', '3mg', '6mg', '9.8mg']),
+    '기기': (['입호흡기기', '폐호흡기기', 'AIO기기'], ['기기', '킷', '모드', '배터리내장', '1500mAh']),
+    '무화기': (['RTA', 'RDA', '기성탱크'], ['무화기', '탱크', '24mm', '리빌드']),
+    '코일': ([], ['코일', '0.6옴', '0.8옴', '1.2옴', '메쉬']),
+    '팟': (['일체형팟', '공팟'], ['팟', '카트리지', '2ml']),
+    '일회용기기': (['일체형', '교체형'], ['일회용', '퍼프', '5000퍼프']),
+    '악세사리': (['드립팁', '케이스', '충전기'], ['악세사리', '실리콘', 'C타입']),
+}
+
+OPTIONS = ['멘솔', '과일', '디저트', '연초', '쿨', '무향', '블랙', '실버', '블루', '레드']
+
+FLAVORS = ['딸기', '포도', '망고', '청포도', '복숭아', '레몬', '수박', '바닐라', '커피', '아이스티', '자몽', '블루베리']
+
+
+def make_product(product_id: int, rng: random.Random, tagged: bool = True) -> dict:
+    """
+    합성 제품 하나를 생성합니다.
+    """
+    company = rng.choice(COMPANIES)
+    category = rng.choice(list(CATEGORY_WORDS))
+    subtags, words = CATEGORY_WORDS[category]
+    options = rng.sample(OPTIONS, rng.randint(0, 2))
+
+    sale_name = ' '.join([company] + rng.sample(words, min(len(words), rng.randint(1, 3)))
+                         + rng.sample(FLAVORS, rng.randint(0, 2)) + options)
+    tags = '|'.join(([rng.choice(subtags)] if subtags else []) + options)
+
+    platform = 'cafe24' if product_id % 2 else 'naverCommerce'
+    if platform == 'cafe24':
+        data = {
+            'product_tag': options,
+            'options': {'has_option': 'T' if options else 'F', 'options': [{'option_value': options}]}
+        }
+    else:
+        data = {
+            'channelProducts': [{
+                'manufacturerName': company,
+                'brandName': company if rng.random() < 0.5 else None,
+                'categoryId': '50000000',
+                'sellerTags': [{'text': option} for option in options]
+            }]
+        }
+
+    now = datetime.utcnow()
+    return {
+        'id': product_id,
+        'sale_name': sale_name,
+        'platform': platform,
+        'seller_id': 'BENCHMARK',
+        'category': category if tagged else None,
+        'tags': tags if tagged else None,
+        'company': company if tagged else None,
+        'product_name': sale_name if tagged else None,
+        'data': data,
+        'created_at': now,
+        'updated_at': now
+    }
+
+
+def make_products(count: int, seed: int = 0, tagged: bool = True, start_id: int = 1) -> list:
+    """
+    합성 제품 목록을 생성합니다.
+    """
+    rng = random.Random(seed)
+    return [make_product(start_id + i, rng, tagged) for i in range(count)]
+
+
+class InMemoryProductStore:
+    """
+    ProductCRUD와 같은 메소드를 제공하는 메모리 저장소입니다.
+    """
+
+    def __init__(self, products: list):
+        self.products = {product['id']: dict(product) for product in products}
+        self.feedback = []
+        self.predictions = []
+
+    def get_product(self, product_id):
+        product = self.products.get(product_id)
+        return SimpleNamespace(**product) if product else None
+
+    def get_products_by_ids(self, product_ids, chunk_size=1000):
+        return [SimpleNamespace(id=p['id'], sale_name=p['sale_name'], platform=p['platform'], data=p['data'])
+                for p in (self.products.get(i) for i in dict.fromkeys(product_ids)) if p]
+
+    def get_tagged_products(self, limit=200):
+        return [dict(p) for p in self.products.values() if p['tags'] and p['category'] and p['company']][:limit]
+
+    def get_untagged_products(self, seller_id=None, limit=100):
+        return [dict(p) for p in self.products.values() if not (p['tags'] and p['category'] and p['company'])][:limit]
+
+    def update_product_tags(self, product_id, company=None, category=None, tags=None, product_name=None):
+        product = self.products.get(product_id)
+        if not product:
+            return False
+        for key, value in (('company', company), ('category', category), ('tags', tags), ('product_name', product_name)):
+            if value is not None:
+                product[key] = value
+        return True
+
+    def save_tag_prediction(self, product_id, model_version, predictions, confidence_scores):
+        self.predictions.append({
+            'product_id': product_id,
+            'model_version': model_version,
+            'predictions': dict(predictions),
+            'confidence_scores': dict(confidence_scores),
+            'created_at': datetime.utcnow()
+        })
+        return True
+
+    def save_tag_predictions(self, records):
+        created_at = datetime.utcnow()
+        self.predictions.extend(dict(record, created_at=created_at) for record in records)
+        return True
+
+    def get_latest_tag_prediction(self, product_id):
+        records = [r for r in self.predictions if r['product_id'] == product_id]
+        return records[-1] if records else None
+
+    def save_feedback(self, feedback_data):
+        self.feedback.append(dict(feedback_data))
+        return True
+
+    def get_feedback(self, since=None, limit=None):
+        feedback = [f for f in self.feedback if since is None or f['timestamp'] > since]
+        return feedback[:limit] if limit else feedback
+
+    def count_feedback(self, since=None):
+        return len(self.get_feedback(since=since))
@@ -0,0 +1,73 @@
+"""
+네이버커머스 제품 상세 조회 벤치마크
+
+목 서버를 대상으로 기존 방식(제품마다 토큰 발급 후 순차 조회)과
+NaverDataManager.get_product_data(토큰 1회 발급, 커넥션 풀, 병렬 조회)의 요청 수와 소요 시간을 비교합니다.
+
+실행: python -m app.tests.naver_fetcher_benchmark [--products 500] [--latency 0.02] [--workers 8]
+"""
+
+import argparse
+import os
+import time
+
+import bcrypt
+import requests
+
+from app.scripts.naverdatamanager import NaverDataManager
+from app.tests.naver_mock_server import MockNaverServer
+from app.utils.logger import mainLogger
+
+logger = mainLogger()
+
+CONFIG_PREFIX = 'BENCHMARK'
+
+
+def fetch_sequential(naver: NaverDataManager, product_nos: list) -> list:
+    """
+    기존 get_product_data와 같은 방식입니다. 제품마다 토큰을 발급받고(캐시 없이) 새 커넥션으로 조회합니다.
+    """
+    token = naver._get_token_manager(CONFIG_PREFIX)
+    product_data = []
+
+    for channel_product_number in product_nos:
+        headers = {
+            'Accept': 'application/json;charset=UTF-8',
+            'Authorization': f'Bearer {token.request_access_token()[0]}'
+        }
+        response = requests.request('GET', f'{naver.url}{channel_product_number}', headers=headers, data={})
+        response.raise_for_status()
+        product_data.append(response.text)
+
+    return product_data
+
+
+def run(label: str, fetch, product_count: int, latency: float):
+    with MockNaverServer(latency=latency, token_latency=latency) as server:
+        naver = NaverDataManager(api_url=server.api_url)
+        product_nos = list(range(1, product_count + 1))
+
+        start = time.perf_counter()
+        product_data = fetch(naver, product_nos)
+        duration = time.perf_counter() - start
+
+    logger.info(
+        f'{label} | 제품 {len(product_data)}개 | {duration:.2f}초 | '
+        f'요청 {server.request_count}회 (토큰 {server.token_count}회, 상세 {server.detail_count}회)'
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--products', type=int, default=500)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    os.environ.setdefault(f'{CONFIG_PREFIX}_NAVER_CLIENT_ID', 'benchmark')
+    os.environ.setdefault(f'{CONFIG_PREFIX}_NAVER_CLIENT_SECRET', bcrypt.gensalt(rounds=4).decode('utf-8'))
+
+    run('기존 순차 조회', fetch_sequential, args.products, args.latency)
+    run(f'병렬 조회 workers={args.workers}',
+        lambda naver, product_nos: naver.get_product_data(product_nos, CONFIG_PREFIX, max_workers=args.workers),
+        args.products, args.latency)
@@ -0,0 +1,136 @@
+"""
+네이버커머스 API 목 서버
+
+네이버 토큰/제품 상세 API 테스트 및 벤치마크에서 사용하는 로컬 HTTP 서버입니다.
+토큰 발급(POST /oauth2/token)과 제품 상세 조회(GET /products/{번호}) 요청 수를 따로 집계하고,
+일정 간격으로 429/503 응답을 돌려주어 재시도 로직을 확인할 수 있습니다.
+"""
+
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+class MockNaverServer:
+    """
+    네이버커머스 API 목 서버 클래스입니다.
+    """
+
+    def __init__(self, latency: float = 0.0, token_latency: float = 0.0, fail_every: int = 0,
+                 fail_status: int = 503, expires_in: int = 10800):
+        """
+        Args:
+            latency (float): 제품 상세 요청당 인위적인 지연 시간(초)
+            token_latency (float): 토큰 발급 요청당 인위적인 지연 시간(초)
+            fail_every (int): n번째 제품 상세 요청마다 실패 응답 (0이면 실패 없음)
+            fail_status (int): 실패 응답 상태 코드
+            expires_in (int): 발급 토큰 유효 시간(초)
+        """
+        self.latency = latency
+        self.token_latency = token_latency
+        self.fail_every = fail_every
+        self.fail_status = fail_status
+        self.expires_in = expires_in
+
+        self.token_count = 0
+        self.detail_count = 0
+        self.failed_count = 0
+
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def request_count(self) -> int:
+        return self.token_count + self.detail_count
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # 헤더와 본문이 따로 전송될 때 Nagle 알고리즘으로 인한 지연 방지
+            disable_nagle_algorithm = True
+
+            def _send_json(self, status: int, payload: dict, headers: dict = None):
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                self.rfile.read(length)
+
+                if server.token_latency:
+                    time.sleep(server.token_latency)
+
+                with server._lock:
+                    server.token_count += 1
+                    token_no = server.token_count
+
+                self._send_json(200, {
+                    'access_token': f'token-{token_no}',
+                    'expires_in': server.expires_in,
+                    'token_type': 'Bearer'
+                })
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+
+                with server._lock:
+                    server.detail_count += 1
+                    failed = server.fail_every and server.detail_count % server.fail_every == 0
+                    if failed:
+                        server.failed_count += 1
+
+                if failed:
+                    self._send_json(server.fail_status, {'code': 'ERROR'}, {'Retry-After': '0'})
+                    return
+
+                channel_product_no = int(self.path.rstrip('/').rsplit('/', 1)[-1])
+                self._send_json(200, {
+                    'originProduct': {'name': f'테스트 상품 {channel_product_no}'},
+                    'smartstoreChannelProduct': {'channelProductNo': channel_product_no}
+                })
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> str:
+        """
+        서버를 백그라운드 스레드에서 시작합니다.
+        Returns:
+            api_url (str): NaverDataManager에 전달할 API 기본 URL
+        """
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        host, port = self._server.server_address
+        return f'http://{host}:{port}/external/v1'
+
+    def stop(self):
+        """
+        서버를 종료합니다.
+        """
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.api_url = self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,72 @@
+"""
+재학습 시간 벤치마크
+
+피드백 임계값(20개)에 도달했을 때 _retrain_models에 걸리는 시간을 학습 데이터 크기별로 비교합니다.
+- 전체: TF-IDF + RandomForest, 추출기와 모든 모델을 retraining_limit 행으로 다시 학습 (기본 설정)
+- 증분: 해싱 벡터라이저 + SGD, 마지막 학습 이후 피드백만 partial_fit
+
+실행: python -m app.tests.retrain_benchmark [--sizes 1000 2000 5000] [--feedback 20] [--trees 100]
+"""
+
+import argparse
+import tempfile
+import time
+
+from app.ml.tagger import AutoTaggingSystem
+from app.tests.ml_benchmark_data import InMemoryProductStore, make_products
+
+MODES = {
+    '전체': lambda trees: {
+        'training_mode': 'full',
+        'company_model': {'n_estimators': trees},
+        'category_model': {'n_estimators': trees},
+        'tags_model': {'n_estimators': trees}
+    },
+    '증분': lambda trees: {
+        'training_mode': 'incremental',
+        'extractor': {'text': {'vectorizer': 'hashing'}},
+        'company_model': {'backend': 'sgd'},
+        'category_model': {'backend': 'sgd'},
+        'tags_model': {'backend': 'sgd'}
+    },
+}
+
+
+def measure(name: str, size: int, feedback_count: int, trees: int):
+    products = make_products(size, seed=1)
+    store = InMemoryProductStore(products)
+
+    with tempfile.TemporaryDirectory() as model_directory:
+        config = dict(MODES[name](trees), model_directory=model_directory,
+                      initial_training_limit=size, retraining_limit=size)
+        tagger = AutoTaggingSystem(config=config, db_connection=store)
+
+        # 기존 레이블로 수정한 피드백 (증분 학습 가능한 범위)
+        for product in make_products(feedback_count, seed=2):
+            tagger.feedback_system.record_feedback(
+                (product['id'] % size) + 1,
+                {},
+                {'company': product['company'], 'category': product['category'], 'tags': product['tags']}
+            )
+
+        start = time.perf_counter()
+        tagger._retrain_models()
+        duration = time.perf_counter() - start
+
+    print(f'{name} | 학습 데이터 {size:6d}행 | 재학습 {duration:8.3f}s')
+
+
+def main(sizes: list, feedback_count: int, trees: int):
+    for size in sizes:
+        for name in MODES:
+            measure(name, size, feedback_count, trees)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 2000, 5000])
+    parser.add_argument('--feedback', type=int, default=20)
+    parser.add_argument('--trees', type=int, default=100)
+    args = parser.parse_args()
+
+    main(args.sizes, args.feedback, args.trees)
@@ -0,0 +1,64 @@
+"""
+희소 특성 행렬 벤치마크
+
+같은 학습 데이터로 만든 특성 행렬을 밀집 배열(이전 방식)과 CSR 희소 행렬(현재 방식)로
+모델에 넣었을 때의 메모리, RandomForest 학습/추론 시간을 비교합니다.
+
+실행: python -m app.tests.sparse_features_benchmark [--rows 10000] [--max-features 1000] [--trees 100]
+"""
+
+import argparse
+import time
+
+from sklearn.ensemble import RandomForestClassifier
+
+from app.ml.extractors.combined import CombinedExtractor
+from app.tests.ml_benchmark_data import make_products
+
+
+def nbytes(X) -> int:
+    """
+    행렬이 차지하는 메모리(바이트)
+    """
+    if hasattr(X, 'indptr'):
+        return X.data.nbytes + X.indices.nbytes + X.indptr.nbytes
+    return X.nbytes
+
+
+def measure(name: str, X, y, X_predict, trees: int):
+    model = RandomForestClassifier(n_estimators=trees, random_state=42, class_weight='balanced', n_jobs=1)
+
+    start = time.perf_counter()
+    model.fit(X, y)
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model.predict_proba(X_predict)
+    predict_seconds = time.perf_counter() - start
+
+    print(f'{name:<6} | 특성 행렬 {nbytes(X) / 1024 / 1024:8.2f}MB | 학습 {fit_seconds:6.2f}s '
+          f'| 추론({X_predict.shape[0]}개) {predict_seconds:6.3f}s')
+
+
+def main(rows: int, max_features: int, trees: int):
+    products = make_products(rows, seed=1)
+    extractor = CombinedExtractor({'text': {'max_features': max_features}})
+    extractor.fit(products)
+
+    X = extractor.extract_matrix(products)
+    y = [product['company'] for product in products]
+    X_predict = X[:1000]
+
+    print(f'제품 {rows}개, 특성 {X.shape[1]}개, 0이 아닌 값 비율 {X.nnz / (X.shape[0] * X.shape[1]):.2%}')
+    measure('밀집', X.toarray(), y, X_predict.toarray(), trees)
+    measure('CSR', X, y, X_predict, trees)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--max-features', type=int, default=1000)
+    parser.add_argument('--trees', type=int, default=100)
+    args = parser.parse_args()
+
+    main(args.rows, args.max_features, args.trees)
@@ -0,0 +1,91 @@
+"""
+봇 시작 시간 벤치마크
+
+새 프로세스에서 자동 태깅 코그(app.bot.cogs.autotagcommands)를 로드하는 데 걸리는 시간을 측정합니다.
+코그 로드는 setup_hook 안에서 실행되므로 이 시간만큼 on_ready가 늦어집니다.
+- 코그 로드: 프로세스 시작부터 load_extension 완료까지 (on_ready 지연에 해당)
+- 모델 준비: 프로세스 시작부터 태거가 명령을 처리할 수 있을 때까지
+- sklearn: 코그 로드 직후 sklearn이 이미 import되어 있는지 여부
+
+임시 디렉토리에 학습된 모델 번들(./models)을 만들어 두고 실행하므로 DB 없이 측정할 수 있습니다.
+(DB 환경 변수는 CRUD 객체 생성에만 쓰이며 연결하지 않음)
+
+실행: python -m app.tests.startup_benchmark [--repeat 3] [--trees 100]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import subprocess
+import tempfile
+
+START = time.perf_counter()
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+async def measure_child() -> dict:
+    """
+    (자식 프로세스) 코그를 로드하고 준비될 때까지 기다린 뒤 시간 반환
+    """
+    import discord
+    from discord.ext import commands
+
+    bot = commands.Bot(command_prefix=';;', intents=discord.Intents.all())
+    async with bot:
+        await bot.load_extension('app.bot.cogs.autotagcommands')
+        loaded = time.perf_counter() - START
+        sklearn_loaded = 'sklearn' in sys.modules
+
+        cog = bot.get_cog('AutoTaggingCommands')
+        service = getattr(cog, 'tagger_service', None)
+        while service is not None and not service.is_ready:
+            await asyncio.sleep(0.01)
+        ready = time.perf_counter() - START
+
+        await bot.remove_cog('AutoTaggingCommands')
+
+    return {'loaded': loaded, 'ready': ready, 'sklearn': sklearn_loaded}
+
+
+def prepare_models(directory: str, trees: int):
+    from app.ml.bundle import BundleStore
+    from app.ml.training import train_full
+    from app.tests.ml_benchmark_data import make_products
+
+    config = {name: {'n_estimators': trees} for name in ('company_model', 'category_model', 'tags_model')}
+    BundleStore(os.path.join(directory, 'models')).publish(train_full(config, make_products(2000, seed=1)))
+
+
+def main(repeat: int, trees: int):
+    with tempfile.TemporaryDirectory() as directory:
+        prepare_models(directory, trees)
+
+        env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+        results = []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, '-m', 'app.tests.startup_benchmark', '--child'],
+                cwd=directory, env=env, check=True, capture_output=True, text=True
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+    for result in results:
+        print(f"코그 로드 {result['loaded']:6.2f}s | 모델 준비 {result['ready']:6.2f}s | "
+              f"코그 로드 시 sklearn import {'예' if result['sklearn'] else '아니오'}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--trees', type=int, default=100)
+    parser.add_argument('--child', action='store_true')
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(measure_child())))
+    else:
+        main(args.repeat, args.trees)
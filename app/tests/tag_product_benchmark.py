@@ -0,0 +1,55 @@
+"""
+제품 단건 자동 태깅(tag_product) 지연 시간 벤치마크
+
+!auto_tag 명령어가 호출하는 tag_product의 제품당 소요 시간을 측정합니다.
+특성 추출 캐시의 영향을 없애기 위해 측정 전에 모든 제품의 특성을 한 번씩 추출해 둡니다.
+
+실행: python -m app.tests.tag_product_benchmark [--train 500] [--count 50] [--trees 100]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+
+from app.ml.tagger import AutoTaggingSystem
+from app.tests.ml_benchmark_data import InMemoryProductStore, make_products
+
+
+def main(train_size: int, count: int, trees: int):
+    products = make_products(count, seed=2, tagged=False, start_id=1)
+    store = InMemoryProductStore(make_products(train_size, seed=1, start_id=1_000_000) + products)
+
+    with tempfile.TemporaryDirectory() as model_directory:
+        model_config = {'n_estimators': trees}
+        tagger = AutoTaggingSystem(config={
+            'model_directory': model_directory,
+            'initial_training_limit': train_size,
+            'company_model': model_config,
+            'category_model': model_config,
+            'tags_model': model_config
+        }, db_connection=store)
+
+        for product in products:
+            tagger.extractor.extract(product)
+
+        durations = []
+        for product in products:
+            start = time.perf_counter()
+            result = tagger.tag_product(product['id'])
+            durations.append((time.perf_counter() - start) * 1000)
+            assert 'error' not in result, result
+
+    durations.sort()
+    print(f"tag_product {count}건 | 평균 {statistics.mean(durations):7.1f}ms | "
+          f"p50 {durations[len(durations) // 2]:7.1f}ms | 최대 {durations[-1]:7.1f}ms")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--train', type=int, default=500)
+    parser.add_argument('--count', type=int, default=50)
+    parser.add_argument('--trees', type=int, default=100)
+    args = parser.parse_args()
+
+    main(args.train, args.count, args.trees)
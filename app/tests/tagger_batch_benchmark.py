@@ -0,0 +1,67 @@
+"""
+자동 태깅 일괄 추론 벤치마크
+
+제품마다 tag_product를 호출하는 기존 방식(batch_tag_products의 이전 구현)과
+tag_products_batch(특성 행렬 1회 추출, 모델별 predict_proba 1회)의 처리량을 비교합니다.
+기존 방식은 느리므로 --sample개만 실행해 전체 소요 시간을 추정합니다.
+
+실행: python -m app.tests.tagger_batch_benchmark [--sizes 1000 10000] [--train 500] [--sample 200]
+"""
+
+import argparse
+import tempfile
+import time
+
+from app.ml.tagger import AutoTaggingSystem
+from app.tests.ml_benchmark_data import InMemoryProductStore, make_products
+
+
+def build_tagger(train_size: int, products: list, model_directory: str) -> AutoTaggingSystem:
+    """
+    합성 학습 데이터로 초기 학습한 태깅 시스템을 만듭니다.
+    """
+    store = InMemoryProductStore(make_products(train_size, seed=1, start_id=1_000_000) + products)
+    config = {
+        'model_directory': model_directory,
+        'initial_training_limit': train_size
+    }
+    return AutoTaggingSystem(config=config, db_connection=store)
+
+
+def main(sizes: list, train_size: int, sample: int):
+    with tempfile.TemporaryDirectory() as model_directory:
+        largest = max(sizes)
+        products = make_products(largest, seed=2, tagged=False)
+
+        start = time.perf_counter()
+        tagger = build_tagger(train_size, products, model_directory)
+        print(f'학습 데이터 {train_size}개, 초기 학습 {time.perf_counter() - start:.1f}s')
+
+        for size in sizes:
+            batch = products[:size]
+
+            # 기존 방식: 제품마다 조회 + 단건 추출 + 모델별 predict/predict_proba
+            count = min(sample, size)
+            start = time.perf_counter()
+            for product in batch[:count]:
+                tagger.tag_product(product['id'])
+            per_product = (time.perf_counter() - start) / count
+            loop_total = per_product * size
+
+            start = time.perf_counter()
+            tagger.tag_products_batch(batch)
+            batch_total = time.perf_counter() - start
+
+            print(f'{size:>6}개 | 제품별 {loop_total:8.2f}s (추정, {count}개 측정 {per_product * 1000:.1f}ms/개) '
+                  f'| 일괄 {batch_total:6.2f}s ({batch_total / size * 1000:.2f}ms/개) '
+                  f'| {loop_total / batch_total:5.1f}배')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--train', type=int, default=500)
+    parser.add_argument('--sample', type=int, default=200)
+    args = parser.parse_args()
+
+    main(args.sizes, args.train, args.sample)
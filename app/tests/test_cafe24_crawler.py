@@ -0,0 +1,125 @@
+import json
+import pytest
+import requests
+from unittest.mock import MagicMock
+
+from app.scripts.cafe24crawler import Cafe24ProductCrawler, Cafe24CallLimiter
+from app.tests.cafe24_mock_server import MockCafe24Server
+
+
+def make_crawler(server, **kwargs):
+    return Cafe24ProductCrawler(mall_id='testmall', access_token='token', base_url=server.base_url, **kwargs)
+
+
+def test_crawl_returns_every_product_once():
+    with MockCafe24Server(product_count=1050, bucket_size=1000, drain_rate=1000) as server:
+        products = make_crawler(server, max_workers=4).crawl()
+
+    product_nos = [p['product_no'] for p in products]
+    assert product_nos == server.product_nos
+
+
+def test_crawl_sparse_product_numbers():
+    # 상품 번호가 띄엄띄엄 존재하면 한 페이지가 다음 구간의 제품까지 포함하게 됨
+    with MockCafe24Server(product_count=420, product_gap=3, bucket_size=1000, drain_rate=1000) as server:
+        products = make_crawler(server, max_workers=3).crawl()
+
+    product_nos = [p['product_no'] for p in products]
+    assert product_nos == server.product_nos
+
+
+@pytest.mark.parametrize('product_gap', [1, 2, 5])
+def test_sparse_numbering_does_not_multiply_requests(product_gap):
+    # 삭제된 상품으로 번호가 비어 있어도 요청 수는 제품 수(20페이지)에 비례해야 함
+    with MockCafe24Server(product_count=2000, product_gap=product_gap, bucket_size=1000, drain_rate=1000) as server:
+        products = make_crawler(server, max_workers=4).crawl()
+        request_count = server.request_count
+
+    assert [p['product_no'] for p in products] == server.product_nos
+    assert request_count <= 2000 // 100 + 8
+
+
+def test_crawl_when_numbering_gets_denser():
+    # 앞쪽은 띄엄띄엄, 뒤쪽은 촘촘하면 넓게 잡은 구간 사이가 비므로 빈 부분을 다시 조회해야 함
+    with MockCafe24Server(product_count=1, bucket_size=1000, drain_rate=1000) as server:
+        server.product_nos = list(range(10, 5000, 10)) + list(range(5000, 5600))
+        products = make_crawler(server, max_workers=4).crawl()
+
+    assert [p['product_no'] for p in products] == server.product_nos
+
+
+def test_crawl_recovers_from_throttling():
+    with MockCafe24Server(product_count=2000, bucket_size=4, drain_rate=100) as server:
+        limiter = Cafe24CallLimiter(threshold=0.75, drain_rate=100, default_backoff=0.05)
+        products = make_crawler(server, max_workers=4, limiter=limiter, max_retries=20).crawl()
+
+    assert len(products) == 2000
+    assert len({p['product_no'] for p in products}) == 2000
+
+
+def test_limiter_reads_call_limit_header():
+    limiter = Cafe24CallLimiter(threshold=0.5, drain_rate=1000)
+
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {'X-Api-Call-Limit': '30/40'}
+    limiter.update(response)
+
+    assert limiter._limit == 40
+    assert limiter._used == pytest.approx(30, abs=1)
+
+
+def test_filtered_pages_follow_product_no_cursor():
+    changed = list(range(50, 20000, 37))
+    with MockCafe24Server(product_count=20000, changed_product_nos=changed, bucket_size=1000, drain_rate=1000) as server:
+        crawler = make_crawler(server)
+        pages = list(crawler.iter_filtered_pages(updated_start_date='2025-01-01T00:00:00+09:00'))
+        request_count = server.request_count
+
+    product_nos = [p['product_no'] for page in pages for p in page]
+    assert product_nos == changed
+    # 전체 카탈로그(200페이지)가 아니라 변경분 페이지만 요청
+    assert request_count == len(changed) // 100 + 1
+
+
+def make_response(status_code, products=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    response.text = json.dumps({'products': products or []})
+    response.json.return_value = {'products': products or []}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+    return response
+
+
+def test_fetch_page_backs_off_on_server_and_connection_errors(monkeypatch):
+    delays = []
+    monkeypatch.setattr('app.scripts.cafe24crawler.time.sleep', delays.append)
+    session = MagicMock()
+    session.get.side_effect = [
+        requests.ConnectionError('reset'),
+        make_response(503),
+        requests.Timeout('stalled'),
+        make_response(200, [{'product_no': 2}])
+    ]
+    crawler = Cafe24ProductCrawler(mall_id='testmall', access_token='token', session=session, timeout=5)
+
+    assert crawler.fetch_page(1) == [{'product_no': 2}]
+    assert delays == [0.5, 1.0, 2.0]
+    assert all(call.kwargs['timeout'] == 5 for call in session.get.call_args_list)
+
+
+def test_fetch_page_raises_after_retries_run_out(monkeypatch):
+    monkeypatch.setattr('app.scripts.cafe24crawler.time.sleep', lambda seconds: None)
+    session = MagicMock()
+    session.get.side_effect = [make_response(500), make_response(502), make_response(503)]
+    crawler = Cafe24ProductCrawler(mall_id='testmall', access_token='token', session=session, max_retries=3)
+
+    with pytest.raises(requests.HTTPError):
+        crawler.fetch_page(1)
+    assert session.get.call_count == 3
+
+    session.get.side_effect = requests.ConnectionError('refused')
+    with pytest.raises(requests.ConnectionError):
+        crawler.fetch_page(1)
@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from app.scripts.cafe24tokenmanager import TokenManager
+
+
+def write_tokens(path, access_token, expires_in):
+    now = datetime.now()
+    path.write_text(json.dumps({
+        'access_token': access_token,
+        'expires_at': (now + expires_in).isoformat(),
+        'refresh_token': 'refresh',
+        'refresh_token_expires_at': (now + timedelta(days=14)).isoformat()
+    }))
+
+
+def refresh_response(counter):
+    def post(url, data, headers):
+        time.sleep(0.1)
+        counter.append(url)
+        response = MagicMock()
+        response.json.return_value = {
+            'access_token': f'token-{len(counter)}',
+            'expires_at': (datetime.now() + timedelta(hours=2)).isoformat(),
+            'refresh_token': 'refresh-new',
+            'refresh_token_expires_at': (datetime.now() + timedelta(days=14)).isoformat()
+        }
+        return response
+    return post
+
+
+def make_token_manager(path):
+    return TokenManager('TEST', code='code', mall_id='testmall', filename=str(path))
+
+
+def test_valid_token_is_returned_without_refresh(tmp_path):
+    path = tmp_path / 'TEST_tokens.json'
+    write_tokens(path, 'cached', timedelta(hours=1))
+    calls = []
+
+    with patch('app.scripts.cafe24tokenmanager.requests.post', side_effect=refresh_response(calls)):
+        assert make_token_manager(path).get_access_token() == 'cached'
+
+    assert calls == []
+
+
+def test_token_is_refreshed_before_expiry(tmp_path):
+    path = tmp_path / 'TEST_tokens.json'
+    write_tokens(path, 'expiring', timedelta(minutes=2))
+    calls = []
+
+    with patch('app.scripts.cafe24tokenmanager.requests.post', side_effect=refresh_response(calls)):
+        assert make_token_manager(path).get_access_token() == 'token-1'
+
+    saved = json.loads(path.read_text())
+    assert saved['access_token'] == 'token-1'
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_concurrent_managers_refresh_once(tmp_path):
+    # 다른 프로세스처럼 토큰 매니저 인스턴스를 따로 만들어 같은 토큰 파일을 공유
+    path = tmp_path / 'TEST_tokens.json'
+    write_tokens(path, 'expired', timedelta(minutes=-1))
+    calls = []
+    results = []
+
+    managers = [make_token_manager(path) for _ in range(4)]
+
+    with patch('app.scripts.cafe24tokenmanager.requests.post', side_effect=refresh_response(calls)):
+        threads = [
+            threading.Thread(target=lambda manager=manager: results.append(manager.get_access_token()))
+            for manager in managers for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(calls) == 1
+    assert results == ['token-1'] * 12
+
+
+def test_for_seller_returns_shared_instance(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(TokenManager, '_instances', {})
+
+    assert TokenManager.for_seller('TEST') is TokenManager.for_seller('TEST')
+    assert TokenManager.for_seller('TEST') is not TokenManager.for_seller('OTHER')
@@ -0,0 +1,64 @@
+import csv
+import io
+import json
+
+from app.database.copystream import CopyStream
+
+
+COLUMNS = ['product_id', 'sale_name', 'tags', 'data']
+
+
+def make_rows(count):
+    for i in range(count):
+        yield {
+            'product_id': i,
+            'sale_name': f'제품 "{i}", 특가\n1+1',
+            'tags': None if i % 2 else '',
+            'data': {'product_no': i, 'name': '쉼표, 따옴표 "'}
+        }
+
+
+def test_copy_stream_reads_in_chunks():
+    stream = CopyStream(make_rows(50), COLUMNS)
+
+    chunks = []
+    while True:
+        chunk = stream.read(64)
+        if not chunk:
+            break
+        assert len(chunk) <= 64
+        chunks.append(chunk)
+
+    rows = list(csv.reader(io.StringIO(''.join(chunks))))
+
+    assert stream.row_count == 50
+    assert len(rows) == 50
+    assert rows[3][0] == '3'
+    assert rows[3][1] == '제품 "3", 특가\n1+1'
+    assert json.loads(rows[3][3]) == {'product_no': 3, 'name': '쉼표, 따옴표 "'}
+
+
+def test_copy_stream_distinguishes_null_and_empty_string():
+    rows = [
+        {'product_id': 1, 'sale_name': 'a', 'tags': '', 'data': {}},
+        {'product_id': 2, 'sale_name': 'b', 'tags': None, 'data': {}}
+    ]
+    lines = CopyStream(rows, COLUMNS).read().splitlines()
+
+    # 빈 문자열은 따옴표로 감싸고, None은 따옴표 없는 빈 값(COPY csv의 NULL)으로 기록
+    assert lines[0] == '1,"a","","{}"'
+    assert lines[1] == '2,"b",,"{}"'
+
+
+def test_copy_stream_pulls_rows_lazily():
+    pulled = []
+
+    def rows():
+        for i in range(1000):
+            pulled.append(i)
+            yield {'product_id': i, 'sale_name': 'a', 'tags': None, 'data': {}}
+
+    stream = CopyStream(rows(), COLUMNS)
+    stream.read(100)
+
+    assert len(pulled) < 20
@@ -0,0 +1,63 @@
+import asyncio
+
+from app.database import databasesetup
+from app.database.databaseconfig import DatabaseConfig
+from app.database.crud.product_crud import ProductCRUD
+
+
+def test_crud_instances_share_one_engine():
+    first = ProductCRUD()
+    second = ProductCRUD()
+
+    assert first.db.engine is second.db.engine
+    assert first.db.SessionLocal is second.db.SessionLocal
+    assert databasesetup.get_engine() is first.db.engine
+
+
+def test_engine_uses_pool_settings(monkeypatch):
+    monkeypatch.setattr(DatabaseConfig, 'PG_POOL_SIZE', 3)
+    monkeypatch.setattr(DatabaseConfig, 'PG_MAX_OVERFLOW', 2)
+    monkeypatch.setattr(DatabaseConfig, 'PG_POOL_RECYCLE', 600)
+    monkeypatch.setattr(DatabaseConfig, 'PG_POOL_PRE_PING', True)
+
+    databasesetup.dispose_engine()
+    try:
+        engine = databasesetup.get_engine()
+
+        assert engine.pool.size() == 3
+        assert engine.pool._max_overflow == 2
+        assert engine.pool._recycle == 600
+        assert engine.pool._pre_ping is True
+
+        status = databasesetup.get_pool_status()
+        assert status['initialized'] is True
+        assert status['size'] == 3
+        assert status['checked_out'] == 0
+    finally:
+        databasesetup.dispose_engine()
+
+
+def test_async_engine_is_shared_and_uses_asyncpg():
+    try:
+        engine = databasesetup.get_async_engine()
+
+        assert engine.dialect.driver == 'asyncpg'
+        assert databasesetup.get_async_engine() is engine
+        assert engine.pool.size() == DatabaseConfig.PG_POOL_SIZE
+    finally:
+        asyncio.run(databasesetup.dispose_async_engine())
+
+
+def test_bot_close_disposes_engines():
+    from app.bot.bot import ManagementBot
+    import discord
+
+    async def run():
+        databasesetup.get_engine()
+        databasesetup.get_async_engine()
+        bot = ManagementBot(command_prefix=';;', intents=discord.Intents.none())
+        await bot.close()
+
+    asyncio.run(run())
+    assert databasesetup._async_engine is None
+    assert databasesetup.get_pool_status()['initialized'] is False
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.utils.executor import BlockingTaskRunner, RunnerBusyError
+from app.utils.looplag import LoopLagMonitor
+
+
+def test_runner_executes_off_loop_thread():
+    runner = BlockingTaskRunner('test', max_workers=1, max_pending=2)
+
+    async def main():
+        return await runner.run(lambda value: (value, threading.current_thread().name), 3)
+
+    try:
+        value, thread_name = asyncio.run(main())
+    finally:
+        runner.shutdown()
+
+    assert value == 3
+    assert thread_name.startswith('test')
+    assert runner.pending == 0
+
+
+def test_runner_rejects_when_queue_full():
+    runner = BlockingTaskRunner('test', max_workers=1, max_pending=2)
+    release = threading.Event()
+
+    async def main():
+        tasks = [asyncio.create_task(runner.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(RunnerBusyError):
+            await runner.run(release.wait)
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    try:
+        asyncio.run(main())
+    finally:
+        runner.shutdown()
+
+    assert runner.pending == 0
+
+
+def test_loop_lag_monitor_records_blocking_call():
+    async def main():
+        monitor = LoopLagMonitor(interval=0.01).start()
+        await asyncio.sleep(0.05)
+        time.sleep(0.2)
+        await asyncio.sleep(0.05)
+        monitor.stop()
+        return monitor.stats()
+
+    stats = asyncio.run(main())
+
+    assert stats['count'] > 0
+    assert stats['max_ms'] >= 150
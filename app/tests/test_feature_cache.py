@@ -0,0 +1,77 @@
+from app.ml.extractors.cache import FeatureCache
+from app.ml.extractors.combined import CombinedExtractor
+from app.tests.ml_benchmark_data import make_products
+
+
+def make_extractor(**cache_config):
+    extractor = CombinedExtractor({'cache': cache_config})
+    extractor.fit(make_products(50, seed=1))
+    return extractor
+
+
+def test_unchanged_product_hits_cache():
+    extractor = make_extractor()
+    product = make_products(1, seed=3)[0]
+
+    first = extractor.extract(product)
+    second = extractor.extract(dict(product, id=999, updated_at=None))
+
+    assert second is first
+    assert extractor.cache.stats()['hits'] == 1
+
+    changed = extractor.extract(dict(product, sale_name=product['sale_name'] + ' 신제품'))
+    assert changed is not first
+
+
+def test_refit_invalidates_cache():
+    extractor = make_extractor()
+    product = make_products(1, seed=3)[0]
+    extractor.extract(product)
+    old_version = extractor.version
+
+    extractor.fit(make_products(80, seed=4))
+
+    assert extractor.version != old_version
+    assert len(extractor.cache) == 0
+
+
+def test_same_training_state_keeps_version():
+    assert make_extractor().version == make_extractor().version
+
+
+def test_lru_eviction():
+    cache = FeatureCache(max_entries=2)
+    cache.put('v', 'a', {'n': 1})
+    cache.put('v', 'b', {'n': 2})
+    cache.get('v', 'a')
+    cache.put('v', 'c', {'n': 3})
+
+    assert cache.get('v', 'b') is None
+    assert cache.get('v', 'a') == {'n': 1}
+
+
+def test_disk_cache_survives_new_instance(tmp_path):
+    product = make_products(1, seed=3)[0]
+    extractor = make_extractor(directory=str(tmp_path))
+    expected = extractor.extract(product)
+
+    reloaded = make_extractor(directory=str(tmp_path))
+    features = reloaded.extract(product)
+
+    assert reloaded.cache.stats() == {'entries': 1, 'hits': 1, 'misses': 0}
+    assert (features['text']['text_features'] != expected['text']['text_features']).nnz == 0
+    assert features['structural'] == expected['structural']
+    assert list(tmp_path.glob('*/*/*.npz'))
+
+
+def test_refit_keeps_other_versions_on_disk(tmp_path):
+    # 교체 전 번들이 같은 디렉토리를 쓰고 있을 수 있으므로 디스크 캐시는 명시적으로 요청할 때만 삭제
+    old = make_extractor(directory=str(tmp_path))
+    old.extract(make_products(1, seed=3)[0])
+
+    new = make_extractor(directory=str(tmp_path))
+    new.fit(make_products(80, seed=4))
+    assert (tmp_path / old.version).is_dir()
+
+    new.cache.invalidate(keep_version=new.version, remove_files=True)
+    assert not (tmp_path / old.version).exists()
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from app.ml.feedback import FeedbackSystem
+from app.tests.ml_benchmark_data import InMemoryProductStore, make_products
+
+
+def record(feedback_system, product_id):
+    return feedback_system.record_feedback(
+        product_id,
+        {'company': '예측', 'category': '액상', 'tags': ''},
+        {'company': '수정', 'category': '액상', 'tags': ''},
+        user_id='tester',
+        model_version='v1'
+    )
+
+
+def test_feedback_since_watermark():
+    store = InMemoryProductStore(make_products(3))
+    feedback_system = FeedbackSystem(store)
+
+    assert record(feedback_system, 1)
+    watermark = datetime.utcnow()
+    store.feedback[0]['timestamp'] = watermark - timedelta(seconds=1)
+    assert record(feedback_system, 2)
+
+    assert feedback_system.count_feedback() == 2
+    assert feedback_system.count_feedback(since_timestamp=watermark - timedelta(seconds=0.5)) == 1
+    assert [f['product_id'] for f in feedback_system.get_feedback_data(since_timestamp=watermark - timedelta(seconds=0.5))] == [2]
+    assert store.feedback[1]['model_version'] == 'v1'
+
+
+def test_count_does_not_load_feedback_rows():
+    db = MagicMock()
+    db.count_feedback.return_value = 25
+    feedback_system = FeedbackSystem(db)
+
+    assert feedback_system.count_feedback(since_timestamp=datetime(2026, 1, 1)) == 25
+    db.count_feedback.assert_called_once_with(since=datetime(2026, 1, 1))
+    db.get_feedback.assert_not_called()
+
+
+def test_update_training_data_fetches_products_once():
+    store = InMemoryProductStore(make_products(5))
+    store.get_products_by_ids = MagicMock(wraps=store.get_products_by_ids)
+    store.get_product = MagicMock(side_effect=AssertionError('per-row lookup'))
+    feedback_system = FeedbackSystem(store)
+    for product_id in (1, 2, 2, 99):
+        record(feedback_system, product_id)
+
+    samples = feedback_system.update_training_data(feedback_system.get_feedback_data())
+
+    store.get_products_by_ids.assert_called_once()
+    assert [s['sale_name'] for s in samples] == [store.products[i]['sale_name'] for i in (1, 2, 2)]
+    assert all(s['company'] == '수정' for s in samples)
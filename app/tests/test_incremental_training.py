@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from app.ml.tagger import AutoTaggingSystem
+from app.tests.ml_benchmark_data import InMemoryProductStore, make_products
+
+
+def make_tagger(tmp_path, **config):
+    store = InMemoryProductStore(make_products(150, seed=1))
+    config = dict({
+        'model_directory': str(tmp_path),
+        'initial_training_limit': 150,
+        'training_mode': 'incremental',
+        'extractor': {'text': {'vectorizer': 'hashing', 'n_features': 2 ** 12}},
+        'company_model': {'backend': 'sgd'},
+        'category_model': {'backend': 'sgd'},
+        'tags_model': {'backend': 'sgd'}
+    }, **config)
+    return AutoTaggingSystem(config=config, db_connection=store)
+
+
+def give_feedback(tagger, product_id, **corrected):
+    product = tagger.db.products[product_id]
+    tags = {'company': product['company'], 'category': product['category'], 'tags': product['tags']}
+    tags.update(corrected)
+    tagger.feedback_system.record_feedback(product_id, {}, tags)
+
+
+def test_incremental_retrain_keeps_extractor(tmp_path):
+    tagger = make_tagger(tmp_path)
+    extractor_version = tagger.extractor.version
+    model_version = tagger.model_version
+    coef = tagger.models['company'].model.coef_.copy()
+
+    for product_id in range(1, 21):
+        give_feedback(tagger, product_id, company=tagger.db.products[product_id + 1]['company'])
+    tagger._retrain_models()
+
+    assert tagger.extractor.version == extractor_version
+    assert tagger.model_version != model_version
+    assert not np.array_equal(tagger.models['company'].model.coef_, coef)
+    assert 'predictions' in tagger.tag_product(1)
+
+
+def test_new_label_falls_back_to_full_retrain(tmp_path):
+    tagger = make_tagger(tmp_path)
+    give_feedback(tagger, 1, company='새제조사')
+
+    tagger._retrain_models()
+
+    assert '새제조사' in tagger.models['company'].classes_
+
+
+def test_random_forest_cannot_partial_fit(tmp_path):
+    tagger = make_tagger(tmp_path, company_model={'n_estimators': 5}, category_model={'n_estimators': 5},
+                         tags_model={'n_estimators': 5})
+    features = [tagger.extractor.extract(tagger.db.products[1])]
+
+    assert not tagger.models['company'].supports_partial_fit
+    with pytest.raises(ValueError):
+        tagger.models['company'].partial_fit(features, [tagger.db.products[1]['company']])
@@ -0,0 +1,30 @@
+import pytest
+
+from app.ml.bundle import ModelBundle
+from app.ml.models.backends import make_classifier
+from app.ml.training import train_full
+from app.tests.ml_benchmark_data import make_products
+
+
+@pytest.mark.parametrize('backend', ['sgd', 'logistic_regression'])
+def test_linear_backend_predicts_and_round_trips(tmp_path, backend):
+    model_config = {'backend': backend}
+    bundle = train_full({'company_model': model_config, 'category_model': model_config,
+                         'tags_model': model_config}, make_products(200, seed=1))
+    bundle.save(str(tmp_path))
+    loaded = ModelBundle.load(str(tmp_path), {})
+
+    product = make_products(1, seed=5)[0]
+    features = loaded.extractor.extract(product)
+
+    assert loaded.models['company'].predict(features) == product['company']
+    assert loaded.models['category'].predict(features) == product['category']
+    assert isinstance(loaded.models['tags'].predict(features, product['category']), str)
+    assert loaded.models['company'].get_feature_importance()
+    # OneVsRestClassifier에도 partial_fit이 있지만 증분 학습은 sgd만 지원
+    assert loaded.models['tags'].supports_partial_fit == (backend == 'sgd')
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        make_classifier({'backend': 'svm'})
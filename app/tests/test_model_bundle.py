@@ -0,0 +1,107 @@
+import os
+import json
+
+import pytest
+
+from app.ml import serialization
+from app.ml.bundle import ModelBundle, BundleStore, CURRENT_FILE, MANIFEST_FILE
+from app.ml.tagger import AutoTaggingSystem
+from app.tests.bundle_load_benchmark import save_pickle
+from app.tests.ml_benchmark_data import InMemoryProductStore, make_products
+
+SMALL_FOREST = {'n_estimators': 5}
+
+
+def make_config(tmp_path, **config):
+    return dict({
+        'model_directory': str(tmp_path),
+        'initial_training_limit': 100,
+        'retraining_limit': 100,
+        'feedback_threshold': 2,
+        'company_model': SMALL_FOREST,
+        'category_model': SMALL_FOREST,
+        'tags_model': SMALL_FOREST
+    }, **config)
+
+
+def test_background_retrain_swaps_bundle(tmp_path):
+    store = InMemoryProductStore(make_products(100, seed=1))
+    tagger = AutoTaggingSystem(config=make_config(tmp_path), db_connection=store)
+    old_bundle = tagger.bundle
+    old_company_model = old_bundle.models['company']
+
+    for product_id in (1, 2):
+        product = store.products[product_id]
+        tagger.process_feedback(product_id, {'company': product['company'], 'category': product['category'],
+                                             'tags': product['tags']})
+    version = tagger._training_future.result(timeout=300)
+
+    assert tagger.model_version == version != old_bundle.version
+    assert tagger.bundle is not old_bundle
+    assert old_bundle.models['company'] is old_company_model
+    with open(os.path.join(str(tmp_path), CURRENT_FILE)) as f:
+        assert f.read() == version
+
+    restarted = AutoTaggingSystem(config=make_config(tmp_path), db_connection=store)
+    assert restarted.model_version == version
+    assert restarted.config['last_model_update'] == tagger.bundle.trained_at
+
+
+def test_loads_legacy_model_directory(tmp_path):
+    store = InMemoryProductStore(make_products(100, seed=1))
+    bundle = AutoTaggingSystem(config=make_config(tmp_path / 'new'), db_connection=store).bundle
+    save_pickle(bundle, str(tmp_path / 'legacy'))
+    os.remove(str(tmp_path / 'legacy' / 'bundle.json'))
+
+    loaded = BundleStore(str(tmp_path / 'legacy')).load_current(make_config(tmp_path / 'legacy'))
+
+    assert loaded.version == 'legacy'
+    assert loaded.models['company'].classes_ == bundle.models['company'].classes_
+
+
+def test_manifest_bundle_round_trip(tmp_path):
+    store = InMemoryProductStore(make_products(100, seed=1))
+    bundle = AutoTaggingSystem(config=make_config(tmp_path / 'models'), db_connection=store).bundle
+    bundle.save(str(tmp_path / 'bundle'))
+
+    assert not any(name.endswith('.pkl') for _, _, names in os.walk(str(tmp_path / 'bundle')) for name in names)
+
+    loaded = ModelBundle.load(str(tmp_path / 'bundle'), {})
+    assert loaded.version == bundle.version
+    assert loaded.extractor.version == bundle.extractor.version
+
+    for product in make_products(10, seed=7):
+        expected = bundle.extractor.extract(product)
+        features = loaded.extractor.extract(product)
+        for name, model in bundle.models.items():
+            assert repr(loaded.models[name].predict(features)) == repr(model.predict(expected))
+
+
+def test_manifest_checksum_mismatch_is_rejected(tmp_path):
+    store = InMemoryProductStore(make_products(100, seed=1))
+    bundle = AutoTaggingSystem(config=make_config(tmp_path / 'models'), db_connection=store).bundle
+    bundle.save(str(tmp_path / 'bundle'))
+
+    with open(str(tmp_path / 'bundle' / MANIFEST_FILE)) as f:
+        name = next(iter(json.load(f)['files']))
+    with open(str(tmp_path / 'bundle' / name), 'ab') as f:
+        f.write(b'\0')
+
+    with pytest.raises(ValueError):
+        ModelBundle.load(str(tmp_path / 'bundle'), {})
+
+
+def test_serialization_rejects_disallowed_classes(tmp_path):
+    with pytest.raises(ValueError):
+        serialization.save_objects({'value': object()}, str(tmp_path))
+
+    with open(str(tmp_path / serialization.OBJECTS_FILE), 'w') as f:
+        json.dump({'value': {'__object__': 'os:system', 'new': False, 'args': ['true'], 'state': None}}, f)
+    with pytest.raises(ValueError):
+        serialization.load_objects(str(tmp_path))
+
+    # scikit-learn 클래스라도 번들에 들어가지 않는 클래스는 거부
+    with open(str(tmp_path / serialization.OBJECTS_FILE), 'w') as f:
+        json.dump({'value': {'__object__': 'sklearn.pipeline:Pipeline', 'new': False, 'args': [[]], 'state': None}}, f)
+    with pytest.raises(ValueError):
+        serialization.load_objects(str(tmp_path))
@@ -0,0 +1,48 @@
+import bcrypt
+import json
+import pytest
+
+from app.scripts.naverdatamanager import NaverDataManager
+from app.scripts.naverfetcher import NaverProductDetailFetcher
+from app.tests.naver_mock_server import MockNaverServer
+
+
+@pytest.fixture
+def naver_credentials(monkeypatch):
+    monkeypatch.setenv('TEST_NAVER_CLIENT_ID', 'client-id')
+    monkeypatch.setenv('TEST_NAVER_CLIENT_SECRET', bcrypt.gensalt(rounds=4).decode('utf-8'))
+
+
+def test_get_product_data_uses_one_token(naver_credentials):
+    product_nos = list(range(1000, 1050))
+
+    with MockNaverServer() as server:
+        naver = NaverDataManager(api_url=server.api_url)
+        product_data = naver.get_product_data(product_nos, config_prefix='TEST', max_workers=4)
+
+    assert server.token_count == 1
+    assert server.detail_count == len(product_nos)
+    # 입력 순서 유지
+    assert [json.loads(data)['smartstoreChannelProduct']['channelProductNo'] for data in product_data] == product_nos
+
+
+def test_fetcher_retries_transient_errors():
+    with MockNaverServer(fail_every=5, fail_status=503) as server:
+        fetcher = NaverProductDetailFetcher('token', base_url=f'{server.api_url}/products/',
+                                            max_workers=2, backoff_factor=0)
+        product_data = fetcher.fetch_all(list(range(1, 21)))
+
+    assert len(product_data) == 20
+    assert server.failed_count > 0
+    assert server.detail_count == 20 + server.failed_count
+
+
+def test_fetcher_retries_rate_limit_then_gives_up():
+    with MockNaverServer(fail_every=1, fail_status=429) as server:
+        fetcher = NaverProductDetailFetcher('token', base_url=f'{server.api_url}/products/',
+                                            max_workers=1, max_retries=2, backoff_factor=0)
+        with pytest.raises(Exception):
+            fetcher.fetch(1)
+
+    # 최초 요청 1회 + 재시도 2회
+    assert server.detail_count == 3
@@ -0,0 +1,63 @@
+import bcrypt
+import pytest
+import threading
+import time
+
+from app.scripts.navertokenmanager import NaverTokenManager, REFRESH_MARGIN
+from app.tests.naver_mock_server import MockNaverServer
+
+
+@pytest.fixture(autouse=True)
+def naver_credentials(monkeypatch):
+    monkeypatch.setenv('TEST_NAVER_CLIENT_ID', 'client-id')
+    monkeypatch.setenv('TEST_NAVER_CLIENT_SECRET', bcrypt.gensalt(rounds=4).decode('utf-8'))
+    NaverTokenManager.clear_cache()
+    yield
+    NaverTokenManager.clear_cache()
+
+
+def make_token_manager(server):
+    return NaverTokenManager('TEST', token_url=f'{server.api_url}/oauth2/token')
+
+
+def test_token_is_cached_across_instances():
+    with MockNaverServer() as server:
+        tokens = [make_token_manager(server).get_access_token() for _ in range(5)]
+
+    assert tokens == ['token-1'] * 5
+    assert server.token_count == 1
+
+
+def test_concurrent_requests_share_one_refresh():
+    results = []
+
+    with MockNaverServer(token_latency=0.2) as server:
+        def worker():
+            results.append(make_token_manager(server).get_access_token())
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert results == ['token-1'] * 10
+    assert server.token_count == 1
+
+
+def test_token_near_expiry_is_refreshed_in_background():
+    with MockNaverServer(token_latency=0.2, expires_in=REFRESH_MARGIN - 60) as server:
+        token = make_token_manager(server)
+        assert token.get_access_token() == 'token-1'
+
+        # 만료 전이면 재발급을 기다리지 않고 기존 토큰을 반환
+        start = time.perf_counter()
+        assert token.get_access_token() == 'token-1'
+        assert time.perf_counter() - start < 0.1
+
+        deadline = time.monotonic() + 5
+        while server.token_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        time.sleep(0.1)
+
+        assert token.get_access_token() == 'token-2'
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock, patch
+
+from app.scripts.productpipeline import ProductIngestPipeline
+
+
+def normalize(products, seller_id):
+    return [{'product_id': p['product_no'], 'seller_id': seller_id} for p in products]
+
+
+def upsert_with_known_ids(known_ids, events=None):
+    def upsert(rows, batch_size, update_existing):
+        if events is not None:
+            events.append('write')
+        updated = sum(1 for row in rows if row['product_id'] in known_ids) if update_existing else 0
+        inserted = sum(1 for row in rows if row['product_id'] not in known_ids)
+        return {'inserted': inserted, 'updated': updated}
+    return upsert
+
+
+def test_pipeline_writes_each_page_before_fetching_the_next():
+    events = []
+
+    def pages():
+        for page_no in range(3):
+            events.append(f'fetch {page_no}')
+            yield [{'product_no': page_no * 10 + i} for i in range(10)]
+
+    mock_crud = MagicMock()
+    mock_crud.bulk_upsert_products.side_effect = upsert_with_known_ids({0, 1, 25}, events)
+
+    with patch('app.scripts.productpipeline.crud', mock_crud):
+        pipeline = ProductIngestPipeline('SELLER', normalize=normalize)
+        stats = pipeline.run(pages())
+
+    assert events == ['fetch 0', 'write', 'fetch 1', 'write', 'fetch 2', 'write']
+    assert stats == {'pages': 3, 'inserted': 27, 'updated': 3}
+
+
+def test_pipeline_passes_update_flag_and_skips_empty_pages():
+    mock_crud = MagicMock()
+    mock_crud.bulk_upsert_products.side_effect = upsert_with_known_ids({1})
+
+    with patch('app.scripts.productpipeline.crud', mock_crud):
+        pipeline = ProductIngestPipeline('SELLER', normalize=normalize, update_existing=False, batch_size=500)
+        stats = pipeline.run([[{'product_no': 1}, {'product_no': 2}], []])
+
+    mock_crud.bulk_upsert_products.assert_called_once_with(
+        [{'product_id': 1, 'seller_id': 'SELLER'}, {'product_id': 2, 'seller_id': 'SELLER'}],
+        batch_size=500,
+        update_existing=False
+    )
+    assert stats == {'pages': 1, 'inserted': 1, 'updated': 0}
+
+
+def test_backfill_streams_all_pages_into_one_copy():
+    events = []
+
+    def pages():
+        for page_no in range(3):
+            events.append(f'fetch {page_no}')
+            yield [{'product_no': page_no * 10 + i} for i in range(10)]
+
+    def backfill(rows, update_existing):
+        # COPY가 행을 읽는 시점에 페이지를 가져와야 함
+        assert events == []
+        product_ids = [row['product_id'] for row in rows]
+        return {'copied': len(product_ids), 'inserted': len(product_ids) - 2, 'updated': 2}
+
+    mock_crud = MagicMock()
+    mock_crud.backfill_products.side_effect = backfill
+
+    with patch('app.scripts.productpipeline.crud', mock_crud):
+        stats = ProductIngestPipeline('SELLER', normalize=normalize).backfill(pages())
+
+    mock_crud.bulk_upsert_products.assert_not_called()
+    assert events == ['fetch 0', 'fetch 1', 'fetch 2']
+    assert stats == {'pages': 3, 'inserted': 28, 'updated': 2}
@@ -0,0 +1,143 @@
+import pytest
+from scipy import sparse
+
+from app.ml.tagger import AutoTaggingSystem
+from app.tests.ml_benchmark_data import InMemoryProductStore, make_products
+
+
+@pytest.fixture(scope='module')
+def tagger(tmp_path_factory):
+    products = make_products(150, seed=1) + make_products(30, seed=2, tagged=False, start_id=1000)
+    small_forest = {'n_estimators': 10}
+    config = {
+        'model_directory': str(tmp_path_factory.mktemp('models')),
+        'initial_training_limit': 150,
+        'company_model': small_forest,
+        'category_model': small_forest,
+        'tags_model': small_forest
+    }
+    return AutoTaggingSystem(config=config, db_connection=InMemoryProductStore(products))
+
+
+def test_batch_matches_single_product_tagging(tagger):
+    untagged = tagger.db.get_untagged_products(limit=30)
+
+    batch_results = tagger.tag_products_batch(untagged)
+
+    assert [r['product_id'] for r in batch_results] == [p['id'] for p in untagged]
+    for result in batch_results:
+        single = tagger.tag_product(result['product_id'])
+        assert result['predictions'] == single['predictions']
+        assert result['confidence_scores'] == pytest.approx(single['confidence_scores'])
+
+
+def test_batch_tag_products_updates_store(tagger):
+    result = tagger.batch_tag_products(limit=5)
+
+    assert result['total'] == 5
+    assert result['successful'] == 5
+    for item in result['products']:
+        product = tagger.db.products[item['id']]
+        assert product['category'] == item['tags']['category']
+        assert product['company'] == item['tags']['company']
+
+
+def test_batch_of_nothing_returns_empty(tagger):
+    assert tagger.tag_products_batch([]) == []
+
+
+def test_features_stay_sparse(tagger):
+    products = tagger.db.get_tagged_products(limit=10)
+
+    X = tagger.extractor.extract_matrix(products)
+    row = tagger.models['company']._preprocess_features(tagger.extractor.extract(products[0]))
+
+    assert sparse.isspmatrix_csr(X)
+    assert sparse.isspmatrix_csr(row)
+    assert (X[0] != row).nnz == 0
+
+
+def test_feature_names_are_kept_on_extractor(tagger):
+    product = tagger.db.get_tagged_products(limit=1)[0]
+    names = tagger.extractor.get_text_feature_names()
+
+    assert 'text_feature_names' not in tagger.extractor.extract(product)['text']
+    assert names == tagger.extractor.text_extractor.vectorizer.get_feature_names_out().tolist()
+    assert tagger.models['company'].feature_names_[:len(names)] == names
+
+
+def test_feedback_uses_prediction_recorded_at_tag_time(tagger, monkeypatch):
+    product_id = tagger.db.get_untagged_products(limit=1)[0]['id']
+    tagged = tagger.tag_product(product_id)
+    record = tagger.db.get_latest_tag_prediction(product_id)
+    assert record['predictions'] == tagged['predictions']
+    assert record['model_version'] == tagger.model_version
+
+    # 피드백 처리 시 다시 예측하지 않아야 함
+    monkeypatch.setattr(tagger.extractor, 'extract', lambda product: pytest.fail('re-predicted on feedback'))
+    corrected = dict(tagged['predictions'], company='수정제조사')
+    result = tagger.process_feedback(product_id, corrected, user_id='tester')
+
+    assert result['status'] == 'success'
+    feedback = tagger.db.feedback[-1]
+    assert feedback['original_tags'] == tagged['predictions']
+    assert feedback['model_version'] == record['model_version']
+
+
+def test_tag_product_runs_each_classifier_once(tagger, monkeypatch):
+    forest_class = type(tagger.models['company'].model)
+    calls = []
+    original = forest_class.predict_proba
+    monkeypatch.setattr(forest_class, 'predict_proba', lambda self, X: calls.append(self) or original(self, X))
+    monkeypatch.setattr(forest_class, 'predict', lambda self, X: pytest.fail('레이블은 확률에서 도출해야 함'))
+
+    result = tagger.tag_product(1000)
+
+    tag_forests = list(tagger.models['tags'].model.estimators_)
+    assert 'error' not in result
+    assert calls == [tagger.models['company'].model, tagger.models['category'].model] + tag_forests
+
+
+def test_tag_thresholds_select_tags(tagger, monkeypatch):
+    tags_model = tagger.models['tags']
+    features = tagger.extractor.extract(tagger.db.products[1000])
+    _, probs = tags_model.predict_with_confidence(features)
+
+    first_tag, *other_tags = probs
+    monkeypatch.setitem(tags_model.config, 'threshold', -1.0)
+    monkeypatch.setitem(tags_model.config, 'tag_thresholds', {tag: 1.0 for tag in other_tags})
+
+    assert tags_model.predict(features) == first_tag
+
+
+def test_batch_tag_products_fails_only_bad_rows(tagger, monkeypatch):
+    good = [dict(p) for p in make_products(2, seed=3, tagged=False, start_id=2000)]
+    bad = dict(make_products(1, seed=4, tagged=False, start_id=3000)[0], data=None)
+    for product in good + [bad]:
+        monkeypatch.setitem(tagger.db.products, product['id'], product)
+    monkeypatch.setattr(tagger.db, 'get_untagged_products', lambda limit: [good[0], bad, good[1]])
+
+    result = tagger.batch_tag_products(limit=3)
+
+    assert (result['successful'], result['failed']) == (2, 1)
+    status = {item['id']: item['status'] for item in result['products']}
+    assert status == {2000: 'success', 3000: 'failed', 2001: 'success'}
+
+
+def test_batch_tag_products_records_predictions_in_one_call(tagger, monkeypatch):
+    calls = []
+    save_tag_predictions = tagger.db.save_tag_predictions
+    monkeypatch.setattr(tagger.db, 'save_tag_predictions', lambda records: calls.append(records) or save_tag_predictions(records))
+    monkeypatch.setattr(tagger.db, 'save_tag_prediction', lambda *args: pytest.fail('예측 기록은 한 번에 저장해야 함'))
+
+    recorded = len(tagger.db.predictions)
+
+    result = tagger.batch_tag_products(limit=3)
+
+    assert len(calls) == 1
+    assert len(tagger.db.predictions) == recorded + 3
+    assert [record['product_id'] for record in calls[0]] == [item['id'] for item in result['products']]
+    for item in result['products']:
+        record = tagger.db.get_latest_tag_prediction(item['id'])
+        assert record['predictions'] == item['tags']
+        assert record['model_version'] == tagger.model_version
@@ -0,0 +1,47 @@
+import sys
+import subprocess
+
+import pytest
+
+from app.ml.service import TaggerService, TaggerNotReadyError
+from app.tests.ml_benchmark_data import InMemoryProductStore, make_products
+
+SMALL_FOREST = {'n_estimators': 5}
+
+
+def test_importing_service_does_not_import_sklearn():
+    code = "import sys, app.ml, app.ml.service; print('sklearn' in sys.modules)"
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+    assert output.strip() == 'False'
+
+
+def test_tagger_is_available_after_load(tmp_path):
+    store = InMemoryProductStore(make_products(100, seed=1))
+    service = TaggerService(config={
+        'model_directory': str(tmp_path),
+        'initial_training_limit': 100,
+        'company_model': SMALL_FOREST,
+        'category_model': SMALL_FOREST,
+        'tags_model': SMALL_FOREST
+    }, db_connection=store)
+
+    assert not service.is_ready
+    with pytest.raises(TaggerNotReadyError):
+        service.tagger
+
+    tagger = service.load()
+
+    assert service.is_ready
+    assert service.tagger is tagger
+    assert service.load() is tagger
+    assert 'predictions' in tagger.tag_product(1)
+
+
+def test_failed_load_can_be_retried(tmp_path):
+    service = TaggerService(config={'model_directory': str(tmp_path)}, db_connection=None)
+
+    with pytest.raises(ValueError):
+        service.load()
+
+    assert not service.is_ready
+    assert isinstance(service.last_error, ValueError)
@@ -0,0 +1,78 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+
+class RunnerBusyError(RuntimeError):
+    """
+    작업 대기열이 가득 차 새 작업을 받을 수 없을 때 발생하는 예외입니다.
+    """
+
+
+class BlockingTaskRunner:
+    """
+    블로킹 함수(모델 추론/학습, 동기 DB/HTTP 호출)를 전용 스레드 풀에서 실행하는 클래스입니다.
+    이벤트 루프에서는 await runner.run(func, *args)로 호출하며, 실행 중이거나 대기 중인 작업이
+    max_pending개를 넘으면 대기열에 쌓지 않고 RunnerBusyError를 발생시킵니다.
+
+    사용 예:
+        result = await ml_runner.run(tagger.batch_tag_products, limit=100)
+    """
+
+    def __init__(self, name: str, max_workers: int, max_pending: int):
+        """
+        Args:
+            name (str): 스레드 이름 접두사 (로그/스레드 덤프에서 구분용)
+            max_workers (int): 동시에 실행할 작업 수
+            max_pending (int): 실행 중인 작업을 포함해 받아둘 최대 작업 수
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = None
+        # 이벤트 루프 스레드에서만 변경하므로 잠금이 필요 없음
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """
+        실행 중이거나 대기 중인 작업 수
+        """
+        return self._pending
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+        return self._executor
+
+    async def run(self, func, *args, **kwargs):
+        """
+        함수를 스레드 풀에서 실행하고 결과를 반환합니다.
+
+        Raises:
+            RunnerBusyError: 대기열이 가득 찬 경우
+        """
+        if self._pending >= self.max_pending:
+            raise RunnerBusyError(f'{self.name} 작업 대기열이 가득 찼습니다. ({self._pending}/{self.max_pending})')
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+        finally:
+            self._pending -= 1
+
+    def shutdown(self, wait: bool = True):
+        """
+        스레드 풀을 종료합니다.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+# 태깅 모델 추론/학습용 (모델 교체와 추론이 겹치지 않도록 한 번에 하나씩 실행)
+ml_runner = BlockingTaskRunner('ml', max_workers=1, max_pending=8)
+
+# 제품 수집 파이프라인, 동기 CRUD 호출용
+io_runner = BlockingTaskRunner('io', max_workers=4, max_pending=16)
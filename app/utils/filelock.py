@@ -0,0 +1,67 @@
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """
+    여러 프로세스가 같은 파일을 수정할 때 사용하는 배타적 파일 잠금 클래스입니다.
+    {path}.lock 파일을 잠그며, 유닉스에서는 fcntl.flock, 윈도우에서는 msvcrt.locking을 사용합니다.
+
+    사용 예:
+        with FileLock('SELLER_tokens.json'):
+            ...
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): 보호할 파일 경로
+        """
+        self.lock_path = f'{path}.lock'
+        self._fd = None
+
+    def acquire(self):
+        """
+        잠금을 얻을 때까지 대기합니다.
+        """
+        self._fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        if fcntl:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        else:
+            # LK_LOCK은 약 10초 동안 재시도한 뒤 실패하므로 잠금을 얻을 때까지 반복
+            while True:
+                try:
+                    msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+
+    def release(self):
+        """
+        잠금을 해제합니다.
+        """
+        if self._fd is None:
+            return
+
+        try:
+            if fcntl:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
@@ -0,0 +1,39 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 재시도할 응답 상태 코드 (호출 제한, 일시적 서버 오류)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session(pool_maxsize: int = 10, headers: dict = None, retries: int = 0,
+                   backoff_factor: float = 0.5) -> requests.Session:
+    """
+    커넥션 풀을 재사용하는 requests 세션을 생성합니다.
+    Args:
+        pool_maxsize (int): 호스트당 유지할 최대 커넥션 수
+        headers (dict): 세션 기본 헤더
+        retries (int): 429/5xx 응답 및 연결 오류 시 GET 요청 재시도 횟수 (0이면 재시도 안 함)
+        backoff_factor (float): 재시도 간 지수 백오프 계수 (backoff_factor * 2^(재시도 횟수 - 1)초)
+    Returns:
+        session (requests.Session): keep-alive 세션
+    """
+    session = requests.Session()
+
+    max_retries = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    ) if retries else 0
+
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=max_retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    if headers:
+        session.headers.update(headers)
+
+    return session
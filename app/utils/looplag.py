@@ -0,0 +1,80 @@
+import asyncio
+import time
+from collections import deque
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 지연(heartbeat latency)을 측정하는 클래스입니다.
+    interval마다 깨어나도록 sleep한 뒤 실제로 깨어난 시각과의 차이를 지연으로 기록합니다.
+    루프를 막는 블로킹 호출이 있으면 그 시간만큼 지연이 커집니다.
+
+    사용 예:
+        monitor = LoopLagMonitor()
+        monitor.start()
+        ...
+        monitor.stats()
+    """
+
+    def __init__(self, interval: float = 0.1, window: int = 600):
+        """
+        Args:
+            interval (float): 측정 간격(초)
+            window (int): 통계에 사용할 최근 측정값 개수
+        """
+        self.interval = interval
+        self.samples = deque(maxlen=window)
+        self.max_lag = 0.0
+        self._task = None
+
+    def start(self):
+        """
+        현재 이벤트 루프에서 측정을 시작합니다.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def stop(self):
+        """
+        측정을 중지합니다.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def reset(self):
+        """
+        측정값을 초기화합니다.
+        """
+        self.samples.clear()
+        self.max_lag = 0.0
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - expected)
+            self.samples.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+    def stats(self) -> dict:
+        """
+        최근 측정값 기준 지연 통계를 밀리초 단위로 반환합니다.
+            Returns: 측정 횟수, 평균/p99/최대(최근 구간) 지연과 시작 이후 최대 지연
+        """
+        if not self.samples:
+            return {'count': 0, 'avg_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0, 'max_total_ms': self.max_lag * 1000}
+
+        ordered = sorted(self.samples)
+        return {
+            'count': len(ordered),
+            'avg_ms': sum(ordered) / len(ordered) * 1000,
+            'p99_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+            'max_ms': ordered[-1] * 1000,
+            'max_total_ms': self.max_lag * 1000,
+        }
+
+
+# 봇 이벤트 루프 지연 모니터
+loop_monitor = LoopLagMonitor()